@@ -1,19 +1,37 @@
 """ETL module for banking transactions processing."""
 
-from etl.loader import load_csv, CSVEmptyRowError, CSVColumnMismatchError, CSVMissingMandatoryFieldError, CSVFileNotFoundError
-from etl.validator import validate_transaction, InvalidTransactionIDError, InvalidDateFormatError, InvalidCurrencyError, InvalidAmountError
+from etl.loader import load_csv, iter_csv, load_csv_batches, aload_csv, iter_csv_with_offsets, iter_csv_mmap, load_csv_parallel, iter_csv_parallel, load_csv_columnar, CategoricalColumn, RowFilter, QuarantinePolicy, count_rows, csv_file_stats, sample_csv, CSVEmptyRowError, CSVColumnMismatchError, CSVMissingMandatoryFieldError, CSVFileNotFoundError, CSVErrorRateExceededError
+from etl.validator import validate_transaction, validate_batch, InvalidTransactionIDError, InvalidDateFormatError, InvalidCurrencyError, InvalidAmountError
 from etl.cleaner import clean_transaction
 from etl.transformer import transform_transaction
+from etl.record import Transaction
 
 __all__ = [
     'load_csv',
+    'iter_csv',
+    'load_csv_batches',
+    'aload_csv',
+    'iter_csv_with_offsets',
+    'iter_csv_mmap',
+    'load_csv_parallel',
+    'iter_csv_parallel',
+    'load_csv_columnar',
+    'CategoricalColumn',
+    'RowFilter',
+    'QuarantinePolicy',
+    'count_rows',
+    'csv_file_stats',
+    'sample_csv',
     'validate_transaction',
+    'validate_batch',
     'clean_transaction',
     'transform_transaction',
+    'Transaction',
     'CSVEmptyRowError',
     'CSVColumnMismatchError',
     'CSVMissingMandatoryFieldError',
     'CSVFileNotFoundError',
+    'CSVErrorRateExceededError',
     'InvalidTransactionIDError',
     'InvalidDateFormatError',
     'InvalidCurrencyError',
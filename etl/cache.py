@@ -0,0 +1,206 @@
+"""On-disk cache of parsed CSV files for banking transactions."""
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
+
+from etl.loader import load_csv, _resolve_path
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+CACHE_FORMAT_VERSION = 1
+# Subdirectory of the per-user cache directory ($XDG_CACHE_HOME or ~/.cache)
+CACHE_DIR_NAME = 'etl'
+HASH_BLOCK_SIZE = 4 * 1024 * 1024
+
+
+def file_content_hash(path: str) -> str:
+    """
+    Hash file content with BLAKE2b using large block reads.
+    
+    Args:
+        path: Path to file
+        
+    Returns:
+        Hex digest of file content
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def default_cache_dir() -> Path:
+    """
+    Return the private per-user cache directory.
+    
+    Cache files are pickles, and loading a pickle can run code, so they
+    are kept out of input directories (which other systems write to) and
+    under $XDG_CACHE_HOME/etl or ~/.cache/etl instead.
+    
+    Returns:
+        Path of the default cache directory
+    """
+    base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(base) / CACHE_DIR_NAME
+
+
+def _is_private(path: Path) -> bool:
+    """Check that a file is owned by the current user and not writable by others."""
+    if not hasattr(os, 'getuid'):
+        return True
+    stat = path.stat()
+    return stat.st_uid == os.getuid() and not stat.st_mode & 0o022
+
+
+def _cache_file(file_path: Path, cache_dir: Optional[str], typed: bool) -> Path:
+    """Return the cache file location for a CSV file and load mode."""
+    directory = Path(cache_dir) if cache_dir else default_cache_dir()
+    key = hashlib.sha1(str(file_path.resolve()).encode('utf-8')).hexdigest()
+    suffix = 'typed' if typed else 'raw'
+    return directory / f"{file_path.name}.{key[:16]}.{suffix}.pkl"
+
+
+def _file_signature(file_path: Path) -> dict[str, Any]:
+    """Return path, size and mtime describing the current file state."""
+    stat = file_path.stat()
+    return {
+        'path': str(file_path.resolve()),
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+    }
+
+
+def _read_cache(
+    cache_path: Path,
+    signature: dict[str, Any],
+    typed: bool,
+    content_hash: Optional[str]
+) -> Optional[list]:
+    """
+    Read cached rows if the cache matches the current file.
+    
+    Args:
+        cache_path: Cache file location
+        signature: Current path, size and mtime of the CSV file
+        typed: Load mode the rows must have been cached with
+        content_hash: Current content hash, or None to skip the hash check
+        
+    Returns:
+        Cached rows, or None if the cache is missing or stale
+    """
+    if not cache_path.exists():
+        return None
+    
+    try:
+        if not (_is_private(cache_path) and _is_private(cache_path.parent)):
+            logger.warning(f"Cache is writable by other users, not loading it: {cache_path}")
+            return None
+        
+        with open(cache_path, 'rb') as f:
+            meta = pickle.load(f)
+            
+            if (meta.get('version') != CACHE_FORMAT_VERSION
+                    or meta.get('typed') != typed
+                    or any(meta.get(key) != value for key, value in signature.items())
+                    or (content_hash is not None and meta.get('content_hash') != content_hash)):
+                logger.info(f"Cache is stale, re-parsing: {cache_path}")
+                return None
+            
+            return pickle.load(f)
+    
+    except Exception as e:
+        logger.warning(f"Could not read cache {cache_path}: {e}")
+        return None
+
+
+def _write_cache(cache_path: Path, meta: dict[str, Any], rows: list) -> None:
+    """
+    Atomically write metadata and rows to the cache file.
+    
+    Metadata is pickled first so staleness can be checked without
+    unpickling the rows.
+    """
+    try:
+        cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(meta, f, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(rows, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_name, cache_path)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+        logger.info(f"Wrote parse cache: {cache_path}")
+    
+    except OSError as e:
+        logger.warning(f"Could not write cache {cache_path}: {e}")
+
+
+def load_csv_cached(
+    path: str,
+    cache_dir: Optional[str] = None,
+    typed: bool = False,
+    verify_hash: bool = False
+) -> list:
+    """
+    Load CSV file, reusing a binary cache of the parsed rows when valid.
+    
+    The cache is keyed by resolved path, file size and mtime, and is
+    rebuilt whenever any of them change. That check costs one stat call.
+    verify_hash also compares a content hash, which catches rewrites that
+    keep size and mtime but reads the whole file on every load (about
+    half the cost of parsing it), so it is off by default. Rows are
+    checked by load_csv when the cache is built, so cached rows are
+    already valid.
+    
+    Cache files are pickles and are only loaded when they and their
+    directory are owned by the current user and not writable by others.
+    
+    Args:
+        path: Path to CSV file
+        cache_dir: Directory for cache files (defaults to default_cache_dir())
+        typed: Cache rows with typed columns parsed, as load_csv(typed=True)
+        verify_hash: Also compare the content hash, not just size and mtime
+        
+    Returns:
+        List of dictionaries containing CSV data
+        
+    Raises:
+        CSVFileNotFoundError: If file doesn't exist
+        CSVMissingMandatoryFieldError: If mandatory columns are missing
+        CSVColumnMismatchError: If row has wrong column count
+        CSVEmptyRowError: If empty rows are detected
+    """
+    file_path = _resolve_path(path)
+    cache_path = _cache_file(file_path, cache_dir, typed)
+    signature = _file_signature(file_path)
+    content_hash = file_content_hash(str(file_path)) if verify_hash else None
+    
+    rows = _read_cache(cache_path, signature, typed, content_hash)
+    if rows is not None:
+        logger.info(f"Loaded {len(rows)} rows from cache: {cache_path}")
+        return rows
+    
+    rows = load_csv(path, typed=typed)
+    
+    if _file_signature(file_path) != signature:
+        logger.warning(f"File changed while loading, not caching: {path}")
+        return rows
+    
+    meta = {
+        'version': CACHE_FORMAT_VERSION,
+        'typed': typed,
+        'content_hash': content_hash or file_content_hash(str(file_path)),
+        **signature,
+    }
+    _write_cache(cache_path, meta, rows)
+    
+    return rows
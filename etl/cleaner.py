@@ -1,8 +1,11 @@
 """Cleaner module for banking transactions."""
 
 import logging
-from datetime import datetime
-from typing import Any, Optional
+from datetime import date
+from typing import Any, Optional, Union
+
+from etl.dates import lookup_date
+from etl.record import Transaction, TransactionLike
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -23,32 +26,29 @@ def trim_whitespace(value: Any) -> Any:
     return value
 
 
-def normalize_date(date_str: str) -> Optional[str]:
+def normalize_date(date_str: Union[str, date]) -> Optional[Union[str, date]]:
     """
     Normalize date to YYYY-MM-DD format.
     
+    Date objects from a typed load are already normalized and are
+    returned unchanged so the transformer can reuse them.
+    
     Args:
-        date_str: Date string in YYYY-MM-DD or DD/MM/YYYY format
+        date_str: Date string in YYYY-MM-DD or DD/MM/YYYY format, or a date
         
     Returns:
-        Normalized date string or None if invalid
+        Normalized date string (or the given date) or None if invalid
     """
+    if isinstance(date_str, date):
+        return date_str
+    
     if not date_str:
         return None
     
     date_str = str(date_str).strip()
     
-    # Try YYYY-MM-DD format
-    try:
-        dt = datetime.strptime(date_str, '%Y-%m-%d')
-        return dt.strftime('%Y-%m-%d')
-    except ValueError:
-        pass
-    
-    # Try DD/MM/YYYY format
     try:
-        dt = datetime.strptime(date_str, '%d/%m/%Y')
-        return dt.strftime('%Y-%m-%d')
+        return lookup_date(date_str).iso
     except ValueError:
         pass
     
@@ -92,6 +92,9 @@ def clean_numeric(value: Any) -> Optional[float]:
     if value is None or (isinstance(value, str) and not value.strip()):
         return None
     
+    if isinstance(value, float):
+        return value
+    
     try:
         return float(value)
     except (ValueError, TypeError):
@@ -115,19 +118,19 @@ def clean_merchant_category(merchant_category: str) -> str:
     return str(merchant_category).strip()
 
 
-def clean_transaction(transaction: dict[str, Any]) -> dict[str, Any]:
+def clean_transaction(transaction: TransactionLike) -> TransactionLike:
     """
     Clean transaction data.
     
     Args:
-        transaction: Raw transaction dictionary
+        transaction: Raw transaction dictionary or Transaction record
         
     Returns:
-        Cleaned transaction dictionary
+        Cleaned transaction, of the same type as the input
     """
     logger.debug(f"Cleaning transaction: {transaction.get('transaction_id')}")
     
-    cleaned = {}
+    cleaned = Transaction() if isinstance(transaction, Transaction) else {}
     
     # Copy all fields and apply cleaning rules
     for key, value in transaction.items():
@@ -0,0 +1,131 @@
+"""Fast date parsing shared by the loader, validator, cleaner and transformer."""
+
+import logging
+from datetime import date, datetime
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+ISO_FORMAT = '%Y-%m-%d'
+DMY_FORMAT = '%d/%m/%Y'
+# Distinct raw date strings remembered per process; files hold a few hundred
+DATE_CACHE_SIZE = 4096
+WEEKDAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
+
+def parse_date(value: str) -> date:
+    """
+    Parse a YYYY-MM-DD or DD/MM/YYYY date string.
+    
+    The format is recognized from the separator positions of the 10
+    character forms and converted by integer slicing; date() then checks
+    calendar validity (month range, days per month, leap years). Other
+    lengths, such as dates without zero padding, fall back to strptime so
+    every string strptime accepted is still accepted.
+    
+    Args:
+        value: Date string; surrounding whitespace is ignored
+        
+    Returns:
+        Parsed date
+        
+    Raises:
+        ValueError: If the value is not a valid date in either format
+    """
+    value = value.strip()
+    
+    if len(value) == 10:
+        if value[4] == '-' and value[7] == '-':
+            year, month, day = value[0:4], value[5:7], value[8:10]
+        elif value[2] == '/' and value[5] == '/':
+            day, month, year = value[0:2], value[3:5], value[6:10]
+        else:
+            raise ValueError(f"Date must be YYYY-MM-DD or DD/MM/YYYY, got {value}")
+        
+        if not (year.isdigit() and month.isdigit() and day.isdigit()):
+            raise ValueError(f"Date must be YYYY-MM-DD or DD/MM/YYYY, got {value}")
+        return date(int(year), int(month), int(day))
+    
+    try:
+        return datetime.strptime(value, ISO_FORMAT).date()
+    except ValueError:
+        return datetime.strptime(value, DMY_FORMAT).date()
+
+
+class ParsedDate(NamedTuple):
+    """A parsed date with its normalized YYYY-MM-DD string and day name."""
+    
+    value: date
+    iso: str
+    weekday: str
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _lookup(value: str) -> Optional[ParsedDate]:
+    """Parse a stripped date string once; invalid strings are remembered as None."""
+    try:
+        parsed = parse_date(value)
+    except ValueError:
+        return None
+    return ParsedDate(parsed, parsed.isoformat(), WEEKDAY_NAMES[parsed.weekday()])
+
+
+def lookup_date(value: str) -> ParsedDate:
+    """
+    Parse a date string through the shared bounded cache.
+    
+    Transaction dates repeat heavily, so each distinct string is parsed
+    once per process and later lookups (from any stage) are cache hits.
+    The least recently used entries are evicted beyond DATE_CACHE_SIZE.
+    
+    Args:
+        value: Date string in YYYY-MM-DD or DD/MM/YYYY format
+        
+    Returns:
+        ParsedDate with the date, its YYYY-MM-DD string and day name
+        
+    Raises:
+        ValueError: If the value is not a valid date in either format
+    """
+    parsed = _lookup(value.strip())
+    if parsed is None:
+        raise ValueError(f"Date must be YYYY-MM-DD or DD/MM/YYYY, got {value}")
+    return parsed
+
+
+def parse_date_cached(value: str) -> date:
+    """
+    Cached variant of parse_date.
+    
+    Raises:
+        ValueError: If the value is not a valid date in either format
+    """
+    return lookup_date(value).value
+
+
+def is_valid_date(value: str) -> bool:
+    """Check a date string through the shared cache without raising."""
+    return _lookup(value.strip()) is not None
+
+
+def date_cache_info() -> dict[str, int]:
+    """
+    Report shared date cache usage.
+    
+    Returns:
+        Dictionary with hits, misses, size and maxsize
+    """
+    info = _lookup.cache_info()
+    return {
+        'hits': info.hits,
+        'misses': info.misses,
+        'size': info.currsize,
+        'maxsize': info.maxsize,
+    }
+
+
+def clear_date_cache() -> None:
+    """Empty the shared date cache and reset its counters."""
+    _lookup.cache_clear()
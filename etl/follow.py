@@ -0,0 +1,237 @@
+"""Follow mode for CSV files that are appended to while being read."""
+
+import csv
+import io
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from etl.loader import _check_row, _resolve_path, _values_to_row, _verify_headers
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_POLL_INTERVAL = 1.0
+# Bytes read per poll; a backlog is consumed over several polls
+MAX_POLL_BYTES = 8 * 1024 * 1024
+
+
+def _last_complete_line_end(chunk: bytes) -> int:
+    """
+    Find the end of the last complete row in a chunk of appended bytes.
+    
+    A newline only ends a row when it is outside quotes, so a quoted field
+    still being written is left for the next poll.
+    
+    Args:
+        chunk: Bytes read from the current offset to end of file
+        
+    Returns:
+        Length of the complete part of the chunk (0 if no row is complete)
+    """
+    end = chunk.rfind(b'\n')
+    while end != -1:
+        if chunk.count(b'"', 0, end) % 2 == 0:
+            return end + 1
+        end = chunk.rfind(b'\n', 0, end)
+    return 0
+
+
+class CSVFollower:
+    """
+    Incrementally read rows appended to a CSV file.
+    
+    The follower remembers the byte offset and header of what it has
+    consumed, so each poll yields only newly appended complete rows. The
+    state can be persisted to a JSON file and restored to resume after a
+    restart. If the file shrinks or is replaced by another file (a new
+    device and inode, as after log rotation), reading starts over from the
+    header.
+    """
+    
+    def __init__(
+        self,
+        path: str,
+        state_path: Optional[str] = None,
+        max_poll_bytes: int = MAX_POLL_BYTES
+    ) -> None:
+        """
+        Create a follower, restoring saved state when available.
+        
+        Args:
+            path: Path to CSV file
+            state_path: Optional JSON file used to persist the read position
+            max_poll_bytes: Most bytes read by one poll
+            
+        Raises:
+            ValueError: If max_poll_bytes is not positive
+            CSVFileNotFoundError: If file doesn't exist
+        """
+        if max_poll_bytes <= 0:
+            raise ValueError(f"max_poll_bytes must be positive, got {max_poll_bytes}")
+        
+        self.file_path = _resolve_path(path)
+        self.state_path = Path(state_path) if state_path else None
+        self.max_poll_bytes = max_poll_bytes
+        self.offset = 0
+        self.row_num = 1  # row 1 is header
+        self.fieldnames = None
+        self.file_id = None  # [st_dev, st_ino] of the file being read
+        
+        if self.state_path is not None and self.state_path.exists():
+            self._load_state()
+    
+    def _load_state(self) -> None:
+        """Restore offset, row number and header from the state file."""
+        with open(self.state_path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        
+        if state.get('path') != str(self.file_path.resolve()):
+            logger.warning(
+                f"State file {self.state_path} belongs to {state.get('path')}, ignoring"
+            )
+            return
+        
+        self.offset = state['offset']
+        self.row_num = state['row_num']
+        self.fieldnames = state['fieldnames']
+        self.file_id = state.get('file_id')
+        logger.info(f"Resuming {self.file_path} from byte {self.offset}, row {self.row_num}")
+    
+    def save_state(self) -> None:
+        """
+        Atomically persist the current read position to the state file.
+        
+        Raises:
+            ValueError: If the follower was created without a state_path
+        """
+        if self.state_path is None:
+            raise ValueError("No state_path configured for this follower")
+        
+        state = {
+            'path': str(self.file_path.resolve()),
+            'offset': self.offset,
+            'row_num': self.row_num,
+            'fieldnames': self.fieldnames,
+            'file_id': self.file_id,
+        }
+        temp_path = self.state_path.with_name(self.state_path.name + '.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(temp_path, self.state_path)
+    
+    def _reset(self) -> None:
+        """Start reading again from the beginning of the file."""
+        self.offset = 0
+        self.row_num = 1
+        self.fieldnames = None
+    
+    def poll(self) -> list[dict[str, Any]]:
+        """
+        Read rows appended since the last poll.
+        
+        Only complete rows (terminated by a newline) are consumed; a
+        partially written last row is picked up by a later poll. At most
+        max_poll_bytes are read, so a large backlog is returned over
+        several polls; only a single row longer than that is read whole.
+        
+        Returns:
+            List of new row dictionaries (empty if nothing new)
+            
+        Raises:
+            CSVMissingMandatoryFieldError: If mandatory columns are missing
+            CSVColumnMismatchError: If row has wrong column count
+            CSVEmptyRowError: If empty rows are detected
+        """
+        stat = self.file_path.stat()
+        size = stat.st_size
+        file_id = [stat.st_dev, stat.st_ino]
+        if self.file_id is not None and file_id != self.file_id:
+            logger.warning(f"{self.file_path} was replaced, restarting from the header")
+            self._reset()
+        elif size < self.offset:
+            logger.warning(f"{self.file_path} shrank, restarting from the header")
+            self._reset()
+        self.file_id = file_id
+        if size == self.offset:
+            return []
+        
+        available = size - self.offset
+        with open(self.file_path, 'rb') as f:
+            f.seek(self.offset)
+            chunk = f.read(min(available, self.max_poll_bytes))
+            complete = _last_complete_line_end(chunk)
+            # Keep reading while one row is longer than the cap, so it cannot stall
+            while complete == 0 and len(chunk) < available:
+                chunk += f.read(min(available - len(chunk), self.max_poll_bytes))
+                complete = _last_complete_line_end(chunk)
+        
+        if complete == 0:
+            return []
+        
+        reader = csv.reader(io.StringIO(chunk[:complete].decode('utf-8'), newline=''))
+        
+        fieldnames = self.fieldnames
+        if fieldnames is None:
+            fieldnames = next(reader, None)
+            _verify_headers(fieldnames)
+        
+        # Only advance the saved position once the whole chunk passed the checks
+        field_count = len(fieldnames)
+        row_num = self.row_num
+        rows = []
+        for values in reader:
+            # Blank lines are skipped, as csv.DictReader does
+            if not values:
+                continue
+            row_num += 1
+            row = _values_to_row(fieldnames, values)
+            _check_row(row, row_num, field_count)
+            rows.append(row)
+        
+        self.fieldnames = fieldnames
+        self.row_num = row_num
+        self.offset += complete
+        logger.debug(f"Read {len(rows)} new rows from {self.file_path}")
+        return rows
+    
+    def follow(
+        self,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        max_idle_polls: Optional[int] = None
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Yield batches of newly appended rows as they arrive.
+        
+        Polls run back to back while they return rows, so a backlog is
+        drained in batches of at most max_poll_bytes. When a state_path is
+        configured, the position is saved after the consumer asks for the
+        next batch, so a crash while processing a batch replays it on
+        resume rather than skipping it.
+        
+        Args:
+            poll_interval: Seconds to wait between polls when no rows are new
+            max_idle_polls: Stop after this many consecutive empty polls
+                (None follows forever)
+                
+        Yields:
+            Non-empty lists of new row dictionaries
+        """
+        idle_polls = 0
+        
+        while max_idle_polls is None or idle_polls < max_idle_polls:
+            rows = self.poll()
+            
+            if not rows:
+                idle_polls += 1
+                time.sleep(poll_interval)
+                continue
+            
+            idle_polls = 0
+            yield rows
+            
+            if self.state_path is not None:
+                self.save_state()
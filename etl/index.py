@@ -0,0 +1,292 @@
+"""Sidecar offset index for random access to banking transactions."""
+
+import csv
+import heapq
+import logging
+import mmap
+import os
+import struct
+import tempfile
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from etl.loader import (
+    _detect_compression,
+    _read_record,
+    _resolve_path,
+    _values_to_row,
+    _verify_headers,
+)
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+INDEX_SUFFIX = '.idx'
+INDEX_MAGIC = b'ETLIDX01'
+# magic, key width, entry count, CSV size, CSV mtime_ns
+INDEX_HEADER = struct.Struct('<8sIQQq')
+OFFSET_FORMAT = struct.Struct('<Q')
+# offset, key length; the key bytes follow each entry in sorted run files
+RUN_ENTRY = struct.Struct('<QH')
+# IDs sorted in memory before a run is spilled to disk
+INDEX_CHUNK_ENTRIES = 1_000_000
+
+
+def _default_index_path(file_path: Path) -> Path:
+    """Return the sidecar index location for a CSV file."""
+    return file_path.with_name(file_path.name + INDEX_SUFFIX)
+
+
+def _split_line(line: bytes) -> list[str]:
+    """Split one raw CSV record into values, using csv.reader only for quoted records."""
+    text = line.decode('utf-8').rstrip('\r\n')
+    if '"' in text:
+        return next(csv.reader([text]), [])
+    return text.split(',')
+
+
+def _write_run(entries: list[tuple[bytes, int]], directory: str) -> str:
+    """Sort a chunk of (key, offset) entries and spill it to a temporary run file."""
+    entries.sort()
+    fd, run_name = tempfile.mkstemp(dir=directory, suffix='.run')
+    with os.fdopen(fd, 'wb') as f:
+        for key, offset in entries:
+            f.write(RUN_ENTRY.pack(offset, len(key)))
+            f.write(key)
+    return run_name
+
+
+def _read_run(run_name: str) -> Iterator[tuple[bytes, int]]:
+    """Stream the sorted (key, offset) entries of a run file."""
+    with open(run_name, 'rb') as f:
+        for raw in iter(lambda: f.read(RUN_ENTRY.size), b''):
+            offset, key_length = RUN_ENTRY.unpack(raw)
+            yield f.read(key_length), offset
+
+
+def build_index(
+    path: str,
+    index_path: Optional[str] = None,
+    chunk_entries: int = INDEX_CHUNK_ENTRIES
+) -> Path:
+    """
+    Build a sorted transaction_id -> byte offset index for a CSV file.
+    
+    Entries are fixed-width records sorted by transaction ID, so the index
+    can be memory-mapped and binary searched without loading it. IDs are
+    collected in chunks of at most chunk_entries, each chunk is sorted and
+    spilled to a temporary run file, and the runs are merged into the
+    index, so memory stays bounded for any file size. When an ID occurs
+    more than once, the first occurrence is indexed. Records are read with
+    quote parity, so quoted fields may contain line breaks. The index is
+    written to a temporary file and moved into place, so readers never
+    see a partial index.
+    
+    Args:
+        path: Path to an uncompressed CSV file
+        index_path: Where to write the index (defaults to <csv>.idx)
+        chunk_entries: Number of IDs sorted in memory per run
+        
+    Returns:
+        Path of the written index file
+        
+    Raises:
+        ValueError: If the file is compressed or chunk_entries is not positive
+        CSVFileNotFoundError: If file doesn't exist
+        CSVMissingMandatoryFieldError: If mandatory columns are missing
+    """
+    if chunk_entries < 1:
+        raise ValueError(f"chunk_entries must be positive, got {chunk_entries}")
+    
+    file_path = _resolve_path(path)
+    compression = _detect_compression(file_path)
+    if compression is not None:
+        raise ValueError(
+            f"Cannot index {compression} compressed file {path}: "
+            f"byte offsets need an uncompressed CSV"
+        )
+    
+    target = Path(index_path) if index_path else _default_index_path(file_path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    stat = file_path.stat()
+    
+    logger.info(f"Building transaction index for: {path}")
+    
+    with tempfile.TemporaryDirectory(dir=target.parent) as run_dir:
+        runs = []
+        entries = []
+        key_width = 0
+        with open(file_path, 'rb') as f:
+            header = _read_record(f)
+            fieldnames = _split_line(header) if header.strip() else None
+            _verify_headers(fieldnames)
+            id_index = fieldnames.index('transaction_id')
+            
+            offset = f.tell()
+            for record in iter(lambda: _read_record(f), b''):
+                values = _split_line(record)
+                if len(values) > id_index:
+                    key = values[id_index].strip().encode('utf-8')
+                    if key:
+                        key_width = max(key_width, len(key))
+                        entries.append((key, offset))
+                        if len(entries) >= chunk_entries:
+                            runs.append(_write_run(entries, run_dir))
+                            entries = []
+                offset += len(record)
+        
+        entries.sort()
+        merged = heapq.merge(*(_read_run(run) for run in runs), entries)
+        count = _write_index(merged, target, key_width, stat)
+    
+    logger.info(f"Indexed {count} transactions into: {target}")
+    return target
+
+
+def _write_index(
+    merged: Iterator[tuple[bytes, int]],
+    target: Path,
+    key_width: int,
+    stat: os.stat_result
+) -> int:
+    """
+    Write sorted entries as a fixed-width index, replacing target atomically.
+    
+    The entry count is only known after duplicates are dropped, so the
+    header is written again once all entries are in place.
+    
+    Args:
+        merged: (key, offset) entries sorted by key, then offset
+        target: Final index location
+        key_width: Length of the longest key
+        stat: Stat result of the CSV file the index describes
+        
+    Returns:
+        Number of indexed transaction IDs
+    """
+    fd, temp_name = tempfile.mkstemp(dir=target.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as out:
+            out.write(INDEX_HEADER.pack(INDEX_MAGIC, key_width, 0, 0, 0))
+            count = 0
+            previous = None
+            for key, offset in merged:
+                if key == previous:
+                    logger.warning(f"Duplicate transaction ID at byte {offset}: {key.decode()}")
+                    continue
+                previous = key
+                count += 1
+                out.write(key.ljust(key_width, b'\0'))
+                out.write(OFFSET_FORMAT.pack(offset))
+            
+            out.seek(0)
+            out.write(INDEX_HEADER.pack(
+                INDEX_MAGIC, key_width, count, stat.st_size, stat.st_mtime_ns
+            ))
+            out.flush()
+            os.fsync(out.fileno())
+        os.replace(temp_name, target)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+    
+    return count
+
+
+def _index_is_current(index_file: Path, file_path: Path) -> bool:
+    """Check that an index exists and was built from the current CSV file."""
+    if not index_file.exists():
+        return False
+    
+    with open(index_file, 'rb') as f:
+        raw = f.read(INDEX_HEADER.size)
+    if len(raw) < INDEX_HEADER.size:
+        return False
+    
+    magic, _, _, size, mtime_ns = INDEX_HEADER.unpack(raw)
+    stat = file_path.stat()
+    return magic == INDEX_MAGIC and size == stat.st_size and mtime_ns == stat.st_mtime_ns
+
+
+def _find_offset(index_file: Path, transaction_id: str) -> Optional[int]:
+    """
+    Binary search a memory-mapped index for a transaction ID.
+    
+    Args:
+        index_file: Path to index file
+        transaction_id: Transaction ID to find
+        
+    Returns:
+        Byte offset of the row, or None if the ID is not indexed
+    """
+    key = transaction_id.strip().encode('utf-8')
+    
+    if index_file.stat().st_size <= INDEX_HEADER.size:
+        return None
+    
+    with open(index_file, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            _, key_width, count, _, _ = INDEX_HEADER.unpack_from(mm, 0)
+            if len(key) > key_width:
+                return None
+            
+            padded = key.ljust(key_width, b'\0')
+            entry_size = key_width + OFFSET_FORMAT.size
+            base = INDEX_HEADER.size
+            
+            low, high = 0, count
+            while low < high:
+                mid = (low + high) // 2
+                start = base + mid * entry_size
+                current = mm[start:start + key_width]
+                if current < padded:
+                    low = mid + 1
+                elif current > padded:
+                    high = mid
+                else:
+                    return OFFSET_FORMAT.unpack_from(mm, start + key_width)[0]
+    
+    return None
+
+
+def lookup(
+    path: str,
+    transaction_id: str,
+    index_path: Optional[str] = None
+) -> Optional[dict[str, Any]]:
+    """
+    Fetch a single transaction by ID by seeking directly to its row.
+    
+    The sidecar index is built on first use and rebuilt automatically
+    when the CSV file's size or mtime no longer match it.
+    
+    Args:
+        path: Path to CSV file
+        transaction_id: Transaction ID to fetch, e.g. TXN0000001
+        index_path: Location of the index (defaults to <csv>.idx)
+        
+    Returns:
+        Row dictionary, or None if the transaction ID is not in the file
+        
+    Raises:
+        CSVFileNotFoundError: If file doesn't exist
+        CSVMissingMandatoryFieldError: If mandatory columns are missing
+    """
+    file_path = _resolve_path(path)
+    index_file = Path(index_path) if index_path else _default_index_path(file_path)
+    
+    if not _index_is_current(index_file, file_path):
+        logger.info(f"Index missing or stale, rebuilding: {index_file}")
+        build_index(path, str(index_file))
+    
+    offset = _find_offset(index_file, transaction_id)
+    if offset is None:
+        logger.debug(f"Transaction not found in index: {transaction_id}")
+        return None
+    
+    with open(file_path, 'rb') as f:
+        fieldnames = _split_line(_read_record(f))
+        f.seek(offset)
+        values = _split_line(_read_record(f))
+    
+    return _values_to_row(fieldnames, values)
@@ -1,9 +1,31 @@
 """CSV loader module for banking transactions."""
 
+import asyncio
+import bz2
+import codecs
 import csv
+import gzip
+import io
 import logging
+import lzma
+import math
+import mmap
+import os
+import queue
+import random
+import re
+import threading
+from array import array
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
+from datetime import date
+from itertools import islice
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator, BinaryIO, Callable, Iterator, NamedTuple, Optional, TextIO, Union
+
+from etl.dates import parse_date_cached
+from etl.record import CSV_FIELDS, Transaction, TransactionLike
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -30,87 +52,1755 @@ class CSVMissingMandatoryFieldError(Exception):
     pass
 
 
-def load_csv(path: str) -> list:
+class CSVErrorRateExceededError(Exception):
+    """Raised when a lenient load rejects too large a share of rows."""
+    pass
+
+
+MANDATORY_COLUMNS = {
+    'transaction_id',
+    'transaction_date',
+    'customer_id',
+    'account_id',
+    'amount',
+    'currency'
+}
+
+DEFAULT_BATCH_SIZE = 10_000
+DEFAULT_MAX_ERROR_RATE = 0.01
+DEFAULT_ERROR_RATE_MIN_ROWS = 1000
+DEFAULT_MIN_PARTITION_BYTES = 8 * 1024 * 1024
+READ_BUFFER_SIZE = 1024 * 1024
+READ_AHEAD_DEPTH = 2
+MMAP_BLOCK_SIZE = 4 * 1024 * 1024
+COUNT_BLOCK_SIZE = 4 * 1024 * 1024
+
+# Compressed input detection for the streaming loaders
+COMPRESSION_MAGIC = {
+    'gzip': b'\x1f\x8b',
+    'bz2': b'BZh',
+    'xz': b'\xfd7zXZ\x00',
+}
+COMPRESSION_EXTENSIONS = {
+    '.gz': 'gzip',
+    '.gzip': 'gzip',
+    '.bz2': 'bz2',
+    '.xz': 'xz',
+}
+
+# Column types used by load_csv_columnar
+FLOAT_COLUMNS = {'amount', 'risk_score'}
+CATEGORICAL_COLUMNS = {
+    'currency',
+    'region',
+    'channel',
+    'account_type',
+    'txn_type',
+    'direction',
+    'merchant_category'
+}
+
+
+def _resolve_path(path: str) -> Path:
     """
-    Load CSV file and convert to list of dictionaries.
+    Resolve CSV path and check that the file exists.
     
     Args:
         path: Path to CSV file
         
     Returns:
-        List of dictionaries containing CSV data
+        Path object for the CSV file
         
     Raises:
         CSVFileNotFoundError: If file doesn't exist
-        CSVMissingMandatoryFieldError: If mandatory columns are missing
-        CSVColumnMismatchError: If row has wrong column count
-        CSVEmptyRowError: If empty rows are detected
     """
-    mandatory_columns = {
-        'transaction_id',
-        'transaction_date',
-        'customer_id',
-        'account_id',
-        'amount',
-        'currency'
-    }
-    
-    # Check if file exists
     file_path = Path(path)
     if not file_path.exists():
         logger.error(f"CSV file not found: {path}")
         raise CSVFileNotFoundError(f"File not found: {path}")
+    return file_path
+
+
+def _detect_compression(file_path: Path) -> Optional[str]:
+    """
+    Detect the compression format of a file from its magic bytes or extension.
+    
+    Args:
+        file_path: Path to an existing file
+        
+    Returns:
+        'gzip', 'bz2', 'xz', or None for plain files
+    """
+    with open(file_path, 'rb') as f:
+        magic = f.read(6)
+    
+    for compression, signature in COMPRESSION_MAGIC.items():
+        if magic.startswith(signature):
+            return compression
+    
+    # Fall back to the extension for files too short to carry magic bytes
+    return COMPRESSION_EXTENSIONS.get(file_path.suffix.lower())
+
+
+def _open_binary(file_path: Path) -> BinaryIO:
+    """
+    Open a plain or compressed file as a buffered binary stream.
+    
+    Compressed files are decompressed on the fly; a large read buffer keeps
+    decompression and parsing working on big blocks instead of small reads.
+    
+    Args:
+        file_path: Path to an existing file
+        
+    Returns:
+        Binary stream of the (decompressed) file content
+    """
+    compression = _detect_compression(file_path)
+    
+    if compression is None:
+        return open(file_path, 'rb', buffering=READ_BUFFER_SIZE)
+    
+    logger.info(f"Decompressing {compression} input: {file_path}")
+    openers = {'gzip': gzip.open, 'bz2': bz2.open, 'xz': lzma.open}
+    raw = openers[compression](file_path, 'rb')
+    return io.BufferedReader(raw, buffer_size=READ_BUFFER_SIZE)
+
+
+def _open_text(file_path: Path, errors: str = 'strict') -> TextIO:
+    """
+    Open a plain or compressed CSV file as a UTF-8 text stream.
+    
+    Args:
+        file_path: Path to an existing CSV file
+        errors: Decoding error handler, e.g. 'surrogateescape' for lenient loads
+        
+    Returns:
+        Text stream suitable for csv.reader
+    """
+    if _detect_compression(file_path) is None:
+        return open(
+            file_path, 'r', encoding='utf-8', errors=errors, newline='',
+            buffering=READ_BUFFER_SIZE
+        )
+    
+    return io.TextIOWrapper(
+        _open_binary(file_path), encoding='utf-8', errors=errors, newline=''
+    )
+
+
+class _ReadAheadLines:
+    """
+    Lines of a binary stream, read and decoded by a background thread.
+    
+    The thread reads the next block, decodes it and splits it into lines
+    while the consumer parses and processes the previous one. At most
+    depth blocks are buffered, so memory stays bounded. Lines keep their
+    line endings, as a text file opened with newline='' returns them, and
+    the object closes the underlying stream when closed.
+    """
+    
+    def __init__(
+        self,
+        stream: BinaryIO,
+        block_size: int = READ_BUFFER_SIZE,
+        depth: int = READ_AHEAD_DEPTH,
+        errors: str = 'strict'
+    ) -> None:
+        self._stream = stream
+        self._block_size = block_size
+        self._errors = errors
+        self._blocks = queue.Queue(maxsize=depth)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._produce, name='csv-read-ahead', daemon=True)
+        self._thread.start()
+    
+    def __enter__(self) -> '_ReadAheadLines':
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Stop the reader thread and close the stream."""
+        self._stop.set()
+        self._thread.join()
+        self._stream.close()
+    
+    def _put(self, item: Any) -> None:
+        """Queue an item, giving up if the consumer has closed the reader."""
+        while not self._stop.is_set():
+            try:
+                self._blocks.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+    
+    def _produce(self) -> None:
+        """Read, decode and split blocks until end of stream or close()."""
+        decoder = codecs.getincrementaldecoder('utf-8')(self._errors)
+        pending = ''
+        try:
+            while not self._stop.is_set():
+                block = self._stream.read(self._block_size)
+                final = not block
+                lines = list(io.StringIO(pending + decoder.decode(block, final), newline=''))
+                
+                # Carry an unfinished last line (or a \r that may start \r\n) over
+                pending = ''
+                if not final and lines and (
+                    lines[-1][-1] not in '\r\n' or lines[-1].endswith('\r')
+                ):
+                    pending = lines.pop()
+                
+                if lines:
+                    self._put(lines)
+                if final:
+                    break
+            self._put(None)
+        except Exception as e:
+            self._put(e)
+    
+    def __iter__(self) -> Iterator[str]:
+        while True:
+            lines = self._blocks.get()
+            if lines is None:
+                return
+            if isinstance(lines, Exception):
+                raise lines
+            yield from lines
+
+
+def _read_fieldnames(file_path: Path) -> Optional[list[str]]:
+    """Read only the header fields of a plain or compressed CSV file."""
+    with _open_text(file_path) as csvfile:
+        return next(csv.reader(csvfile), None)
+
+
+def _verify_headers(fieldnames: Any) -> None:
+    """
+    Check that the CSV header is present and has all mandatory columns.
+    
+    Args:
+        fieldnames: Header fields parsed from the CSV file
+        
+    Raises:
+        CSVMissingMandatoryFieldError: If header or mandatory columns are missing
+    """
+    if fieldnames is None:
+        logger.error("CSV file has no headers")
+        raise CSVMissingMandatoryFieldError("CSV file has no headers")
+    
+    missing_columns = MANDATORY_COLUMNS - set(fieldnames)
+    
+    if missing_columns:
+        logger.error(f"Missing mandatory columns: {missing_columns}")
+        raise CSVMissingMandatoryFieldError(
+            f"Missing mandatory columns: {missing_columns}"
+        )
+    
+    logger.info(f"CSV headers verified. Found columns: {fieldnames}")
+
+
+def _check_row(row: dict[str, Any], row_num: int, field_count: int) -> None:
+    """
+    Check a parsed row for emptiness and column count.
+    
+    Args:
+        row: Parsed row dictionary
+        row_num: Line number of the row in the file
+        field_count: Number of columns in the header
+        
+    Raises:
+        CSVEmptyRowError: If the row is empty
+        CSVColumnMismatchError: If the row has wrong column count
+    """
+    # Check for empty rows
+    if not any(row.values()):
+        logger.warning(f"Empty row detected at line {row_num}")
+        raise CSVEmptyRowError(f"Empty row detected at line {row_num}")
+    
+    # Check column count
+    if len(row) != field_count:
+        logger.error(
+            f"Row {row_num} has {len(row)} columns, "
+            f"expected {field_count}"
+        )
+        raise CSVColumnMismatchError(
+            f"Row {row_num} has wrong column count"
+        )
+
+
+def _values_to_row(fieldnames: list[str], values: list[str]) -> dict[str, Any]:
+    """Build a row dict from parsed values the way csv.DictReader does."""
+    row = dict(zip(fieldnames, values))
+    field_count = len(fieldnames)
+    if len(values) > field_count:
+        row[None] = values[field_count:]
+    elif len(values) < field_count:
+        for key in fieldnames[len(values):]:
+            row[key] = None
+    return row
+
+
+def _project_indices(
+    fieldnames: list[str],
+    columns: Optional[list[str]]
+) -> Optional[list[tuple[str, int]]]:
+    """
+    Resolve projected column names to their header positions.
+    
+    Args:
+        fieldnames: CSV header fields
+        columns: Requested columns, or None for all columns
+        
+    Returns:
+        List of (column name, index) pairs, or None when not projecting
+        
+    Raises:
+        CSVMissingMandatoryFieldError: If a requested column is not in the header
+    """
+    if columns is None:
+        return None
+    
+    missing_columns = set(columns) - set(fieldnames)
+    if missing_columns:
+        logger.error(f"Requested columns not in header: {missing_columns}")
+        raise CSVMissingMandatoryFieldError(
+            f"Requested columns not in header: {missing_columns}"
+        )
+    
+    return [(name, fieldnames.index(name)) for name in columns]
+
+
+class RowFilter(NamedTuple):
+    """
+    Cheap row predicates evaluated on raw CSV strings before a row is built.
+    
+    All given conditions must hold for a row to be kept. Dates accept
+    YYYY-MM-DD strings or date objects and bounds are inclusive. Rows whose
+    filtered fields cannot be parsed are dropped.
+    """
+    
+    date_from: Optional[Union[str, date]] = None
+    date_to: Optional[Union[str, date]] = None
+    currencies: Optional[set[str]] = None
+    regions: Optional[set[str]] = None
+    min_amount: Optional[float] = None
+
+
+def _iso_date_key(value: Optional[str]) -> Optional[str]:
+    """
+    Turn a raw YYYY-MM-DD or DD/MM/YYYY date into a sortable YYYY-MM-DD key.
+    
+    Args:
+        value: Raw date string
+        
+    Returns:
+        YYYY-MM-DD string, or None if the layout is not recognized
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if len(value) != 10:
+        return None
+    if value[4] == '-' and value[7] == '-':
+        return value
+    if value[2] == '/' and value[5] == '/':
+        return f"{value[6:]}-{value[3:5]}-{value[:2]}"
+    return None
+
+
+def _compile_row_filter(
+    row_filter: Optional[RowFilter],
+    fieldnames: list[str]
+) -> Optional[Callable[[list[str]], bool]]:
+    """
+    Compile a RowFilter into a predicate over raw row values.
+    
+    Args:
+        row_filter: Filter to compile, or None
+        fieldnames: CSV header fields
+        
+    Returns:
+        Predicate taking the raw value list, or None when nothing is filtered
+        
+    Raises:
+        CSVMissingMandatoryFieldError: If a filtered column is not in the header
+    """
+    if row_filter is None:
+        return None
+    
+    checks = []
+    
+    def column_index(name: str) -> int:
+        if name not in fieldnames:
+            logger.error(f"Filtered column not in header: {name}")
+            raise CSVMissingMandatoryFieldError(f"Filtered column not in header: {name}")
+        return fieldnames.index(name)
+    
+    if row_filter.date_from is not None or row_filter.date_to is not None:
+        index = column_index('transaction_date')
+        low = str(row_filter.date_from) if row_filter.date_from is not None else None
+        high = str(row_filter.date_to) if row_filter.date_to is not None else None
+        
+        def check_date(values: list[str]) -> bool:
+            key = _iso_date_key(values[index])
+            if key is None:
+                return False
+            return (low is None or key >= low) and (high is None or key <= high)
+        
+        checks.append(check_date)
+    
+    for name, allowed in (('currency', row_filter.currencies), ('region', row_filter.regions)):
+        if allowed is not None:
+            checks.append(_membership_check(
+                column_index(name), {value.upper() for value in allowed}
+            ))
+    
+    if row_filter.min_amount is not None:
+        index = column_index('amount')
+        min_amount = row_filter.min_amount
+        
+        def check_amount(values: list[str]) -> bool:
+            try:
+                return float(values[index]) >= min_amount
+            except ValueError:
+                return False
+        
+        checks.append(check_amount)
+    
+    def predicate(values: list[str]) -> bool:
+        try:
+            return all(check(values) for check in checks)
+        except IndexError:
+            # Short rows lack the filtered field
+            return False
+    
+    return predicate
+
+
+def _membership_check(index: int, allowed: set[str]) -> Callable[[list[str]], bool]:
+    """Build a check that the value at index is in the allowed set."""
+    def check(values: list[str]) -> bool:
+        return values[index].strip().upper() in allowed
+    return check
+
+
+class QuarantinePolicy(NamedTuple):
+    """
+    Lenient load settings: quarantine bad rows instead of aborting.
+    
+    Empty rows, rows with too many columns, rows holding bytes that are
+    not valid UTF-8 and rows csv.reader cannot parse (such as a field over
+    csv.field_size_limit) are skipped and, when reject_path is set,
+    written there with their line number and reason. Invalid bytes are
+    written back unchanged.
+    The load aborts with CSVErrorRateExceededError once at least min_rows
+    rows were read and the share of rejected rows exceeds max_error_rate.
+    A file shorter than min_rows is checked once its last row was read.
+    """
+    
+    reject_path: Optional[str] = None
+    max_error_rate: float = DEFAULT_MAX_ERROR_RATE
+    min_rows: int = DEFAULT_ERROR_RATE_MIN_ROWS
+
+
+class _Quarantine:
+    """Tracks rejected rows for one lenient load and writes the reject file."""
+    
+    REJECT_HEADER = ['line_number', 'error', 'reason', 'raw_row']
+    
+    def __init__(self, policy: QuarantinePolicy, source: Path) -> None:
+        self.policy = policy
+        self.source = source
+        self.rows_seen = 0
+        self.rejected = 0
+        self._file = None
+        self._writer = None
+    
+    def __enter__(self) -> '_Quarantine':
+        if self.policy.reject_path:
+            self._file = open(
+                self.policy.reject_path, 'w', encoding='utf-8',
+                errors='surrogateescape', newline=''
+            )
+            self._writer = csv.writer(self._file)
+            self._writer.writerow(self.REJECT_HEADER)
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        if self._file is not None:
+            self._file.close()
+        if self.rejected:
+            logger.warning(
+                f"Quarantined {self.rejected} of {self.rows_seen} rows from {self.source}"
+            )
+        # At end of file the whole file was seen, so min_rows no longer applies;
+        # an early exit or an error leaves the rate unknown
+        if exc_info[0] is None:
+            self._check_rate(final=True)
+    
+    def accept(self) -> None:
+        """Count a row that passed the checks."""
+        self.rows_seen += 1
+        # Accepted rows only lower the rate, so only the min_rows threshold matters
+        if self.rows_seen == self.policy.min_rows:
+            self._check_rate()
+    
+    def reject(self, row_num: int, values: list[str], error: Exception) -> None:
+        """Count and record a row that failed the checks."""
+        self.rows_seen += 1
+        self.rejected += 1
+        if self._writer is not None:
+            raw_row = io.StringIO()
+            csv.writer(raw_row).writerow(values)
+            self._writer.writerow([
+                row_num, type(error).__name__, str(error), raw_row.getvalue().rstrip('\r\n')
+            ])
+        self._check_rate()
+    
+    def _check_rate(self, final: bool = False) -> None:
+        """Abort once enough rows, or the whole file, were read and too many rejected."""
+        if self.rows_seen == 0 or (self.rows_seen < self.policy.min_rows and not final):
+            return
+        rate = self.rejected / self.rows_seen
+        if rate > self.policy.max_error_rate:
+            logger.error(
+                f"Rejected {self.rejected} of {self.rows_seen} rows ({rate:.2%}), "
+                f"above max error rate {self.policy.max_error_rate:.2%}"
+            )
+            raise CSVErrorRateExceededError(
+                f"Rejected {self.rejected} of {self.rows_seen} rows from {self.source}, "
+                f"above max error rate {self.policy.max_error_rate:.2%}"
+            )
+
+
+# Columns parsed once at load time when typed=True
+TYPED_COLUMNS = {
+    'transaction_date': parse_date_cached,
+    'amount': float,
+    'risk_score': float,
+}
+
+
+def _apply_types(row: TransactionLike) -> TransactionLike:
+    """
+    Replace raw strings of typed columns with parsed values, in place.
+    
+    Values that fail to parse are left as raw strings, so a typed value
+    means the field parsed and a string means later stages must report it.
+    
+    Args:
+        row: Row dictionary or Transaction with raw string values
+        
+    Returns:
+        The same row
+    """
+    for name, parse in TYPED_COLUMNS.items():
+        value = row.get(name)
+        if value:
+            try:
+                row[name] = parse(value)
+            except ValueError:
+                pass
+    return row
+
+
+def iter_csv(
+    path: str,
+    columns: Optional[list[str]] = None,
+    row_filter: Optional[RowFilter] = None,
+    typed: bool = False,
+    as_records: bool = False,
+    quarantine: Optional[QuarantinePolicy] = None,
+    read_ahead: bool = False
+) -> Iterator[TransactionLike]:
+    """
+    Stream CSV rows one by one as dictionaries.
+    
+    Performs the same header, mandatory column, empty row and column
+    count checks as load_csv, but only keeps one row in memory at a time.
+    
+    Args:
+        path: Path to CSV file
+        columns: Optional list of columns to keep in each row
+        row_filter: Optional predicates rows must satisfy to be yielded
+        typed: Parse amount, risk_score and transaction_date once at load time
+        as_records: Yield compact Transaction records instead of dictionaries
+        quarantine: Skip and record bad rows instead of raising on them
+        read_ahead: Read and decode the next block in a background thread
+        
+    Yields:
+        Dictionary (or Transaction) for each data row
+        
+    Raises:
+        CSVFileNotFoundError: If file doesn't exist
+        CSVMissingMandatoryFieldError: If mandatory or requested columns are missing
+        CSVColumnMismatchError: If row has wrong column count (strict mode)
+        CSVEmptyRowError: If empty rows are detected (strict mode)
+        CSVErrorRateExceededError: If a lenient load rejects too many rows
+    """
+    file_path = _resolve_path(path)
+    return (
+        row
+        for _, row in _iter_numbered_rows(
+            file_path, columns, row_filter, typed, as_records, quarantine, read_ahead
+        )
+    )
+
+
+def _iter_numbered_rows(
+    file_path: Path,
+    columns: Optional[list[str]] = None,
+    row_filter: Optional[RowFilter] = None,
+    typed: bool = False,
+    as_records: bool = False,
+    quarantine: Optional[QuarantinePolicy] = None,
+    read_ahead: bool = False
+) -> Iterator[tuple[int, TransactionLike]]:
+    """
+    Generator yielding (line number, row) pairs for an existing CSV file.
+    
+    Rows are checked and filtered on their raw values, and only the
+    projected columns are copied into the row dictionary.
+    
+    Args:
+        file_path: Path to an existing CSV file
+        columns: Optional list of columns to keep in each row
+        row_filter: Optional predicates rows must satisfy to be yielded
+        typed: Parse typed columns once at load time
+        as_records: Build Transaction records instead of dictionaries
+        quarantine: Skip and record bad rows instead of raising on them
+        read_ahead: Read and decode the next block in a background thread
+        
+    Yields:
+        Tuple of line number and row
+    """
+    logger.info(f"Streaming CSV from: {file_path}")
+    
+    rejects = _Quarantine(quarantine, file_path) if quarantine is not None else None
+    # Lenient loads keep undecodable bytes as surrogates and reject their rows
+    errors = 'strict' if rejects is None else 'surrogateescape'
+    
+    try:
+        source = (
+            _ReadAheadLines(_open_binary(file_path), errors=errors)
+            if read_ahead else _open_text(file_path, errors)
+        )
+        with source as csvfile, rejects or nullcontext():
+            reader = csv.reader(csvfile)
+            fieldnames = next(reader, None)
+            _verify_headers(fieldnames)
+            field_count = len(fieldnames)
+            projection = _project_indices(fieldnames, columns)
+            predicate = _compile_row_filter(row_filter, fieldnames)
+            record_fields = projection or list(zip(fieldnames, range(field_count)))
+            # Rows of the standard layout can fill the record slots positionally
+            positional = projection is None and tuple(fieldnames) == CSV_FIELDS
+            
+            row_num = 1  # row 1 is header
+            for values in (reader if rejects is None else _recover_csv_errors(reader)):
+                # Blank lines are skipped, as csv.DictReader does
+                if not values:
+                    continue
+                row_num += 1
+                
+                if rejects is not None:
+                    if isinstance(values, csv.Error):
+                        rejects.reject(row_num, [], values)
+                        continue
+                    error = _decode_error(values)
+                    if error is not None:
+                        rejects.reject(row_num, values, error)
+                        continue
+                
+                if not any(values) or len(values) > field_count:
+                    try:
+                        _check_row(_values_to_row(fieldnames, values), row_num, field_count)
+                    except (CSVEmptyRowError, CSVColumnMismatchError) as e:
+                        if rejects is None:
+                            raise
+                        rejects.reject(row_num, values, e)
+                        continue
+                if rejects is not None:
+                    rejects.accept()
+                
+                if predicate is not None and not predicate(values):
+                    continue
+                
+                if as_records and positional and len(values) == field_count:
+                    row = Transaction.from_values(values)
+                elif as_records:
+                    row = Transaction.from_items(
+                        (name, values[index] if index < len(values) else None)
+                        for name, index in record_fields
+                    )
+                elif projection is None:
+                    row = _values_to_row(fieldnames, values)
+                else:
+                    value_count = len(values)
+                    row = {
+                        name: values[index] if index < value_count else None
+                        for name, index in projection
+                    }
+                if typed:
+                    _apply_types(row)
+                yield row_num, row
+    
+    except (CSVFileNotFoundError, CSVEmptyRowError, CSVColumnMismatchError,
+            CSVMissingMandatoryFieldError, CSVErrorRateExceededError):
+        raise
+    except Exception as e:
+        logger.error(f"Unexpected error reading CSV: {e}")
+        raise
+
+
+def _recover_csv_errors(reader: Iterator[list[str]]) -> Iterator[Union[list[str], csv.Error]]:
+    """Yield parsed rows, and the csv.Error in place of a row the reader rejected."""
+    while True:
+        try:
+            yield next(reader)
+        except StopIteration:
+            return
+        except csv.Error as e:
+            yield e
+
+
+def _decode_error(values: list[str]) -> Optional[UnicodeDecodeError]:
+    """
+    Find bytes that are not valid UTF-8 in a row decoded with surrogateescape.
+    
+    Args:
+        values: Parsed row values
+        
+    Returns:
+        The UnicodeDecodeError strict decoding would raise, or None
+    """
+    text = ','.join(values)
+    if text.isascii():
+        return None
+    try:
+        text.encode('utf-8', 'surrogateescape').decode('utf-8')
+    except UnicodeDecodeError as e:
+        return e
+    return None
+
+
+def _read_record(stream: BinaryIO) -> bytes:
+    """Read one CSV record, joining lines while a quoted field is still open."""
+    record = stream.readline()
+    while record.count(b'"') % 2:
+        more = stream.readline()
+        if not more:
+            break
+        record += more
+    return record
+
+
+def iter_csv_with_offsets(
+    path: str,
+    start_offset: int = 0,
+    start_row: int = 1,
+    typed: bool = False
+) -> Iterator[tuple[int, int, dict[str, Any]]]:
+    """
+    Stream CSV rows together with the byte offset just past each row.
+    
+    Passing a previously yielded offset and row number as start_offset and
+    start_row resumes reading right after that row, which lets long runs
+    checkpoint their input position. Rows are checked the same way as in
+    load_csv.
+    
+    Args:
+        path: Path to CSV file
+        start_offset: Byte offset to resume from (0 starts after the header)
+        start_row: Row number of the last row before start_offset (1 is the header)
+        typed: Parse amount, risk_score and transaction_date once at load time
+        
+    Yields:
+        Tuple of row number, byte offset after the row, and row dictionary
+        
+    Raises:
+        CSVFileNotFoundError: If file doesn't exist
+        CSVMissingMandatoryFieldError: If mandatory columns are missing
+        CSVColumnMismatchError: If row has wrong column count
+        CSVEmptyRowError: If empty rows are detected
+    """
+    file_path = _resolve_path(path)
+    return _iter_offset_rows(file_path, start_offset, start_row, typed)
+
+
+def _iter_offset_rows(
+    file_path: Path,
+    start_offset: int,
+    start_row: int,
+    typed: bool
+) -> Iterator[tuple[int, int, dict[str, Any]]]:
+    """Generator backing iter_csv_with_offsets once the file is known to exist."""
+    with _open_binary(file_path) as f:
+        header = _read_record(f)
+        fieldnames = next(csv.reader([header.decode('utf-8')]), None) if header.strip() else None
+        _verify_headers(fieldnames)
+        field_count = len(fieldnames)
+        
+        offset = f.tell()
+        if start_offset:
+            f.seek(start_offset)
+            offset = start_offset
+            logger.info(f"Resuming {file_path} at byte {offset}, after row {start_row}")
+        
+        row_num = start_row
+        while True:
+            record = _read_record(f)
+            if not record:
+                break
+            offset += len(record)
+            
+            values = next(csv.reader([record.decode('utf-8')]), [])
+            # Blank lines are skipped, as csv.DictReader does
+            if not values:
+                continue
+            row_num += 1
+            
+            row = _values_to_row(fieldnames, values)
+            _check_row(row, row_num, field_count)
+            if typed:
+                _apply_types(row)
+            yield row_num, offset, row
+
+
+def load_csv_batches(
+    path: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    columns: Optional[list[str]] = None,
+    row_filter: Optional[RowFilter] = None,
+    typed: bool = False,
+    as_records: bool = False,
+    quarantine: Optional[QuarantinePolicy] = None,
+    read_ahead: bool = False
+) -> Iterator[tuple[int, list[TransactionLike]]]:
+    """
+    Stream CSV rows in fixed-size batches.
+    
+    Every batch except possibly the last one holds exactly batch_size rows.
+    Rows are checked the same way as in load_csv.
+    
+    Args:
+        path: Path to CSV file
+        batch_size: Number of rows per batch
+        columns: Optional list of columns to keep in each row
+        row_filter: Optional predicates rows must satisfy to be included
+        typed: Parse amount, risk_score and transaction_date once at load time
+        as_records: Yield compact Transaction records instead of dictionaries
+        quarantine: Skip and record bad rows instead of raising on them
+        read_ahead: Read and decode the next block in a background thread
+        
+    Yields:
+        Tuple of starting line number and list of rows
+        
+    Raises:
+        ValueError: If batch_size is not positive
+        CSVFileNotFoundError: If file doesn't exist
+        CSVMissingMandatoryFieldError: If mandatory columns are missing
+        CSVColumnMismatchError: If row has wrong column count (strict mode)
+        CSVEmptyRowError: If empty rows are detected (strict mode)
+        CSVErrorRateExceededError: If a lenient load rejects too many rows
+    """
+    if batch_size <= 0:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+    
+    file_path = _resolve_path(path)
+    return _batch_rows(
+        _iter_numbered_rows(
+            file_path, columns, row_filter, typed, as_records, quarantine, read_ahead
+        ),
+        batch_size
+    )
+
+
+def _batch_rows(
+    numbered_rows: Iterator[tuple[int, TransactionLike]],
+    batch_size: int
+) -> Iterator[tuple[int, list[TransactionLike]]]:
+    """Group (line number, row) pairs into (start line, rows) batches."""
+    batch = []
+    start_line = 0
+    
+    for row_num, row in numbered_rows:
+        if not batch:
+            start_line = row_num
+        batch.append(row)
+        
+        if len(batch) == batch_size:
+            logger.debug(f"Yielding batch of {len(batch)} rows from line {start_line}")
+            yield start_line, batch
+            batch = []
+    
+    if batch:
+        logger.debug(f"Yielding batch of {len(batch)} rows from line {start_line}")
+        yield start_line, batch
+
+
+async def aload_csv(
+    path: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    columns: Optional[list[str]] = None,
+    row_filter: Optional[RowFilter] = None,
+    typed: bool = False,
+    as_records: bool = False,
+    quarantine: Optional[QuarantinePolicy] = None
+) -> AsyncIterator[tuple[int, list[TransactionLike]]]:
+    """
+    Asynchronously stream CSV rows in fixed-size batches.
     
+    File reads and parsing run in a worker thread, never on the event loop.
+    The next batch is read while the caller awaits on the current one, so
+    async enrichment of a batch overlaps with reading the next. Batches
+    and checks are the same as in load_csv_batches.
+    
+    Args:
+        path: Path to CSV file
+        batch_size: Number of rows per batch
+        columns: Optional list of columns to keep in each row
+        row_filter: Optional predicates rows must satisfy to be included
+        typed: Parse amount, risk_score and transaction_date once at load time
+        as_records: Yield compact Transaction records instead of dictionaries
+        quarantine: Skip and record bad rows instead of raising on them
+        
+    Yields:
+        Tuple of starting line number and list of rows
+        
+    Raises:
+        ValueError: If batch_size is not positive
+        CSVFileNotFoundError: If file doesn't exist
+        CSVMissingMandatoryFieldError: If mandatory columns are missing
+        CSVColumnMismatchError: If row has wrong column count (strict mode)
+        CSVEmptyRowError: If empty rows are detected (strict mode)
+        CSVErrorRateExceededError: If a lenient load rejects too many rows
+    """
+    batches = load_csv_batches(
+        path, batch_size, columns, row_filter, typed, as_records, quarantine
+    )
+    # Keep the concurrent future: cancelling an asyncio wrapper of it does
+    # not stop the worker thread, so only this future tells when it is done
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='aload-csv')
+    pending = executor.submit(next, batches, None)
+    
+    try:
+        while True:
+            batch = await asyncio.wrap_future(pending)
+            if batch is None:
+                return
+            # Start reading the next batch before handing this one to the caller
+            pending = executor.submit(next, batches, None)
+            yield batch
+    finally:
+        # The generator must not be closed while the worker thread is running it
+        cancelled = False
+        while not pending.done():
+            try:
+                await asyncio.wait([asyncio.wrap_future(pending)])
+            except asyncio.CancelledError:
+                cancelled = True
+        if not pending.cancelled():
+            pending.exception()  # mark a read error after early exit as retrieved
+        batches.close()
+        executor.shutdown(wait=False)
+        if cancelled:
+            raise asyncio.CancelledError()
+
+
+def load_csv(
+    path: str,
+    columns: Optional[list[str]] = None,
+    row_filter: Optional[RowFilter] = None,
+    typed: bool = False,
+    as_records: bool = False,
+    quarantine: Optional[QuarantinePolicy] = None
+) -> list:
+    """
+    Load CSV file and convert to list of dictionaries.
+    
+    Mandatory columns are always checked against the header, even when
+    columns restricts which fields are kept in each row. With typed=True,
+    amount and risk_score are loaded as floats and transaction_date as a
+    date; fields that fail to parse keep their raw string so the validator
+    still reports them. Validator, cleaner and transformer reuse typed
+    values instead of parsing them again.
+    
+    Args:
+        path: Path to CSV file
+        columns: Optional list of columns to keep in each row
+        row_filter: Optional predicates rows must satisfy to be loaded
+        typed: Parse typed columns once at load time
+        as_records: Return compact Transaction records instead of dictionaries
+        quarantine: Skip and record bad rows instead of raising on them
+        
+    Returns:
+        List of dictionaries (or Transaction records) containing CSV data
+        
+    Raises:
+        CSVFileNotFoundError: If file doesn't exist
+        CSVMissingMandatoryFieldError: If mandatory columns are missing
+        CSVColumnMismatchError: If row has wrong column count (strict mode)
+        CSVEmptyRowError: If empty rows are detected (strict mode)
+        CSVErrorRateExceededError: If a lenient load rejects too many rows
+    """
     logger.info(f"Loading CSV from: {path}")
     
+    rows = list(iter_csv(path, columns, row_filter, typed, as_records, quarantine))
+    
+    logger.info(f"Successfully loaded {len(rows)} rows from CSV")
+    return rows
+
+
+def _read_header(file_path: Path) -> tuple[Optional[list[str]], int]:
+    """
+    Read the CSV header line directly from the raw file.
+    
+    Args:
+        file_path: Path to an existing CSV file
+        
+    Returns:
+        Tuple of header fields (None if file is empty) and byte offset
+        where data rows start
+    """
+    with open(file_path, 'rb') as f:
+        header_line = _read_record(f)
+        data_start = f.tell()
+    
+    if not header_line.strip():
+        return None, data_start
+    
+    fieldnames = next(csv.reader([header_line.decode('utf-8')]))
+    return fieldnames, data_start
+
+
+def _plan_partitions(
+    file_path: Path,
+    data_start: int,
+    partitions: int,
+    min_partition_bytes: int
+) -> list[tuple[int, int]]:
+    """
+    Split the data section of a CSV file into record-aligned byte ranges.
+    
+    Quote characters are counted from the start of the data section, as
+    csv_file_stats does, so a line break inside a quoted field is never
+    taken as a boundary.
+    
+    Args:
+        file_path: Path to an existing CSV file
+        data_start: Byte offset of the first data row
+        partitions: Desired number of partitions
+        min_partition_bytes: Smallest allowed partition size
+        
+    Returns:
+        List of (start, end) byte offsets covering the data section
+    """
+    file_size = file_path.stat().st_size
+    data_size = file_size - data_start
+    if data_size <= 0:
+        return []
+    
+    partitions = max(1, min(partitions, data_size // max(1, min_partition_bytes)))
+    step = data_size // partitions
+    
+    boundaries = [data_start]
+    quotes = 0  # quote characters between data_start and the read position
+    with open(file_path, 'rb') as f:
+        f.seek(data_start)
+        for i in range(1, partitions):
+            target = data_start + i * step
+            while f.tell() < target:
+                block = f.read(min(COUNT_BLOCK_SIZE, target - f.tell()))
+                if not block:
+                    break
+                quotes += block.count(b'"')
+            
+            # Move to the next line break outside quotes so no row is split
+            for line in iter(f.readline, b''):
+                quotes += line.count(b'"')
+                if quotes % 2 == 0:
+                    break
+            boundary = min(f.tell(), file_size)
+            if boundary > boundaries[-1]:
+                boundaries.append(boundary)
+    boundaries.append(file_size)
+    
+    return [
+        (start, end)
+        for start, end in zip(boundaries, boundaries[1:])
+        if end > start
+    ]
+
+
+def _parse_partition(
+    path: str,
+    start: int,
+    end: int,
+    fieldnames: list[str],
+    columns: Optional[list[str]],
+    row_filter: Optional[RowFilter],
+    typed: bool
+) -> tuple[list[dict[str, Any]], int, Optional[list[str]]]:
+    """
+    Parse one byte range of a CSV file into finished rows in a worker process.
+    
+    All per-row work (checks, filtering, projection, typing and building
+    the dictionaries) happens here, so the parent only unpickles rows.
+    Repeated values are shared between rows, which lets pickle send each
+    distinct string once per partition and keeps unpickling cheap.
+    Parsing stops at the first empty or over-long row.
+    
+    Args:
+        path: Path to CSV file
+        start: Byte offset of the first row in the range
+        end: Byte offset just past the last row in the range
+        fieldnames: CSV header fields
+        columns: Optional list of columns to keep in each row
+        row_filter: Optional predicates rows must satisfy to be kept
+        typed: Parse typed columns once at load time
+        
+    Returns:
+        Tuple of kept rows, number of non-blank rows read and the values
+        of the bad row (None if all rows passed)
+    """
+    with open(path, 'rb') as f:
+        f.seek(start)
+        text = f.read(end - start).decode('utf-8')
+    
+    field_count = len(fieldnames)
+    projection = _project_indices(fieldnames, columns)
+    predicate = _compile_row_filter(row_filter, fieldnames)
+    shared = {}.setdefault
+    
     rows = []
+    rows_read = 0
+    for values in csv.reader(io.StringIO(text, newline='')):
+        # csv.DictReader skips blank lines, so do the same here
+        if not values:
+            continue
+        rows_read += 1
+        if not any(values) or len(values) > field_count:
+            return rows, rows_read, values
+        
+        if predicate is not None and not predicate(values):
+            continue
+        
+        value_count = len(values)
+        if projection is None:
+            row = _values_to_row(fieldnames, [shared(value, value) for value in values])
+        else:
+            row = {
+                name: shared(values[index], values[index]) if index < value_count else None
+                for name, index in projection
+            }
+        if typed:
+            _apply_types(row)
+        rows.append(row)
     
-    try:
-        with open(file_path, 'r', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
+    return rows, rows_read, None
+
+
+def iter_csv_parallel(
+    path: str,
+    workers: Optional[int] = None,
+    min_partition_bytes: int = DEFAULT_MIN_PARTITION_BYTES,
+    columns: Optional[list[str]] = None,
+    row_filter: Optional[RowFilter] = None,
+    typed: bool = False
+) -> Iterator[dict[str, Any]]:
+    """
+    Stream CSV rows parsed in parallel across a process pool.
+    
+    The file is split into byte ranges aligned on record boundaries and
+    each range is parsed, checked, filtered and built into rows in a
+    separate process. Rows are yielded in their original order, and error
+    messages report the same line numbers as load_csv. Boundaries are
+    planned with quote parity, so quoted fields may contain line breaks
+    as long as quote characters only appear as RFC 4180 quoting.
+    Compressed files cannot be split by byte range and are read
+    sequentially instead.
+    
+    Args:
+        path: Path to CSV file
+        workers: Number of worker processes (defaults to CPU count)
+        min_partition_bytes: Smallest byte range handed to a worker
+        columns: Optional list of columns to keep in each row
+        row_filter: Optional predicates rows must satisfy to be yielded
+        typed: Parse amount, risk_score and transaction_date once at load time
+        
+    Yields:
+        Dictionary for each data row
+        
+    Raises:
+        CSVFileNotFoundError: If file doesn't exist
+        CSVMissingMandatoryFieldError: If mandatory or requested columns are missing
+        CSVColumnMismatchError: If row has wrong column count
+        CSVEmptyRowError: If empty rows are detected
+    """
+    file_path = _resolve_path(path)
+    return _iter_partitioned_rows(
+        file_path,
+        workers or os.cpu_count() or 1,
+        min_partition_bytes,
+        columns,
+        row_filter,
+        typed
+    )
+
+
+def _iter_partitioned_rows(
+    file_path: Path,
+    workers: int,
+    min_partition_bytes: int,
+    columns: Optional[list[str]],
+    row_filter: Optional[RowFilter],
+    typed: bool
+) -> Iterator[dict[str, Any]]:
+    """Generator backing iter_csv_parallel once the file is known to exist."""
+    if _detect_compression(file_path) is not None:
+        logger.warning(
+            f"Compressed input cannot be partitioned, reading sequentially: {file_path}"
+        )
+        for _, row in _iter_numbered_rows(file_path, columns, row_filter, typed):
+            yield row
+        return
+    
+    fieldnames, data_start = _read_header(file_path)
+    _verify_headers(fieldnames)
+    field_count = len(fieldnames)
+    # Resolve columns here so a bad request fails before any worker starts
+    _project_indices(fieldnames, columns)
+    _compile_row_filter(row_filter, fieldnames)
+    
+    ranges = _plan_partitions(
+        file_path, data_start, workers * 4, min_partition_bytes
+    )
+    logger.info(
+        f"Parsing {file_path} in {len(ranges)} partitions "
+        f"with {workers} workers"
+    )
+    
+    row_num = 2  # row 1 is header
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        def submit(start: int, end: int) -> Future:
+            return executor.submit(
+                _parse_partition, str(file_path), start, end,
+                fieldnames, columns, row_filter, typed
+            )
+        
+        pending = deque()
+        remaining = iter(ranges)
+        
+        # Keep a bounded window of partitions in flight to cap memory use
+        for start, end in islice(remaining, workers * 2):
+            pending.append(submit(start, end))
+        
+        while pending:
+            rows, rows_read, bad_values = pending.popleft().result()
             
-            # Check if headers exist
-            if reader.fieldnames is None:
-                logger.error("CSV file has no headers")
-                raise CSVMissingMandatoryFieldError("CSV file has no headers")
+            for start, end in islice(remaining, 1):
+                pending.append(submit(start, end))
             
-            # Check mandatory columns
-            headers_set = set(reader.fieldnames)
-            missing_columns = mandatory_columns - headers_set
+            yield from rows
             
-            if missing_columns:
-                logger.error(f"Missing mandatory columns: {missing_columns}")
-                raise CSVMissingMandatoryFieldError(
-                    f"Missing mandatory columns: {missing_columns}"
+            if bad_values is not None:
+                for future in pending:
+                    future.cancel()
+                _check_row(
+                    _values_to_row(fieldnames, bad_values),
+                    row_num + rows_read - 1,
+                    field_count
                 )
+            row_num += rows_read
+
+
+def load_csv_parallel(
+    path: str,
+    workers: Optional[int] = None,
+    min_partition_bytes: int = DEFAULT_MIN_PARTITION_BYTES,
+    columns: Optional[list[str]] = None,
+    row_filter: Optional[RowFilter] = None,
+    typed: bool = False
+) -> list:
+    """
+    Load CSV file using parallel byte-range parsing.
+    
+    Args:
+        path: Path to CSV file
+        workers: Number of worker processes (defaults to CPU count)
+        min_partition_bytes: Smallest byte range handed to a worker
+        columns: Optional list of columns to keep in each row
+        row_filter: Optional predicates rows must satisfy to be returned
+        typed: Parse amount, risk_score and transaction_date once at load time
+        
+    Returns:
+        List of dictionaries containing CSV data, in file order
+        
+    Raises:
+        CSVFileNotFoundError: If file doesn't exist
+        CSVMissingMandatoryFieldError: If mandatory or requested columns are missing
+        CSVColumnMismatchError: If row has wrong column count
+        CSVEmptyRowError: If empty rows are detected
+    """
+    logger.info(f"Loading CSV in parallel from: {path}")
+    
+    rows = list(iter_csv_parallel(
+        path, workers, min_partition_bytes, columns, row_filter, typed
+    ))
+    
+    logger.info(f"Successfully loaded {len(rows)} rows from CSV")
+    return rows
+
+
+class CategoricalColumn(NamedTuple):
+    """Int-coded column: codes index into the list of distinct categories."""
+    
+    codes: array
+    categories: list[str]
+    
+    def __len__(self) -> int:
+        return len(self.codes)
+    
+    def decode(self) -> list[str]:
+        """Return the column as a list of category strings."""
+        categories = self.categories
+        return [categories[code] for code in self.codes]
+
+
+def _parse_float_or_nan(value: Optional[str]) -> float:
+    """Parse a numeric CSV field, returning NaN for empty or invalid values."""
+    if value is None:
+        return math.nan
+    try:
+        return float(value)
+    except ValueError:
+        logger.debug(f"Could not parse numeric value in columnar load: {value}")
+        return math.nan
+
+
+def load_csv_columnar(
+    path: str,
+    columns: Optional[list[str]] = None,
+    row_filter: Optional[RowFilter] = None
+) -> dict[str, Any]:
+    """
+    Load CSV file into one typed column per header field.
+    
+    Numeric columns (amount, risk_score) are stored as array('d') with NaN
+    for empty or non-numeric values. Low-cardinality columns (currency,
+    region, channel, etc.) are stored as CategoricalColumn. All other
+    columns are plain lists of strings. Rows are checked the same way as
+    in load_csv.
+    
+    Args:
+        path: Path to CSV file
+        columns: Optional list of columns to load
+        row_filter: Optional predicates rows must satisfy to be loaded
+        
+    Returns:
+        Dictionary mapping column name to its column values
+        
+    Raises:
+        CSVFileNotFoundError: If file doesn't exist
+        CSVMissingMandatoryFieldError: If mandatory columns are missing
+        CSVColumnMismatchError: If row has wrong column count
+        CSVEmptyRowError: If empty rows are detected
+    """
+    file_path = _resolve_path(path)
+    logger.info(f"Loading CSV in columnar mode from: {path}")
+    
+    loaded = None
+    appenders = []
+    row_count = 0
+    
+    for _, row in _iter_numbered_rows(file_path, columns, row_filter):
+        if loaded is None:
+            loaded, appenders = _make_columns(list(row.keys()))
+        for name, append in appenders:
+            append(row[name])
+        row_count += 1
+    
+    if loaded is None:
+        fieldnames = columns if columns is not None else _read_fieldnames(file_path)
+        loaded, _ = _make_columns(fieldnames)
+    
+    logger.info(f"Successfully loaded {row_count} rows into {len(loaded)} columns")
+    return loaded
+
+
+def _make_columns(fieldnames: list[str]) -> tuple[dict[str, Any], list]:
+    """
+    Create empty typed columns and per-column append functions.
+    
+    Args:
+        fieldnames: CSV header fields
+        
+    Returns:
+        Tuple of column dictionary and list of (field name, append function)
+    """
+    columns = {}
+    appenders = []
+    
+    for name in fieldnames:
+        if name in FLOAT_COLUMNS:
+            values = array('d')
+            columns[name] = values
+            appenders.append(
+                (name, lambda value, append=values.append: append(_parse_float_or_nan(value)))
+            )
+        
+        elif name in CATEGORICAL_COLUMNS:
+            column = CategoricalColumn(array('i'), [])
+            columns[name] = column
+            appenders.append((name, _categorical_appender(column)))
+        
+        else:
+            values = []
+            columns[name] = values
+            appenders.append((name, values.append))
+    
+    return columns, appenders
+
+
+def _categorical_appender(column: CategoricalColumn) -> Callable[[Optional[str]], None]:
+    """Build an append function that int-codes values into a CategoricalColumn."""
+    lookup = {}
+    categories = column.categories
+    append_code = column.codes.append
+    
+    def append(value: Optional[str]) -> None:
+        value = value or ''
+        code = lookup.get(value)
+        if code is None:
+            code = len(categories)
+            lookup[value] = code
+            categories.append(value)
+        append_code(code)
+    
+    return append
+
+
+def iter_csv_mmap(
+    path: str,
+    columns: Optional[list[str]] = None
+) -> Iterator[dict[str, Any]]:
+    """
+    Stream CSV rows from a memory-mapped file, decoding it block by block.
+    
+    The mapping is processed in blocks of whole lines. A block without
+    quotes is copied, decoded at once and split into lines and fields with
+    str methods, which is faster than csv.reader. A block containing
+    quotes is parsed record by record with csv.reader, which also consumes
+    the continuation lines of quoted fields with embedded line breaks. Rows
+    are checked the same way as in load_csv. Compressed files cannot be
+    mapped and are read with iter_csv instead.
+    
+    With columns, each row is projected after it was split, so every field
+    is still decoded; the projection only saves building unused keys.
+    
+    Args:
+        path: Path to CSV file
+        columns: Optional list of columns to keep in each row
+        
+    Yields:
+        Dictionary for each data row
+        
+    Raises:
+        CSVFileNotFoundError: If file doesn't exist
+        CSVMissingMandatoryFieldError: If mandatory or requested columns are missing
+        CSVColumnMismatchError: If row has wrong column count
+        CSVEmptyRowError: If empty rows are detected
+    """
+    file_path = _resolve_path(path)
+    
+    if _detect_compression(file_path) is not None:
+        logger.warning(f"Compressed input cannot be memory-mapped, streaming instead: {path}")
+        return iter_csv(path, columns)
+    
+    return _iter_mmap_rows(file_path, columns)
+
+
+def _read_quoted_record(first_line: bytes, readline: Callable[[], bytes]) -> list[str]:
+    """
+    Parse one CSV record that starts on a line containing quotes.
+    
+    csv.reader pulls continuation lines only while a quoted field is still
+    open, so embedded line breaks stay inside their field and a quote in
+    the middle of an unquoted field is taken literally, as in iter_csv.
+    """
+    def lines() -> Iterator[str]:
+        yield first_line.decode('utf-8')
+        for line in iter(readline, b''):
+            yield line.decode('utf-8')
+    
+    return next(csv.reader(lines()), [])
+
+
+def _mmap_block_end(mm: mmap.mmap, pos: int, size: int) -> int:
+    """Return the end of a block of whole lines starting at pos."""
+    if pos + MMAP_BLOCK_SIZE >= size:
+        return size
+    newline = mm.rfind(b'\n', pos, pos + MMAP_BLOCK_SIZE)
+    if newline == -1:
+        newline = mm.find(b'\n', pos + MMAP_BLOCK_SIZE)
+    return size if newline == -1 else newline + 1
+
+
+def _iter_mmap_rows(
+    file_path: Path,
+    columns: Optional[list[str]]
+) -> Iterator[dict[str, Any]]:
+    """Generator backing iter_csv_mmap once the file is known to exist."""
+    logger.info(f"Memory-mapping CSV from: {file_path}")
+    
+    if file_path.stat().st_size == 0:
+        _verify_headers(None)
+    
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        readline = mm.readline
+        
+        fieldnames = _read_quoted_record(readline(), readline) or None
+        _verify_headers(fieldnames)
+        field_count = len(fieldnames)
+        projection = _project_indices(fieldnames, columns)
+        
+        def make_row(values: list[str], row_num: int) -> dict[str, Any]:
+            if not any(values) or len(values) > field_count:
+                _check_row(_values_to_row(fieldnames, values), row_num, field_count)
+            if projection is None:
+                return _values_to_row(fieldnames, values)
+            value_count = len(values)
+            return {
+                name: values[index] if index < value_count else None
+                for name, index in projection
+            }
+        
+        size = len(mm)
+        pos = mm.tell()
+        row_num = 1  # row 1 is header
+        while pos < size:
+            block_end = _mmap_block_end(mm, pos, size)
             
-            logger.info(f"CSV headers verified. Found columns: {reader.fieldnames}")
+            if mm.find(b'"', pos, block_end) != -1:
+                # Quoted fields may span lines: parse this block record by record
+                mm.seek(pos)
+                while mm.tell() < block_end:
+                    line = readline()
+                    if b'"' in line:
+                        values = _read_quoted_record(line, readline)
+                    else:
+                        line = line.rstrip(b'\r\n')
+                        values = line.decode('utf-8').split(',') if line else []
+                    # Blank lines are skipped, as csv.DictReader does
+                    if values:
+                        row_num += 1
+                        yield make_row(values, row_num)
+                pos = mm.tell()
+                continue
             
-            # Read rows
-            for row_num, row in enumerate(reader, start=2):  # start=2 because row 1 is header
-                # Check for empty rows
-                if not any(row.values()):
-                    logger.warning(f"Empty row detected at line {row_num}")
-                    raise CSVEmptyRowError(f"Empty row detected at line {row_num}")
+            # No quotes: decode the whole block and split lines and fields in C
+            for line in mm[pos:block_end].decode('utf-8').split('\n'):
+                if line.endswith('\r'):
+                    line = line[:-1]
+                if not line:
+                    continue
+                row_num += 1
+                values = line.split(',')
                 
-                # Check column count
-                if len(row) != len(reader.fieldnames):
-                    logger.error(
-                        f"Row {row_num} has {len(row)} columns, "
-                        f"expected {len(reader.fieldnames)}"
-                    )
-                    raise CSVColumnMismatchError(
-                        f"Row {row_num} has wrong column count"
-                    )
+                if len(values) != field_count or line[0] == ',':
+                    yield make_row(values, row_num)
+                elif projection is None:
+                    yield dict(zip(fieldnames, values))
+                else:
+                    yield {name: values[index] for name, index in projection}
+            pos = block_end
+
+
+class FileStats(NamedTuple):
+    """Line-level statistics of a CSV file gathered without parsing rows."""
+    
+    bytes_read: int
+    lines: int
+    data_rows: int
+    blank_lines: int
+    quoted_line_breaks: int
+
+
+_NEWLINE_RUN = re.compile(rb'\n{2,}')
+
+
+def csv_file_stats(path: str) -> FileStats:
+    """
+    Gather row counts of a CSV file using large binary block reads.
+    
+    Line breaks inside quoted fields are not counted as row ends, and blank
+    lines (which csv readers skip) are reported separately, so data_rows
+    matches the number of rows load_csv would return for a valid file.
+    Compressed files are decompressed on the fly.
+    
+    Args:
+        path: Path to CSV file
+        
+    Returns:
+        FileStats with byte, line, data row, blank line and quoted line break counts
+        
+    Raises:
+        CSVFileNotFoundError: If file doesn't exist
+    """
+    file_path = _resolve_path(path)
+    
+    bytes_read = 0
+    newlines = 0
+    blank_lines = 0
+    quoted_line_breaks = 0
+    in_quote = False
+    # A virtual line break before the file start lets a leading blank line count
+    tail = b'\n'
+    last_byte = b''
+    
+    with _open_binary(file_path) as f:
+        for block in iter(lambda: f.read(COUNT_BLOCK_SIZE), b''):
+            bytes_read += len(block)
+            last_byte = block[-1:]
+            
+            if not in_quote and b'"' not in block:
+                segments = [block]
+            else:
+                segments = block.split(b'"')
+            
+            for position, segment in enumerate(segments):
+                if position > 0:
+                    # Every split point is a quote character, which is row content
+                    in_quote = not in_quote
+                    tail = b''
+                
+                if in_quote:
+                    quoted_line_breaks += segment.count(b'\n')
+                    continue
                 
-                rows.append(row)
+                newlines += segment.count(b'\n')
+                text = tail + segment.replace(b'\r\n', b'\n')
+                # Blank lines are rare; a substring test is far cheaper than the regex scan
+                if b'\n\n' in text:
+                    blank_lines += sum(
+                        len(run.group()) - 1 for run in _NEWLINE_RUN.finditer(text)
+                    )
+                tail = b'\n' if text.rstrip(b'\r').endswith(b'\n') else b''
+    
+    lines = newlines + (1 if last_byte and last_byte != b'\n' else 0)
+    non_blank = lines - blank_lines
+    data_rows = max(non_blank - 1, 0)  # first non-blank line is the header
+    
+    logger.info(
+        f"Counted {data_rows} data rows, {blank_lines} blank lines in {path}"
+    )
+    return FileStats(bytes_read, lines, data_rows, blank_lines, quoted_line_breaks)
+
+
+def count_rows(path: str) -> int:
+    """
+    Count data rows of a CSV file without parsing it.
+    
+    Args:
+        path: Path to CSV file
+        
+    Returns:
+        Number of data rows (header and blank lines excluded)
+        
+    Raises:
+        CSVFileNotFoundError: If file doesn't exist
+    """
+    return csv_file_stats(path).data_rows
+
+
+def _reservoir_gap(rng: random.Random, weight: float) -> int:
+    """Number of rows to skip before the next reservoir replacement (Algorithm L)."""
+    return math.floor(math.log(1.0 - rng.random()) / math.log1p(-weight)) + 1
+
+
+def sample_csv(
+    path: str,
+    n: int,
+    seed: Optional[int] = None,
+    columns: Optional[list[str]] = None,
+    typed: bool = False
+) -> list[dict[str, Any]]:
+    """
+    Draw a uniform random sample of rows in a single streaming pass.
+    
+    Uses reservoir sampling with geometric skips (Algorithm L), so memory
+    is O(n) and rows that are skipped are parsed by csv.reader but never
+    built into dictionaries. Every row is still checked as in load_csv.
+    
+    Args:
+        path: Path to CSV file
+        n: Number of rows to sample (all rows if the file has fewer)
+        seed: Seed for a reproducible sample
+        columns: Optional list of columns to keep in each row
+        typed: Parse amount, risk_score and transaction_date in sampled rows
+        
+    Returns:
+        Sampled rows, in file order
+        
+    Raises:
+        ValueError: If n is negative
+        CSVFileNotFoundError: If file doesn't exist
+        CSVMissingMandatoryFieldError: If mandatory or requested columns are missing
+        CSVColumnMismatchError: If row has wrong column count
+        CSVEmptyRowError: If empty rows are detected
+    """
+    if n < 0:
+        raise ValueError(f"n must not be negative, got {n}")
+    
+    file_path = _resolve_path(path)
+    rng = random.Random(seed)
+    reservoir = []  # (row_num, values)
+    
+    logger.info(f"Sampling {n} rows from: {path}")
+    
+    with _open_text(file_path) as csvfile:
+        reader = csv.reader(csvfile)
+        fieldnames = next(reader, None)
+        _verify_headers(fieldnames)
+        field_count = len(fieldnames)
+        projection = _project_indices(fieldnames, columns)
+        
+        weight = math.exp(math.log(1.0 - rng.random()) / n) if n else 0.0
+        next_pick = n + _reservoir_gap(rng, weight) if 0 < weight < 1 else math.inf
+        seen = 0
+        
+        row_num = 1  # row 1 is header
+        for values in reader:
+            # Blank lines are skipped, as csv.DictReader does
+            if not values:
+                continue
+            row_num += 1
+            if not any(values) or len(values) > field_count:
+                _check_row(_values_to_row(fieldnames, values), row_num, field_count)
             
-            logger.info(f"Successfully loaded {len(rows)} rows from CSV")
-            return rows
+            seen += 1
+            if seen <= n:
+                reservoir.append((row_num, values))
+            elif seen == next_pick:
+                reservoir[rng.randrange(n)] = (row_num, values)
+                weight *= math.exp(math.log(1.0 - rng.random()) / n)
+                next_pick = seen + _reservoir_gap(rng, weight) if weight < 1 else math.inf
     
-    except (CSVFileNotFoundError, CSVEmptyRowError, CSVColumnMismatchError, 
-            CSVMissingMandatoryFieldError):
-        raise
-    except Exception as e:
-        logger.error(f"Unexpected error reading CSV: {e}")
-        raise
+    rows = []
+    for _, values in sorted(reservoir, key=lambda item: item[0]):
+        if projection is None:
+            row = _values_to_row(fieldnames, values)
+        else:
+            row = {
+                name: values[index] if index < len(values) else None
+                for name, index in projection
+            }
+        if typed:
+            _apply_types(row)
+        rows.append(row)
+    
+    logger.info(f"Sampled {len(rows)} of {seen} rows")
+    return rows
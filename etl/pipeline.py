@@ -0,0 +1,364 @@
+"""Checkpointed end-to-end pipeline for banking transactions."""
+
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, NamedTuple, Optional
+
+from etl.loader import iter_csv, iter_csv_with_offsets, _resolve_path
+from etl.validator import validate_transaction
+from etl.cleaner import clean_transaction
+from etl.transformer import transform_transaction
+from etl.record import TransactionLike
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECKPOINT_EVERY = 100_000
+CHECKPOINT_VERSION = 2
+
+
+def process_transaction(transaction: TransactionLike) -> TransactionLike:
+    """
+    Run one transaction through validation, cleaning and transformation.
+    
+    Args:
+        transaction: Raw transaction dictionary or Transaction record
+        
+    Returns:
+        Transformed transaction
+        
+    Raises:
+        InvalidTransactionIDError: If transaction ID is invalid
+        InvalidDateFormatError: If date format is invalid
+        InvalidAmountError: If amount is invalid
+        InvalidCurrencyError: If currency is invalid
+    """
+    return transform_transaction(clean_transaction(validate_transaction(transaction)))
+
+
+def _new_counters() -> dict[str, int]:
+    """Return zeroed running counters for a pipeline run."""
+    return {'rows_read': 0, 'successful': 0, 'failed': 0}
+
+
+def _merge_counters(all_counters: list[dict[str, int]]) -> dict[str, int]:
+    """Sum per-file counters into totals."""
+    totals = _new_counters()
+    for counters in all_counters:
+        for key in totals:
+            totals[key] += counters.get(key, 0)
+    return totals
+
+
+def _input_signature(file_path: Path) -> dict[str, int]:
+    """Return size, mtime and inode identifying the current input file."""
+    stat = file_path.stat()
+    return {
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'inode': stat.st_ino,
+    }
+
+
+def _write_json_atomic(path: Path, data: dict[str, Any]) -> None:
+    """Durably replace a JSON file so a crash never leaves it half written."""
+    temp_path = path.with_name(path.name + '.tmp')
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+def load_checkpoint(checkpoint_path: str) -> Optional[dict[str, Any]]:
+    """
+    Read a pipeline checkpoint.
+    
+    Args:
+        checkpoint_path: Path to checkpoint JSON file
+        
+    Returns:
+        Checkpoint dictionary, or None if no checkpoint exists
+    """
+    path = Path(checkpoint_path)
+    if not path.exists():
+        return None
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def run_pipeline(
+    csv_path: str,
+    output_path: str,
+    checkpoint_path: Optional[str] = None,
+    checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
+    resume: bool = False,
+    typed: bool = True
+) -> dict[str, int]:
+    """
+    Process a CSV file into a JSON Lines output file with periodic checkpoints.
+    
+    Every checkpoint_every input rows, the output is flushed and fsynced,
+    then a checkpoint is written. It records the input byte offset, the row
+    number, the output commit position (byte size), the running counters
+    and the input's size, mtime and inode. With resume=True the output is truncated back to the
+    committed position and processing continues after the checkpointed
+    input row, so no row is processed twice or written twice. Rows that
+    fail validation are counted and logged, not written.
+    
+    Args:
+        csv_path: Path to input CSV file
+        output_path: Path to JSON Lines output file
+        checkpoint_path: Checkpoint file (defaults to <output>.checkpoint.json)
+        checkpoint_every: Number of input rows between checkpoints
+        resume: Continue from the last checkpoint instead of starting over
+        typed: Parse typed columns once at load time
+        
+    Returns:
+        Counters with rows_read, successful and failed totals
+        
+    Raises:
+        ValueError: If checkpoint_every is not positive, the checkpoint
+            belongs to a different input file, or the input file was
+            replaced or modified since the checkpoint was written
+        CSVFileNotFoundError: If file doesn't exist
+        CSVMissingMandatoryFieldError: If mandatory columns are missing
+        CSVColumnMismatchError: If row has wrong column count
+        CSVEmptyRowError: If empty rows are detected
+    """
+    if checkpoint_every <= 0:
+        raise ValueError(f"checkpoint_every must be positive, got {checkpoint_every}")
+    
+    input_file = _resolve_path(csv_path).resolve()
+    input_path = str(input_file)
+    input_signature = _input_signature(input_file)
+    output_file = Path(output_path)
+    checkpoint_file = Path(
+        checkpoint_path or output_file.with_name(output_file.name + '.checkpoint.json')
+    )
+    
+    checkpoint = load_checkpoint(str(checkpoint_file)) if resume else None
+    if checkpoint is not None:
+        if checkpoint.get('input_path') != input_path:
+            raise ValueError(
+                f"Checkpoint {checkpoint_file} belongs to {checkpoint.get('input_path')}"
+            )
+        # A replaced or rewritten file at the same path would make the stored
+        # counters and byte offset meaningless
+        if checkpoint.get('input_signature') != input_signature:
+            raise ValueError(
+                f"Input {csv_path} changed since checkpoint {checkpoint_file} was written"
+            )
+        if checkpoint.get('completed'):
+            logger.info(f"Checkpoint marks {csv_path} as completed, nothing to resume")
+            return checkpoint['counters']
+        
+        start_offset = checkpoint['input_offset']
+        start_row = checkpoint['row_num']
+        counters = checkpoint['counters']
+        logger.info(
+            f"Resuming {csv_path} after row {start_row} "
+            f"({counters['rows_read']} rows already processed)"
+        )
+        
+        # Drop output written after the last checkpoint so it is not duplicated
+        with open(output_file, 'ab') as out:
+            out.truncate(checkpoint['output_offset'])
+        mode = 'ab'
+    else:
+        start_offset = 0
+        start_row = 1
+        counters = _new_counters()
+        mode = 'wb'
+    
+    def write_checkpoint(out: Any, input_offset: int, row_num: int, completed: bool) -> None:
+        out.flush()
+        os.fsync(out.fileno())
+        _write_json_atomic(checkpoint_file, {
+            'version': CHECKPOINT_VERSION,
+            'input_path': input_path,
+            'input_signature': input_signature,
+            'input_offset': input_offset,
+            'row_num': row_num,
+            'output_offset': out.tell(),
+            'counters': counters,
+            'completed': completed,
+        })
+        logger.info(f"Checkpoint at row {row_num}: {counters}")
+    
+    input_offset, row_num = start_offset, start_row
+    since_checkpoint = 0
+    
+    with open(output_file, mode) as out:
+        for row_num, input_offset, row in iter_csv_with_offsets(
+            csv_path, start_offset, start_row, typed
+        ):
+            counters['rows_read'] += 1
+            try:
+                transformed = process_transaction(row)
+                line = json.dumps(dict(transformed.items()), default=str) + '\n'
+                out.write(line.encode('utf-8'))
+                counters['successful'] += 1
+            except Exception as e:
+                logger.warning(f"Row {row_num} failed: {type(e).__name__}: {e}")
+                counters['failed'] += 1
+            
+            since_checkpoint += 1
+            if since_checkpoint >= checkpoint_every:
+                write_checkpoint(out, input_offset, row_num, completed=False)
+                since_checkpoint = 0
+        
+        write_checkpoint(out, input_offset, row_num, completed=True)
+    
+    logger.info(f"Pipeline finished for {csv_path}: {counters}")
+    return counters
+
+
+class FileResult(NamedTuple):
+    """Outcome of processing one file in load_many."""
+    
+    path: str
+    counters: dict[str, int]
+    rows: Optional[list] = None
+    error: Optional[str] = None
+
+
+def process_file(path: str, typed: bool = True, keep_rows: bool = True) -> FileResult:
+    """
+    Load one CSV file and run every row through the pipeline.
+    
+    Rows that fail validation are counted, not returned. A file that
+    cannot be read at all is reported through the error field instead of
+    raising, so one bad file does not stop a multi-file load.
+    
+    Args:
+        path: Path to CSV file
+        typed: Parse typed columns once at load time
+        keep_rows: Return the transformed rows, not just the counters
+        
+    Returns:
+        FileResult with counters and, if keep_rows, the transformed rows
+    """
+    counters = _new_counters()
+    rows = [] if keep_rows else None
+    
+    try:
+        for row in iter_csv(path, typed=typed):
+            counters['rows_read'] += 1
+            try:
+                transformed = process_transaction(row)
+            except Exception as e:
+                logger.debug(f"Row failed in {path}: {type(e).__name__}: {e}")
+                counters['failed'] += 1
+                continue
+            counters['successful'] += 1
+            if rows is not None:
+                rows.append(transformed)
+    except Exception as e:
+        logger.error(f"Failed to process {path}: {type(e).__name__}: {e}")
+        return FileResult(path, counters, rows, f"{type(e).__name__}: {e}")
+    
+    logger.info(f"Processed {path}: {counters}")
+    return FileResult(path, counters, rows)
+
+
+def load_many(
+    paths: list[str],
+    workers: Optional[int] = None,
+    typed: bool = True,
+    keep_rows: bool = True
+) -> list[FileResult]:
+    """
+    Load, validate, clean and transform many CSV files across processes.
+    
+    Each file is processed end to end by one worker process and only the
+    result is sent back, so throughput scales with the number of cores
+    when there are at least as many files as workers.
+    
+    Args:
+        paths: Paths to CSV files
+        workers: Number of worker processes (defaults to CPU count)
+        typed: Parse typed columns once at load time
+        keep_rows: Return transformed rows; with False only counters are
+            sent back, which avoids pickling every row to the parent
+            
+    Returns:
+        One FileResult per path, in the order of paths
+    """
+    paths = [str(path) for path in paths]
+    workers = min(workers or os.cpu_count() or 1, len(paths)) if paths else 1
+    
+    logger.info(f"Processing {len(paths)} files with {workers} workers")
+    
+    if workers == 1:
+        results = [process_file(path, typed, keep_rows) for path in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(process_file, path, typed, keep_rows) for path in paths]
+            results = [future.result() for future in futures]
+    
+    totals = _merge_counters([result.counters for result in results])
+    failed_files = sum(1 for result in results if result.error is not None)
+    logger.info(f"Processed {len(paths)} files ({failed_files} failed): {totals}")
+    return results
+
+
+def run_pipeline_many(
+    csv_paths: list[str],
+    output_dir: str,
+    workers: Optional[int] = None,
+    checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
+    resume: bool = False,
+    typed: bool = True
+) -> dict[str, dict[str, int]]:
+    """
+    Run the checkpointed pipeline over many CSV files in parallel.
+    
+    Each input is written to <output_dir>/<csv name>.jsonl with its own
+    checkpoint, so a resumed run only redoes unfinished files.
+    
+    Args:
+        csv_paths: Paths to input CSV files
+        output_dir: Directory for JSON Lines outputs and checkpoints
+        workers: Number of worker processes (defaults to CPU count)
+        checkpoint_every: Number of input rows between checkpoints
+        resume: Continue each file from its last checkpoint
+        typed: Parse typed columns once at load time
+        
+    Returns:
+        Counters per input path
+        
+    Raises:
+        ValueError: If two inputs share a file name, so their outputs would clash
+    """
+    csv_paths = [str(path) for path in csv_paths]
+    names = [Path(path).name for path in csv_paths]
+    if len(set(names)) != len(names):
+        raise ValueError("Input files must have distinct names to share an output directory")
+    
+    out_dir = Path(output_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    outputs = [str(out_dir / f"{name}.jsonl") for name in names]
+    workers = min(workers or os.cpu_count() or 1, len(csv_paths)) if csv_paths else 1
+    
+    logger.info(f"Running pipeline on {len(csv_paths)} files with {workers} workers")
+    
+    if workers == 1:
+        all_counters = [
+            run_pipeline(path, output, None, checkpoint_every, resume, typed)
+            for path, output in zip(csv_paths, outputs)
+        ]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(run_pipeline, path, output, None, checkpoint_every, resume, typed)
+                for path, output in zip(csv_paths, outputs)
+            ]
+            all_counters = [future.result() for future in futures]
+    
+    logger.info(f"Pipeline finished for {len(csv_paths)} files: {_merge_counters(all_counters)}")
+    return dict(zip(csv_paths, all_counters))
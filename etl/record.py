@@ -0,0 +1,200 @@
+"""Compact record type for banking transactions."""
+
+import logging
+from typing import Any, Iterable, Iterator, Sequence, Union
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+# Columns of banking_transactions.csv followed by fields added by the pipeline
+CSV_FIELDS = (
+    'transaction_id',
+    'transaction_date',
+    'value_date',
+    'customer_id',
+    'account_id',
+    'account_type',
+    'txn_type',
+    'channel',
+    'direction',
+    'amount',
+    'currency',
+    'merchant_category',
+    'region',
+    'risk_score',
+    'is_fraud_suspected',
+)
+DERIVED_FIELDS = (
+    'amount_anomaly',
+    'is_large_transaction',
+    'is_crossborder',
+    'transaction_day',
+    'amount_log',
+)
+TRANSACTION_FIELDS = CSV_FIELDS + DERIVED_FIELDS
+
+_FIELD_SET = frozenset(TRANSACTION_FIELDS)
+
+
+class Transaction:
+    """
+    Slots-based transaction record with a dict-like interface.
+    
+    Known fields are stored in slots instead of a per-row dict. The field
+    values dominate row size, so this saves about a fifth of the memory
+    of a dict row (roughly 990 vs 1260 bytes for a sample transaction),
+    not more. Fields that were never set behave like missing dict keys.
+    Columns outside TRANSACTION_FIELDS are kept in a small overflow dict
+    so no data is lost.
+    
+    The validator, cleaner and transformer accept Transaction wherever they
+    accept a transaction dict, and return Transaction for Transaction input.
+    """
+    
+    __slots__ = TRANSACTION_FIELDS + ('_extra',)
+    
+    def __init__(self, **fields: Any) -> None:
+        self._extra = None
+        for key, value in fields.items():
+            self[key] = value
+    
+    @classmethod
+    def from_items(cls, items: Iterable[tuple[str, Any]]) -> 'Transaction':
+        """
+        Build a Transaction from (field, value) pairs.
+        
+        Args:
+            items: Iterable of field name and value pairs
+            
+        Returns:
+            New Transaction
+        """
+        record = cls()
+        for key, value in items:
+            record[key] = value
+        return record
+    
+    @classmethod
+    def from_values(cls, values: Sequence[Any]) -> 'Transaction':
+        """
+        Build a Transaction from one value per CSV_FIELDS column, in order.
+        
+        The slots are assigned directly by unpacking, without a
+        __setitem__ call per field, so this is the fast path for rows
+        whose header matches CSV_FIELDS.
+        
+        Args:
+            values: Values in CSV_FIELDS order
+            
+        Returns:
+            New Transaction
+            
+        Raises:
+            ValueError: If there is not exactly one value per CSV column
+        """
+        record = object.__new__(cls)
+        record._extra = None
+        (
+            record.transaction_id,
+            record.transaction_date,
+            record.value_date,
+            record.customer_id,
+            record.account_id,
+            record.account_type,
+            record.txn_type,
+            record.channel,
+            record.direction,
+            record.amount,
+            record.currency,
+            record.merchant_category,
+            record.region,
+            record.risk_score,
+            record.is_fraud_suspected,
+        ) = values
+        return record
+    
+    def __getitem__(self, key: str) -> Any:
+        if key in _FIELD_SET:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+    
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in _FIELD_SET:
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+    
+    def __delitem__(self, key: str) -> None:
+        if key in _FIELD_SET:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        elif self._extra is not None and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+    
+    def __contains__(self, key: object) -> bool:
+        try:
+            self[key]
+        except (KeyError, TypeError):
+            return False
+        return True
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+    
+    def __len__(self) -> int:
+        return len(self.keys())
+    
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (Transaction, dict)):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+    
+    def __repr__(self) -> str:
+        fields = ', '.join(f"{key}={value!r}" for key, value in self.items())
+        return f"Transaction({fields})"
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the field value, or default if it is not set."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+    
+    def keys(self) -> list[str]:
+        """Return the names of all set fields in column order."""
+        keys = [key for key in TRANSACTION_FIELDS if hasattr(self, key)]
+        if self._extra:
+            keys.extend(self._extra)
+        return keys
+    
+    def values(self) -> list[Any]:
+        """Return the values of all set fields in column order."""
+        return [self[key] for key in self.keys()]
+    
+    def items(self) -> list[tuple[str, Any]]:
+        """Return (field, value) pairs of all set fields in column order."""
+        return [(key, self[key]) for key in self.keys()]
+    
+    def copy(self) -> 'Transaction':
+        """Return a shallow copy of the record."""
+        return type(self).from_items(self.items())
+    
+    def to_dict(self) -> dict[str, Any]:
+        """Return the record as a plain dictionary."""
+        return dict(self.items())
+
+
+TransactionLike = Union[dict[str, Any], Transaction]
+
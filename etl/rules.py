@@ -0,0 +1,275 @@
+"""Declarative validation rules compiled into a single validator function."""
+
+import json
+import logging
+import re
+from datetime import date
+from typing import Any, Callable, NamedTuple
+
+from etl.dates import is_valid_date
+from etl.validator import (
+    ANOMALY_THRESHOLD,
+    TRANSACTION_ID_PATTERN,
+    VALID_ACCOUNT_TYPES,
+    VALID_CURRENCIES,
+    VALID_DIRECTIONS,
+)
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+RULE_CHECKS = ('pattern', 'date', 'number', 'one_of')
+RULE_SEVERITIES = ('error', 'warn')
+# Status codes are stored as unsigned bytes by validate_batch
+MAX_RULES = 255
+
+# The checks of validate_transaction; error rule order gives the STATUS_* codes
+DEFAULT_RULE_SPEC = {
+    'name': 'default',
+    'rules': [
+        {'field': 'transaction_id', 'check': 'pattern', 'pattern': TRANSACTION_ID_PATTERN},
+        {'field': 'transaction_date', 'check': 'date'},
+        {'field': 'amount', 'check': 'number', 'min': 0},
+        {'field': 'currency', 'check': 'one_of', 'values': sorted(VALID_CURRENCIES)},
+        {'field': 'direction', 'check': 'one_of', 'values': sorted(VALID_DIRECTIONS),
+         'allow_empty': True, 'severity': 'warn'},
+        {'field': 'account_type', 'check': 'one_of', 'values': sorted(VALID_ACCOUNT_TYPES),
+         'allow_empty': True, 'severity': 'warn'},
+    ],
+    'flags': [
+        {'name': 'amount_anomaly', 'field': 'amount', 'greater_than': ANOMALY_THRESHOLD},
+    ],
+}
+
+
+class CompiledRules(NamedTuple):
+    """
+    A rule set compiled into one validator function.
+    
+    validate(row) returns 0 for a valid row, otherwise the 1-based
+    position of the first failing error rule; fields maps those codes to
+    the checked field. Valid rows get the spec's flags set.
+    """
+    
+    name: str
+    validate: Callable[[Any], int]
+    fields: dict[int, str]
+    source: str
+
+
+class _RuleWarning(Exception):
+    """Raised inside generated code when a warn rule fails."""
+    pass
+
+
+def _require(rule: dict[str, Any], key: str) -> Any:
+    """Return a mandatory rule key, raising ValueError when it is missing."""
+    if key not in rule:
+        raise ValueError(f"Rule {rule!r} is missing '{key}'")
+    return rule[key]
+
+
+def _emit_rule(
+    rule: dict[str, Any],
+    label: str,
+    fail: str,
+    namespace: dict[str, Any]
+) -> list[str]:
+    """
+    Generate the source lines checking one rule.
+    
+    Each rule reads its field into value and runs the fail statement when
+    the check does not hold; number rules also keep the parsed number in
+    n_<label> for flags. Constants are passed through the namespace so no
+    spec value is pasted into the code.
+    """
+    field = _require(rule, 'field')
+    check = _require(rule, 'check')
+    lines = [f"    value = row.get({field!r})"]
+    
+    if check == 'pattern':
+        namespace[f'match_{label}'] = re.compile(_require(rule, 'pattern')).match
+        lines += [
+            f"    if not value or not isinstance(value, str) "
+            f"or match_{label}(value.strip()) is None:",
+            f"        {fail}",
+        ]
+    
+    elif check == 'date':
+        lines += [
+            "    if not isinstance(value, date) and (",
+            "            not value or not isinstance(value, str) or not is_valid_date(value)):",
+            f"        {fail}",
+        ]
+    
+    elif check == 'number':
+        lines += [
+            "    if not isinstance(value, float):",
+            "        if value is None or (isinstance(value, str) and not value.strip()):",
+            f"            {fail}",
+            "        try:",
+            "            value = float(value)",
+            "        except (ValueError, TypeError):",
+            f"            {fail}",
+        ]
+        if rule.get('min') is not None:
+            namespace[f'min_{label}'] = float(rule['min'])
+            lines += [f"    if value < min_{label}:", f"        {fail}"]
+        if rule.get('max') is not None:
+            namespace[f'max_{label}'] = float(rule['max'])
+            lines += [f"    if value > max_{label}:", f"        {fail}"]
+        lines.append(f"    n_{label} = value")
+    
+    elif check == 'one_of':
+        values = _require(rule, 'values')
+        if rule.get('case_sensitive', False):
+            namespace[f'allowed_{label}'] = frozenset(value.strip() for value in values)
+            normalized = "value.strip()"
+        else:
+            namespace[f'allowed_{label}'] = frozenset(value.strip().upper() for value in values)
+            normalized = "value.strip().upper()"
+        # Values already in canonical form skip the strip and upper calls
+        if rule.get('allow_empty', False):
+            # Missing, empty and non-string values pass, as in validate_direction
+            lines += [
+                f"    if value and isinstance(value, str) and value not in allowed_{label} "
+                f"and {normalized} not in allowed_{label}:",
+                f"        {fail}",
+            ]
+        else:
+            lines += [
+                f"    if not value or not isinstance(value, str) or ("
+                f"value not in allowed_{label} and {normalized} not in allowed_{label}):",
+                f"        {fail}",
+            ]
+    
+    else:
+        raise ValueError(f"Unknown check {check!r}, expected one of {RULE_CHECKS}")
+    
+    return lines
+
+
+def _emit_warning(rule: dict[str, Any], label: str, namespace: dict[str, Any]) -> list[str]:
+    """
+    Generate the source lines of a warn rule.
+    
+    The check runs inside a try block and a failure raises _RuleWarning,
+    so the rule stays inline without ending validation. Failures are
+    logged like the optional checks of validate_transaction, and the
+    rule's 'flag' field, when given, records whether the check held.
+    """
+    field = _require(rule, 'field')
+    flag = rule.get('flag')
+    lines = ["    try:"]
+    lines += ["    " + line for line in _emit_rule(rule, label, "raise RuleWarning", namespace)]
+    if flag is not None:
+        lines.append(f"        row[{flag!r}] = True")
+    lines += [
+        "    except RuleWarning:",
+        f"        warning('Invalid %s: %s', {field!r}, row.get({field!r}))",
+    ]
+    if flag is not None:
+        lines.append(f"        row[{flag!r}] = False")
+    return lines
+
+
+def compile_rules(spec: dict[str, Any]) -> CompiledRules:
+    """
+    Compile a rule specification into a single specialized validator.
+    
+    The spec lists rules in check order. Each rule names a field and a
+    check: 'pattern' (regex on the stripped string), 'date' (YYYY-MM-DD or
+    DD/MM/YYYY), 'number' (optional 'min' and 'max') or 'one_of' (allowed
+    'values', case-insensitive unless 'case_sensitive'; 'allow_empty'
+    lets missing values pass). A rule's 'severity' is 'error' (the
+    default), which rejects the row with the rule's status code, or
+    'warn', which only logs a warning and, when the rule names a 'flag',
+    sets that boolean field on the row. Warn rules run on rows that
+    passed every error rule, as the optional checks of
+    validate_transaction do. Optional flags set a boolean field on valid
+    rows when an error 'number' rule's field is 'greater_than' a value.
+    All rules are generated inline into one function, so validation
+    costs no call per rule.
+    
+    Speed depends on the rows: DEFAULT_RULES, which also runs the two
+    warn checks that the built-in validate_batch path skips, is only a
+    few percent faster than the built-in checks, on raw string rows and
+    on rows loaded with typed=True alike. Most of the cost of raw rows is
+    float() and date parsing, which compiling cannot remove.
+    
+    Args:
+        spec: Rule specification dictionary, e.g. DEFAULT_RULE_SPEC
+        
+    Returns:
+        CompiledRules with the generated validator
+        
+    Raises:
+        ValueError: If the specification is malformed
+    """
+    rules = _require(spec, 'rules')
+    for rule in rules:
+        if rule.get('severity', 'error') not in RULE_SEVERITIES:
+            raise ValueError(f"Unknown severity in {rule!r}, expected one of {RULE_SEVERITIES}")
+    errors = [rule for rule in rules if rule.get('severity', 'error') == 'error']
+    warnings = [rule for rule in rules if rule.get('severity', 'error') == 'warn']
+    if not rules or len(errors) > MAX_RULES:
+        raise ValueError(f"Rule specification must have 1 to {MAX_RULES} error rules")
+    
+    namespace = {
+        'date': date,
+        'is_valid_date': is_valid_date,
+        'RuleWarning': _RuleWarning,
+        'warning': logger.warning,
+    }
+    lines = ["def validate(row):"]
+    fields = {}
+    number_fields = {}
+    
+    for status, rule in enumerate(errors, start=1):
+        lines += _emit_rule(rule, str(status), f"return {status}", namespace)
+        fields[status] = rule['field']
+        if rule['check'] == 'number':
+            number_fields[rule['field']] = status
+    
+    for index, rule in enumerate(warnings, start=1):
+        lines += _emit_warning(rule, f'w{index}', namespace)
+    
+    for index, flag in enumerate(spec.get('flags', [])):
+        field = _require(flag, 'field')
+        if field not in number_fields:
+            raise ValueError(f"Flag {flag!r} needs a 'number' rule for field '{field}'")
+        namespace[f'limit_{index}'] = float(_require(flag, 'greater_than'))
+        lines.append(
+            f"    row[{_require(flag, 'name')!r}] = n_{number_fields[field]} > limit_{index}"
+        )
+    
+    lines.append("    return 0")
+    source = '\n'.join(lines) + '\n'
+    
+    exec(compile(source, f"<rules:{spec.get('name', 'custom')}>", 'exec'), namespace)
+    logger.debug(f"Compiled {len(rules)} rules for {spec.get('name', 'custom')}")
+    
+    return CompiledRules(spec.get('name', 'custom'), namespace['validate'], fields, source)
+
+
+def load_rules(path: str) -> CompiledRules:
+    """
+    Read a JSON rule specification and compile it.
+    
+    Args:
+        path: Path to JSON file in the DEFAULT_RULE_SPEC layout
+        
+    Returns:
+        CompiledRules with the generated validator
+        
+    Raises:
+        ValueError: If the specification is malformed
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        spec = json.load(f)
+    
+    logger.info(f"Loaded rule specification {spec.get('name', 'custom')} from: {path}")
+    return compile_rules(spec)
+
+
+DEFAULT_RULES = compile_rules(DEFAULT_RULE_SPEC)
@@ -3,27 +3,35 @@
 import logging
 import math
 from datetime import datetime, date
-from typing import Any, Optional
+from typing import Any, Optional, Union
+
+from etl.dates import WEEKDAY_NAMES, parse_date_cached
+from etl.record import TransactionLike
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
-def convert_date_to_date_object(date_str: str) -> Optional[date]:
+def convert_date_to_date_object(date_str: Union[str, date]) -> Optional[date]:
     """
     Convert date string to datetime.date object.
     
     Args:
-        date_str: Date string in YYYY-MM-DD format
+        date_str: Date string in YYYY-MM-DD or DD/MM/YYYY format, or an already parsed date
         
     Returns:
         datetime.date object or None if invalid
     """
+    if isinstance(date_str, datetime):
+        return date_str.date()
+    if isinstance(date_str, date):
+        return date_str
+    
     if not date_str:
         return None
     
     try:
-        return datetime.strptime(str(date_str).strip(), '%Y-%m-%d').date()
+        return parse_date_cached(str(date_str))
     except (ValueError, TypeError):
         logger.warning(f"Could not convert to date object: {date_str}")
         return None
@@ -42,6 +50,9 @@ def convert_amount_to_float(amount: Any) -> Optional[float]:
     if amount is None:
         return None
     
+    if isinstance(amount, float):
+        return amount
+    
     try:
         return float(amount)
     except (ValueError, TypeError):
@@ -62,6 +73,9 @@ def convert_risk_score_to_float(risk_score: Any) -> Optional[float]:
     if risk_score is None or (isinstance(risk_score, str) and not risk_score.strip()):
         return None
     
+    if isinstance(risk_score, float):
+        return risk_score
+    
     try:
         return float(risk_score)
     except (ValueError, TypeError):
@@ -114,8 +128,7 @@ def get_transaction_day(date_obj: Optional[date]) -> Optional[str]:
     if not date_obj:
         return None
     
-    days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-    return days[date_obj.weekday()]
+    return WEEKDAY_NAMES[date_obj.weekday()]
 
 
 def calculate_amount_log(amount: Optional[float]) -> Optional[float]:
@@ -138,15 +151,15 @@ def calculate_amount_log(amount: Optional[float]) -> Optional[float]:
         return None
 
 
-def transform_transaction(transaction: dict[str, Any]) -> dict[str, Any]:
+def transform_transaction(transaction: TransactionLike) -> TransactionLike:
     """
     Transform transaction data with type conversions and derived features.
     
     Args:
-        transaction: Cleaned transaction dictionary
+        transaction: Cleaned transaction dictionary or Transaction record
         
     Returns:
-        Transformed transaction dictionary with new features
+        Transformed transaction with new features, of the same type as the input
     """
     logger.debug(f"Transforming transaction: {transaction.get('transaction_id')}")
     
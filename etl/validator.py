@@ -2,8 +2,13 @@
 
 import logging
 import re
-from datetime import datetime
-from typing import Any
+from array import array
+from collections import Counter
+from datetime import date
+from typing import Any, NamedTuple, Optional
+
+from etl.dates import is_valid_date
+from etl.record import TransactionLike
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -36,6 +41,21 @@ VALID_ACCOUNT_TYPES = {'SAVINGS', 'CURRENT', 'CREDIT_CARD', 'LOAN'}
 TRANSACTION_ID_PATTERN = r'^TXN\d{7}$'
 ANOMALY_THRESHOLD = 10_000_000
 
+# Per-row status codes returned by validate_batch
+STATUS_OK = 0
+STATUS_INVALID_TRANSACTION_ID = 1
+STATUS_INVALID_DATE = 2
+STATUS_INVALID_AMOUNT = 3
+STATUS_INVALID_CURRENCY = 4
+STATUS_FIELDS = {
+    STATUS_INVALID_TRANSACTION_ID: 'transaction_id',
+    STATUS_INVALID_DATE: 'transaction_date',
+    STATUS_INVALID_AMOUNT: 'amount',
+    STATUS_INVALID_CURRENCY: 'currency',
+}
+
+_TRANSACTION_ID_RE = re.compile(TRANSACTION_ID_PATTERN)
+
 
 def validate_transaction_id(transaction_id: str) -> bool:
     """
@@ -69,8 +89,10 @@ def validate_date(date_str: str) -> bool:
     """
     Validate date format: YYYY-MM-DD or DD/MM/YYYY.
     
+    Date objects from a typed load are already parsed and always valid.
+    
     Args:
-        date_str: Date string to validate
+        date_str: Date string (or parsed date) to validate
         
     Returns:
         True if valid
@@ -78,6 +100,9 @@ def validate_date(date_str: str) -> bool:
     Raises:
         InvalidDateFormatError: If format is invalid
     """
+    if isinstance(date_str, date):
+        return True
+    
     if not date_str or not isinstance(date_str, str):
         logger.error(f"Invalid date type: {type(date_str)}")
         raise InvalidDateFormatError(
@@ -86,19 +111,8 @@ def validate_date(date_str: str) -> bool:
     
     date_str = date_str.strip()
     
-    # Try YYYY-MM-DD format
-    try:
-        datetime.strptime(date_str, '%Y-%m-%d')
-        return True
-    except ValueError:
-        pass
-    
-    # Try DD/MM/YYYY format
-    try:
-        datetime.strptime(date_str, '%d/%m/%Y')
+    if is_valid_date(date_str):
         return True
-    except ValueError:
-        pass
     
     logger.error(f"Invalid date format: {date_str}")
     raise InvalidDateFormatError(
@@ -123,11 +137,15 @@ def validate_amount(amount: Any) -> bool:
         logger.error("Amount cannot be empty")
         raise InvalidAmountError("Amount cannot be empty")
     
-    try:
-        amount_float = float(amount)
-    except (ValueError, TypeError) as e:
-        logger.error(f"Amount cannot be converted to float: {amount}")
-        raise InvalidAmountError(f"Amount must be numeric, got {amount}") from e
+    if isinstance(amount, float):
+        # Already parsed by a typed load
+        amount_float = amount
+    else:
+        try:
+            amount_float = float(amount)
+        except (ValueError, TypeError) as e:
+            logger.error(f"Amount cannot be converted to float: {amount}")
+            raise InvalidAmountError(f"Amount must be numeric, got {amount}") from e
     
     if amount_float < 0:
         logger.error(f"Amount cannot be negative: {amount_float}")
@@ -213,12 +231,12 @@ def check_amount_anomaly(amount: float) -> bool:
     return float(amount) > ANOMALY_THRESHOLD
 
 
-def validate_transaction(transaction: dict[str, Any]) -> dict[str, Any]:
+def validate_transaction(transaction: TransactionLike) -> TransactionLike:
     """
     Validate transaction data.
     
     Args:
-        transaction: Transaction dictionary to validate
+        transaction: Transaction dictionary or Transaction record to validate
         
     Returns:
         Updated transaction dict with validation flags
@@ -251,3 +269,107 @@ def validate_transaction(transaction: dict[str, Any]) -> dict[str, Any]:
     )
     
     return transaction
+
+
+class BatchValidationResult(NamedTuple):
+    """Outcome of validate_batch: one status code per row and the valid rows."""
+    
+    statuses: array
+    valid: list
+
+
+def _valid_date(value: Any) -> bool:
+    """Non-raising counterpart of validate_date."""
+    if isinstance(value, date):
+        return True
+    if not value or not isinstance(value, str):
+        return False
+    return is_valid_date(value)
+
+
+def _valid_amount(value: Any) -> Optional[float]:
+    """Non-raising counterpart of validate_amount; returns the amount or None."""
+    if isinstance(value, float):
+        amount = value
+    elif value is None or (isinstance(value, str) and not value.strip()):
+        return None
+    else:
+        try:
+            amount = float(value)
+        except (ValueError, TypeError):
+            return None
+    return None if amount < 0 else amount
+
+
+def _row_status(transaction: TransactionLike) -> tuple[int, Optional[float]]:
+    """Return the status code of one row and its amount when it is valid."""
+    transaction_id = transaction.get('transaction_id', '')
+    if (not transaction_id or not isinstance(transaction_id, str)
+            or not _TRANSACTION_ID_RE.match(transaction_id.strip())):
+        return STATUS_INVALID_TRANSACTION_ID, None
+    
+    if not _valid_date(transaction.get('transaction_date', '')):
+        return STATUS_INVALID_DATE, None
+    
+    amount = _valid_amount(transaction.get('amount'))
+    if amount is None:
+        return STATUS_INVALID_AMOUNT, None
+    
+    currency = transaction.get('currency', '')
+    if (not currency or not isinstance(currency, str)
+            or currency.strip().upper() not in VALID_CURRENCIES):
+        return STATUS_INVALID_CURRENCY, None
+    
+    return STATUS_OK, amount
+
+
+def validate_batch(
+    transactions: list[TransactionLike],
+    rules: Optional[Any] = None
+) -> BatchValidationResult:
+    """
+    Validate a batch of transactions without raising per invalid row.
+    
+    Applies the same mandatory checks as validate_transaction, in the same
+    order, but records the first failing check as a status code instead of
+    raising and logging. Valid rows get the amount_anomaly flag, as with
+    validate_transaction; invalid rows are left untouched.
+    
+    Args:
+        transactions: Transaction dictionaries or Transaction records
+        rules: Optional CompiledRules (see etl.rules) to apply instead of
+            the built-in checks; status codes are then rule positions
+            
+    Returns:
+        BatchValidationResult with one status code per input row
+        (STATUS_OK or a STATUS_INVALID_* code, see STATUS_FIELDS for the
+        failing field) and the list of valid rows in input order
+    """
+    statuses = array('B')
+    valid = []
+    
+    if rules is not None:
+        check = rules.validate
+        fields = rules.fields
+        for transaction in transactions:
+            status = check(transaction)
+            statuses.append(status)
+            if status == STATUS_OK:
+                valid.append(transaction)
+    else:
+        fields = STATUS_FIELDS
+        for transaction in transactions:
+            status, amount = _row_status(transaction)
+            statuses.append(status)
+            if status == STATUS_OK:
+                transaction['amount_anomaly'] = amount > ANOMALY_THRESHOLD
+                valid.append(transaction)
+    
+    if len(valid) < len(statuses):
+        failures = Counter(fields[status] for status in statuses if status != STATUS_OK)
+        logger.info(
+            f"Batch validation: {len(valid)} of {len(statuses)} rows valid, "
+            f"invalid by field: {dict(failures)}"
+        )
+    
+    return BatchValidationResult(statuses, valid)
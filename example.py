@@ -5,8 +5,8 @@ This script shows how to use the ETL modules to process banking transactions.
 """
 
 import logging
-from etl.loader import load_csv
-from etl.validator import validate_transaction
+from etl.loader import load_csv_batches, DEFAULT_BATCH_SIZE
+from etl.validator import validate_batch, STATUS_OK, STATUS_FIELDS
 from etl.cleaner import clean_transaction
 from etl.transformer import transform_transaction
 
@@ -19,13 +19,18 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def process_banking_transactions(csv_path: str, max_records: int = 10) -> None:
+def process_banking_transactions(
+    csv_path: str,
+    max_records: int = 10,
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> None:
     """
     Process banking transactions through the ETL pipeline.
     
     Args:
         csv_path: Path to CSV file
         max_records: Maximum number of records to process (for demo)
+        batch_size: Number of rows read from the CSV per batch
     """
     logger.info("=" * 80)
     logger.info("BANKING ETL PIPELINE DEMO")
@@ -34,45 +39,65 @@ def process_banking_transactions(csv_path: str, max_records: int = 10) -> None:
     # Step 1: Load CSV
     logger.info("\n[1] LOADING CSV FILE...")
     try:
-        transactions = load_csv(csv_path)
-        logger.info(f"✓ Loaded {len(transactions)} transactions")
+        batches = load_csv_batches(csv_path, batch_size=batch_size, typed=True)
+        logger.info(f"✓ Streaming transactions in batches of {batch_size}")
     except Exception as e:
         logger.error(f"✗ Failed to load CSV: {e}")
         return
     
-    # Process first few transactions
-    limit = min(max_records, len(transactions))
-    logger.info(f"\n[2] PROCESSING {limit} TRANSACTIONS...")
+    logger.info(f"\n[2] PROCESSING UP TO {max_records} TRANSACTIONS...")
     
     successful = 0
     failed = 0
+    idx = 0
     
-    for idx, raw_txn in enumerate(transactions[:limit], 1):
-        try:
-            # Step 2: Validate
-            validated = validate_transaction(raw_txn)
-            
-            # Step 3: Clean
-            cleaned = clean_transaction(validated)
+    try:
+        for start_line, batch in batches:
+            logger.debug(f"Processing batch starting at line {start_line}")
             
-            # Step 4: Transform
-            transformed = transform_transaction(cleaned)
+            # Step 2: Validate the whole batch without raising per bad row
+            batch = batch[:max_records - idx]
+            validation = validate_batch(batch)
             
-            logger.info(f"\n✓ Transaction {idx}: {transformed['transaction_id']}")
-            logger.info(f"  - Date: {transformed['transaction_date']} "
-                       f"({transformed['transaction_day']})")
-            logger.info(f"  - Amount: {transformed['amount']} {transformed['currency']}")
-            logger.info(f"  - Large Transaction: {transformed['is_large_transaction']}")
-            logger.info(f"  - Cross-border: {transformed['is_crossborder']}")
-            logger.info(f"  - Risk Score: {transformed['risk_score']}")
-            logger.info(f"  - Amount Log: {transformed['amount_log']:.2f}" 
-                       if transformed['amount_log'] else f"  - Amount Log: N/A")
+            for raw_txn, status in zip(batch, validation.statuses):
+                idx += 1
+                
+                if status != STATUS_OK:
+                    logger.error(
+                        f"\n✗ Transaction {idx}: invalid {STATUS_FIELDS[status]} "
+                        f"({raw_txn.get(STATUS_FIELDS[status])!r})"
+                    )
+                    failed += 1
+                    continue
+                
+                try:
+                    # Step 3: Clean
+                    cleaned = clean_transaction(raw_txn)
+                    
+                    # Step 4: Transform
+                    transformed = transform_transaction(cleaned)
+                    
+                    logger.info(f"\n✓ Transaction {idx}: {transformed['transaction_id']}")
+                    logger.info(f"  - Date: {transformed['transaction_date']} "
+                               f"({transformed['transaction_day']})")
+                    logger.info(f"  - Amount: {transformed['amount']} {transformed['currency']}")
+                    logger.info(f"  - Large Transaction: {transformed['is_large_transaction']}")
+                    logger.info(f"  - Cross-border: {transformed['is_crossborder']}")
+                    logger.info(f"  - Risk Score: {transformed['risk_score']}")
+                    logger.info(f"  - Amount Log: {transformed['amount_log']:.2f}" 
+                               if transformed['amount_log'] else f"  - Amount Log: N/A")
+                    
+                    successful += 1
+                
+                except Exception as e:
+                    logger.error(f"\n✗ Transaction {idx}: {type(e).__name__}: {e}")
+                    failed += 1
             
-            successful += 1
-        
-        except Exception as e:
-            logger.error(f"\n✗ Transaction {idx}: {type(e).__name__}: {e}")
-            failed += 1
+            if idx >= max_records:
+                break
+    except Exception as e:
+        logger.error(f"✗ Failed to load CSV: {e}")
+        return
     
     # Summary
     logger.info("\n" + "=" * 80)
@@ -39,6 +39,9 @@ setup(
             "flake8>=4.0.0",
             "mypy>=0.900",
         ],
+        "vectorized": [
+            "numpy>=1.24",
+        ],
     },
     entry_points={
         "console_scripts": [
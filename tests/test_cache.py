@@ -0,0 +1,111 @@
+"""Tests for parsed CSV cache module."""
+
+import os
+import pytest
+import tempfile
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+
+from etl.cache import default_cache_dir, load_csv_cached
+from etl.loader import load_csv, CSVFileNotFoundError
+
+
+class TestLoadCSVCached:
+    """Test cases for load_csv_cached function."""
+    
+    @pytest.fixture
+    def cache_dir(self):
+        """Create a temporary cache directory."""
+        with tempfile.TemporaryDirectory() as directory:
+            yield directory
+    
+    def test_first_load_matches_load_csv(self, temp_csv_file, cache_dir):
+        """Test uncached load returns load_csv rows and writes a cache file."""
+        rows = load_csv_cached(temp_csv_file, cache_dir=cache_dir)
+        
+        assert rows == load_csv(temp_csv_file)
+        assert len(os.listdir(cache_dir)) == 1
+    
+    def test_second_load_uses_cache(self, temp_csv_file, cache_dir):
+        """Test an unchanged file is served from the cache without parsing."""
+        first = load_csv_cached(temp_csv_file, cache_dir=cache_dir)
+        
+        with patch('etl.cache.load_csv') as mock_load:
+            second = load_csv_cached(temp_csv_file, cache_dir=cache_dir)
+        
+        mock_load.assert_not_called()
+        assert second == first
+    
+    def test_changed_file_invalidates_cache(self, temp_csv_file, cache_dir):
+        """Test modifying the file triggers a re-parse."""
+        load_csv_cached(temp_csv_file, cache_dir=cache_dir)
+        
+        with open(temp_csv_file, 'a', newline='') as f:
+            f.write('TXN0000002,2024-02-22,2024-02-22,CUST00002,ACC00002,SAVINGS,'
+                    'DEPOSIT,ATM,CREDIT,10.00,IDR,ATM,JKT,0.2,0\r\n')
+        
+        rows = load_csv_cached(temp_csv_file, cache_dir=cache_dir)
+        
+        assert len(rows) == 2
+    
+    def test_same_size_rewrite_detected_by_hash(self, temp_csv_file, cache_dir):
+        """Test verify_hash detects content changes with identical size and mtime."""
+        load_csv_cached(temp_csv_file, cache_dir=cache_dir)
+        stat = Path(temp_csv_file).stat()
+        
+        content = Path(temp_csv_file).read_bytes()
+        Path(temp_csv_file).write_bytes(content.replace(b'TXN0000001', b'TXN0000009'))
+        os.utime(temp_csv_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        
+        # The default size and mtime check does not read the file
+        rows = load_csv_cached(temp_csv_file, cache_dir=cache_dir)
+        assert rows[0]['transaction_id'] == 'TXN0000001'
+        
+        rows = load_csv_cached(temp_csv_file, cache_dir=cache_dir, verify_hash=True)
+        assert rows[0]['transaction_id'] == 'TXN0000009'
+    
+    def test_default_cache_dir_is_per_user(self, temp_csv_file, cache_dir, monkeypatch):
+        """Test the default cache goes to a private user directory, not next to the CSV."""
+        monkeypatch.setenv('XDG_CACHE_HOME', cache_dir)
+        
+        load_csv_cached(temp_csv_file)
+        
+        directory = Path(cache_dir) / 'etl'
+        assert default_cache_dir() == directory
+        assert len(os.listdir(directory)) == 1
+        assert directory.stat().st_mode & 0o777 == 0o700
+        assert not (Path(temp_csv_file).parent / '.etl_cache').exists()
+    
+    def test_cache_writable_by_others_not_loaded(self, temp_csv_file, cache_dir):
+        """Test a cache file other users could have replaced is ignored."""
+        load_csv_cached(temp_csv_file, cache_dir=cache_dir)
+        cache_file = Path(cache_dir) / os.listdir(cache_dir)[0]
+        cache_file.chmod(0o666)
+        
+        with patch('etl.cache.load_csv', return_value=[]) as mock_load:
+            load_csv_cached(temp_csv_file, cache_dir=cache_dir)
+        
+        mock_load.assert_called_once()
+    
+    def test_typed_cache_separate(self, temp_csv_file, cache_dir):
+        """Test typed and raw loads use separate cache entries."""
+        raw = load_csv_cached(temp_csv_file, cache_dir=cache_dir)
+        typed = load_csv_cached(temp_csv_file, cache_dir=cache_dir, typed=True)
+        
+        assert raw[0]['transaction_date'] == '2024-02-21'
+        assert typed[0]['transaction_date'] == date(2024, 2, 21)
+        assert len(os.listdir(cache_dir)) == 2
+    
+    def test_corrupt_cache_reparsed(self, temp_csv_file, cache_dir):
+        """Test an unreadable cache file falls back to parsing."""
+        load_csv_cached(temp_csv_file, cache_dir=cache_dir)
+        cache_file = Path(cache_dir) / os.listdir(cache_dir)[0]
+        cache_file.write_bytes(b'not a pickle')
+        
+        assert load_csv_cached(temp_csv_file, cache_dir=cache_dir) == load_csv(temp_csv_file)
+    
+    def test_file_not_found(self, cache_dir):
+        """Test CSVFileNotFoundError for non-existent file."""
+        with pytest.raises(CSVFileNotFoundError):
+            load_csv_cached('/non/existent/file.csv', cache_dir=cache_dir)
@@ -57,6 +57,10 @@ class TestNormalizeDate:
     def test_normalize_invalid_date(self):
         """Test normalizing invalid date."""
         assert normalize_date('invalid') is None
+    
+    def test_normalize_parsed_date(self):
+        """Test date objects from a typed load pass through unchanged."""
+        assert normalize_date(date(2024, 2, 21)) == date(2024, 2, 21)
 
 
 class TestNormalizeCurrency:
@@ -0,0 +1,116 @@
+"""Tests for shared date parsing module."""
+
+import pytest
+from datetime import date
+
+from etl.cleaner import normalize_date
+from etl.dates import (
+    parse_date,
+    lookup_date,
+    parse_date_cached,
+    is_valid_date,
+    date_cache_info,
+    clear_date_cache,
+    DATE_CACHE_SIZE
+)
+from etl.transformer import convert_date_to_date_object
+from etl.validator import validate_date
+
+
+class TestParseDate:
+    """Test cases for parse_date function."""
+    
+    def test_iso_format(self):
+        """Test YYYY-MM-DD dates."""
+        assert parse_date('2024-02-21') == date(2024, 2, 21)
+        assert parse_date('  2024-02-21\n') == date(2024, 2, 21)
+    
+    def test_dmy_format(self):
+        """Test DD/MM/YYYY dates."""
+        assert parse_date('21/02/2024') == date(2024, 2, 21)
+    
+    def test_unpadded_dates(self):
+        """Test dates without zero padding are still accepted."""
+        assert parse_date('2024-2-1') == date(2024, 2, 1)
+        assert parse_date('1/2/2024') == date(2024, 2, 1)
+    
+    def test_leap_years(self):
+        """Test February 29 follows the leap year rules."""
+        assert parse_date('2024-02-29') == date(2024, 2, 29)
+        assert parse_date('29/02/2000') == date(2000, 2, 29)
+        
+        for value in ('2023-02-29', '29/02/1900'):
+            with pytest.raises(ValueError):
+                parse_date(value)
+    
+    @pytest.mark.parametrize('value', [
+        '2024-13-01',
+        '2024-04-31',
+        '0000-01-01',
+        '32/01/2024',
+        '2024/02/21',
+        '21-02-2024',
+        '2024-02-2x',
+        '2024-+2-21',
+        'invalid',
+        '',
+    ])
+    def test_invalid_dates(self, value):
+        """Test invalid dates raise ValueError."""
+        with pytest.raises(ValueError):
+            parse_date(value)
+
+
+class TestDateCache:
+    """Test cases for the shared date cache."""
+    
+    @pytest.fixture(autouse=True)
+    def empty_cache(self):
+        """Start each test with an empty cache."""
+        clear_date_cache()
+        yield
+        clear_date_cache()
+    
+    def test_lookup_fields(self):
+        """Test a lookup returns the date, normalized string and day name."""
+        parsed = lookup_date('21/02/2024')
+        
+        assert parsed.value == date(2024, 2, 21)
+        assert parsed.iso == '2024-02-21'
+        assert parsed.weekday == 'Wednesday'
+        assert parse_date_cached(' 2024-02-21 ') == date(2024, 2, 21)
+    
+    def test_hit_and_miss_counters(self):
+        """Test repeated dates are parsed once."""
+        for _ in range(5):
+            lookup_date('2024-02-21')
+        
+        info = date_cache_info()
+        assert info['misses'] == 1
+        assert info['hits'] == 4
+        assert info['size'] == 1
+        assert info['maxsize'] == DATE_CACHE_SIZE
+    
+    def test_shared_across_stages(self):
+        """Test validator, cleaner and transformer share cached parses."""
+        assert validate_date('21/02/2024') is True
+        assert normalize_date('21/02/2024') == '2024-02-21'
+        assert convert_date_to_date_object('21/02/2024') == date(2024, 2, 21)
+        
+        assert date_cache_info()['misses'] == 1
+        assert date_cache_info()['hits'] == 2
+    
+    def test_invalid_dates_are_cached(self):
+        """Test invalid strings are remembered and still rejected."""
+        assert is_valid_date('2024-02-30') is False
+        with pytest.raises(ValueError):
+            lookup_date('2024-02-30')
+        
+        assert date_cache_info()['misses'] == 1
+    
+    def test_cache_is_bounded(self):
+        """Test the cache never grows beyond its maximum size."""
+        for day in range(DATE_CACHE_SIZE + 10):
+            is_valid_date(f'{day}')
+        
+        assert date_cache_info()['size'] == DATE_CACHE_SIZE
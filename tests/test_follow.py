@@ -0,0 +1,172 @@
+"""Tests for CSV follow mode module."""
+
+import pytest
+import tempfile
+from pathlib import Path
+
+from etl.follow import CSVFollower
+from etl.loader import CSVEmptyRowError, CSVFileNotFoundError
+
+HEADER = 'transaction_id,transaction_date,customer_id,account_id,amount,currency\n'
+
+
+def _row(i):
+    return f'TXN{i:07d},2024-02-21,CUST{i:05d},ACC{i:05d},{i}.00,IDR\n'
+
+
+class TestCSVFollower:
+    """Test cases for CSVFollower class."""
+    
+    @pytest.fixture
+    def workdir(self):
+        """Create a temporary working directory."""
+        with tempfile.TemporaryDirectory() as directory:
+            yield Path(directory)
+    
+    def _append(self, path, text):
+        with open(path, 'a', newline='') as f:
+            f.write(text)
+    
+    def test_polls_only_new_rows(self, workdir):
+        """Test each poll returns only rows appended since the last poll."""
+        csv_path = workdir / 'live.csv'
+        csv_path.write_text(HEADER + _row(1) + _row(2))
+        follower = CSVFollower(str(csv_path))
+        
+        assert [r['transaction_id'] for r in follower.poll()] == ['TXN0000001', 'TXN0000002']
+        assert follower.poll() == []
+        
+        self._append(csv_path, _row(3))
+        assert [r['transaction_id'] for r in follower.poll()] == ['TXN0000003']
+    
+    def test_partial_row_waits(self, workdir):
+        """Test a row without its newline is not consumed yet."""
+        csv_path = workdir / 'live.csv'
+        csv_path.write_text(HEADER + _row(1) + 'TXN0000002,2024-02')
+        follower = CSVFollower(str(csv_path))
+        
+        assert len(follower.poll()) == 1
+        
+        self._append(csv_path, '-21,CUST00002,ACC00002,2.00,IDR\n')
+        rows = follower.poll()
+        assert rows[0]['transaction_date'] == '2024-02-21'
+    
+    def test_partial_quoted_field_waits(self, workdir):
+        """Test a newline inside an unfinished quoted field does not end a row."""
+        csv_path = workdir / 'live.csv'
+        csv_path.write_text(HEADER + 'TXN0000001,2024-02-21,"CUST\n')
+        follower = CSVFollower(str(csv_path))
+        
+        assert follower.poll() == []
+        
+        self._append(csv_path, '00001",ACC00001,1.00,IDR\n')
+        assert follower.poll()[0]['customer_id'] == 'CUST\n00001'
+    
+    def test_resume_from_saved_state(self, workdir):
+        """Test a new follower resumes from the persisted offset."""
+        csv_path = workdir / 'live.csv'
+        state_path = workdir / 'live.state.json'
+        csv_path.write_text(HEADER + _row(1))
+        
+        follower = CSVFollower(str(csv_path), state_path=str(state_path))
+        follower.poll()
+        follower.save_state()
+        
+        self._append(csv_path, _row(2))
+        resumed = CSVFollower(str(csv_path), state_path=str(state_path))
+        
+        assert [r['transaction_id'] for r in resumed.poll()] == ['TXN0000002']
+    
+    def test_error_reports_file_line_number(self, workdir):
+        """Test row numbers keep counting across polls."""
+        csv_path = workdir / 'live.csv'
+        csv_path.write_text(HEADER + _row(1))
+        follower = CSVFollower(str(csv_path))
+        follower.poll()
+        
+        self._append(csv_path, ',,,,,\n')
+        with pytest.raises(CSVEmptyRowError, match='line 3'):
+            follower.poll()
+    
+    def test_truncated_file_restarts(self, workdir):
+        """Test a shrunk file is re-read from the header."""
+        csv_path = workdir / 'live.csv'
+        csv_path.write_text(HEADER + _row(1) + _row(2))
+        follower = CSVFollower(str(csv_path))
+        follower.poll()
+        
+        csv_path.write_text(HEADER + _row(9))
+        assert [r['transaction_id'] for r in follower.poll()] == ['TXN0000009']
+    
+    def test_replaced_larger_file_restarts(self, workdir):
+        """Test a file rotated to a larger one is re-read from the header."""
+        csv_path = workdir / 'live.csv'
+        state_path = workdir / 'live.state.json'
+        csv_path.write_text(HEADER + _row(1))
+        follower = CSVFollower(str(csv_path), state_path=str(state_path))
+        follower.poll()
+        follower.save_state()
+        
+        rotated = workdir / 'rotated.csv'
+        rotated.write_text(HEADER + ''.join(_row(i) for i in range(5, 10)))
+        rotated.replace(csv_path)
+        resumed = CSVFollower(str(csv_path), state_path=str(state_path))
+        
+        assert [r['transaction_id'] for r in resumed.poll()] == [
+            f'TXN{i:07d}' for i in range(5, 10)
+        ]
+    
+    def test_follow_saves_after_each_batch(self, workdir):
+        """Test follow yields batches and persists position between them."""
+        csv_path = workdir / 'live.csv'
+        state_path = workdir / 'live.state.json'
+        csv_path.write_text(HEADER + _row(1))
+        follower = CSVFollower(str(csv_path), state_path=str(state_path))
+        
+        batches = list(follower.follow(poll_interval=0, max_idle_polls=1))
+        
+        assert len(batches) == 1
+        assert state_path.exists()
+        assert CSVFollower(str(csv_path), state_path=str(state_path)).poll() == []
+    
+    def test_poll_reads_at_most_max_poll_bytes(self, workdir):
+        """Test a backlog is returned over several bounded polls."""
+        csv_path = workdir / 'live.csv'
+        csv_path.write_text(HEADER)
+        follower = CSVFollower(str(csv_path), max_poll_bytes=2 * len(_row(1)))
+        assert follower.poll() == []
+        
+        self._append(csv_path, ''.join(_row(i) for i in range(1, 10)))
+        assert len(follower.poll()) == 2
+        
+        batches = list(follower.follow(poll_interval=0, max_idle_polls=1))
+        assert [len(rows) for rows in batches] == [2, 2, 2, 1]
+    
+    def test_row_longer_than_max_poll_bytes(self, workdir):
+        """Test a single row over the cap is still read instead of stalling."""
+        csv_path = workdir / 'live.csv'
+        csv_path.write_text(HEADER + _row(1) + _row(2))
+        follower = CSVFollower(str(csv_path), max_poll_bytes=10)
+        
+        assert [len(follower.poll()) for _ in range(3)] == [0, 1, 1]
+    
+    def test_invalid_max_poll_bytes(self, workdir):
+        """Test ValueError for a non-positive max_poll_bytes."""
+        csv_path = workdir / 'live.csv'
+        csv_path.write_text(HEADER)
+        
+        with pytest.raises(ValueError):
+            CSVFollower(str(csv_path), max_poll_bytes=0)
+    
+    def test_save_without_state_path(self, workdir):
+        """Test ValueError when saving without a state_path."""
+        csv_path = workdir / 'live.csv'
+        csv_path.write_text(HEADER)
+        
+        with pytest.raises(ValueError):
+            CSVFollower(str(csv_path)).save_state()
+    
+    def test_file_not_found(self):
+        """Test CSVFileNotFoundError for non-existent file."""
+        with pytest.raises(CSVFileNotFoundError):
+            CSVFollower('/non/existent/file.csv')
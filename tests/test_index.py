@@ -0,0 +1,106 @@
+"""Tests for transaction offset index module."""
+
+import gzip
+import pytest
+import tempfile
+from pathlib import Path
+
+from etl.index import build_index, lookup
+from etl.loader import load_csv, CSVFileNotFoundError
+
+
+class TestTransactionIndex:
+    """Test cases for build_index and lookup functions."""
+    
+    @pytest.fixture
+    def indexed_csv(self):
+        """Create a CSV file with unsorted transaction IDs."""
+        with tempfile.TemporaryDirectory() as directory:
+            csv_path = Path(directory) / 'transactions.csv'
+            lines = ['transaction_id,transaction_date,customer_id,account_id,amount,currency\n']
+            for i in (5, 3, 9, 1, 7):
+                lines.append(f'TXN{i:07d},2024-02-21,CUST{i:05d},ACC{i:05d},{i}00.00,IDR\n')
+            lines.append('TXN0000002,2024-02-21,"CUST,00002",ACC00002,200.00,USD\n')
+            csv_path.write_text(''.join(lines))
+            yield str(csv_path)
+    
+    def test_lookup_matches_load_csv(self, indexed_csv):
+        """Test every looked-up row equals the row from load_csv."""
+        for row in load_csv(indexed_csv):
+            assert lookup(indexed_csv, row['transaction_id']) == row
+    
+    def test_lookup_quoted_row(self, indexed_csv):
+        """Test rows with quoted commas are parsed correctly."""
+        row = lookup(indexed_csv, 'TXN0000002')
+        
+        assert row['customer_id'] == 'CUST,00002'
+        assert row['currency'] == 'USD'
+    
+    def test_lookup_missing_id(self, indexed_csv):
+        """Test unknown IDs return None."""
+        assert lookup(indexed_csv, 'TXN0000004') is None
+        assert lookup(indexed_csv, 'TXN00000001') is None
+    
+    def test_index_built_on_first_lookup(self, indexed_csv):
+        """Test the sidecar index file is created next to the CSV."""
+        lookup(indexed_csv, 'TXN0000001')
+        
+        assert Path(indexed_csv + '.idx').exists()
+    
+    def test_stale_index_rebuilt(self, indexed_csv):
+        """Test appending rows invalidates and rebuilds the index."""
+        build_index(indexed_csv)
+        with open(indexed_csv, 'a') as f:
+            f.write('TXN0000042,2024-02-22,CUST00042,ACC00042,42.00,SGD\n')
+        
+        row = lookup(indexed_csv, 'TXN0000042')
+        
+        assert row['amount'] == '42.00'
+    
+    def test_custom_index_path(self, indexed_csv):
+        """Test index can be written to an explicit location."""
+        index_path = str(Path(indexed_csv).with_name('custom.idx'))
+        
+        assert build_index(indexed_csv, index_path) == Path(index_path)
+        assert lookup(indexed_csv, 'TXN0000009', index_path=index_path)['amount'] == '900.00'
+    
+    def test_file_not_found(self):
+        """Test CSVFileNotFoundError for non-existent file."""
+        with pytest.raises(CSVFileNotFoundError):
+            lookup('/non/existent/file.csv', 'TXN0000001')
+    
+    def test_chunked_build_matches_single_chunk(self, indexed_csv):
+        """Test merging many sorted runs gives the same index as one chunk."""
+        with open(indexed_csv, 'a') as f:
+            f.write('TXN0000003,2024-02-23,CUST99999,ACC99999,1.00,SGD\n')
+        whole = Path(build_index(indexed_csv, indexed_csv + '.whole')).read_bytes()
+        
+        chunked = build_index(indexed_csv, chunk_entries=2)
+        
+        assert chunked.read_bytes() == whole
+        assert lookup(indexed_csv, 'TXN0000003')['customer_id'] == 'CUST00003'
+        assert sorted(path.name for path in chunked.parent.iterdir()) == [
+            'transactions.csv', 'transactions.csv.idx', 'transactions.csv.whole'
+        ]
+    
+    def test_quoted_line_break(self, indexed_csv):
+        """Test a quoted field spanning lines is indexed as one record."""
+        with open(indexed_csv, 'a') as f:
+            f.write('TXN0000011,2024-02-23,"CUST\nTXN0000012",ACC00011,11.00,SGD\n')
+            f.write('TXN0000013,2024-02-23,CUST00013,ACC00013,13.00,SGD\n')
+        
+        assert lookup(indexed_csv, 'TXN0000011')['customer_id'] == 'CUST\nTXN0000012'
+        assert lookup(indexed_csv, 'TXN0000012') is None
+        assert lookup(indexed_csv, 'TXN0000013')['amount'] == '13.00'
+    
+    def test_compressed_input_rejected(self):
+        """Test compressed files raise a clear ValueError."""
+        with tempfile.NamedTemporaryFile(suffix='.csv.gz', delete=False) as f:
+            f.write(gzip.compress(b'transaction_id,amount\nTXN0000001,1.00\n'))
+            temp_path = f.name
+        
+        try:
+            with pytest.raises(ValueError, match='compressed'):
+                build_index(temp_path)
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
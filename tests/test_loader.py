@@ -1,16 +1,46 @@
 """Tests for CSV loader module."""
 
+import asyncio
+import bz2
+import gzip
+import lzma
+import math
 import pytest
 import tempfile
+import threading
 import csv
+import io
+from collections import Counter
+from array import array
+from datetime import date
+
+from etl.validator import validate_transaction
+from etl.cleaner import clean_transaction
+from etl.transformer import transform_transaction
+from etl.record import Transaction
 from pathlib import Path
 
 from etl.loader import (
     load_csv,
+    iter_csv,
+    load_csv_batches,
+    aload_csv,
+    iter_csv_mmap,
+    load_csv_parallel,
+    iter_csv_parallel,
+    load_csv_columnar,
+    CategoricalColumn,
+    RowFilter,
+    QuarantinePolicy,
+    count_rows,
+    csv_file_stats,
+    sample_csv,
     CSVFileNotFoundError,
     CSVEmptyRowError,
     CSVColumnMismatchError,
-    CSVMissingMandatoryFieldError
+    CSVMissingMandatoryFieldError,
+    CSVErrorRateExceededError,
+    _ReadAheadLines
 )
 
 
@@ -156,3 +186,1201 @@ class TestLoadCSV:
             assert rows[2]['transaction_id'] == 'TXN0000003'
         finally:
             Path(temp_path).unlink(missing_ok=True)
+
+
+class TestIterCSV:
+    """Test cases for iter_csv streaming generator."""
+    
+    def test_yields_rows_lazily(self, temp_csv_file):
+        """Test iter_csv returns a generator yielding row dicts."""
+        rows = iter_csv(temp_csv_file)
+        
+        assert not isinstance(rows, list)
+        first = next(rows)
+        assert first['transaction_id'] == 'TXN0000001'
+        assert first['amount'] == '5000.50'
+        with pytest.raises(StopIteration):
+            next(rows)
+    
+    def test_matches_load_csv(self, temp_csv_file):
+        """Test iter_csv yields the same rows as load_csv."""
+        assert list(iter_csv(temp_csv_file)) == load_csv(temp_csv_file)
+    
+    def test_file_not_found_raised_eagerly(self):
+        """Test CSVFileNotFoundError is raised before iteration starts."""
+        with pytest.raises(CSVFileNotFoundError):
+            iter_csv('/non/existent/file.csv')
+    
+    def test_empty_row_after_valid_rows(self):
+        """Test valid rows are yielded before CSVEmptyRowError is raised."""
+        with tempfile.NamedTemporaryFile(
+            mode='w', suffix='.csv', delete=False, newline=''
+        ) as f:
+            f.write('transaction_id,transaction_date,customer_id,account_id,amount,currency\n')
+            f.write('TXN0000001,2024-02-21,CUST00001,ACC00001,5000.50,IDR\n')
+            f.write(',,,,,\n')
+            temp_path = f.name
+        
+        try:
+            rows = iter_csv(temp_path)
+            assert next(rows)['transaction_id'] == 'TXN0000001'
+            with pytest.raises(CSVEmptyRowError, match='line 3'):
+                next(rows)
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+    
+    def test_extra_columns_raise_mismatch(self):
+        """Test CSVColumnMismatchError for rows with extra columns."""
+        with tempfile.NamedTemporaryFile(
+            mode='w', suffix='.csv', delete=False, newline=''
+        ) as f:
+            f.write('transaction_id,transaction_date,customer_id,account_id,amount,currency\n')
+            f.write('TXN0000001,2024-02-21,CUST00001,ACC00001,5000.50,IDR,EXTRA\n')
+            temp_path = f.name
+        
+        try:
+            with pytest.raises(CSVColumnMismatchError):
+                list(iter_csv(temp_path))
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+
+
+class TestLoadCSVBatches:
+    """Test cases for load_csv_batches function."""
+    
+    @pytest.fixture
+    def seven_row_csv(self):
+        """Create a CSV file with seven data rows."""
+        with tempfile.NamedTemporaryFile(
+            mode='w', suffix='.csv', delete=False, newline=''
+        ) as f:
+            f.write('transaction_id,transaction_date,customer_id,account_id,amount,currency\n')
+            for i in range(1, 8):
+                f.write(f'TXN{i:07d},2024-02-21,CUST{i:05d},ACC{i:05d},{5000 + i}.50,IDR\n')
+            temp_path = f.name
+        
+        yield temp_path
+        
+        Path(temp_path).unlink(missing_ok=True)
+    
+    def test_fixed_size_batches(self, seven_row_csv):
+        """Test rows are grouped into batches of batch_size."""
+        batches = list(load_csv_batches(seven_row_csv, batch_size=3))
+        
+        assert [len(rows) for _, rows in batches] == [3, 3, 1]
+        assert batches[1][1][0]['transaction_id'] == 'TXN0000004'
+    
+    def test_batch_start_line_numbers(self, seven_row_csv):
+        """Test each batch reports the line number of its first row."""
+        starts = [start for start, _ in load_csv_batches(seven_row_csv, batch_size=3)]
+        
+        assert starts == [2, 5, 8]
+    
+    def test_batches_cover_all_rows(self, seven_row_csv):
+        """Test concatenated batches equal load_csv output."""
+        rows = [
+            row
+            for _, batch in load_csv_batches(seven_row_csv, batch_size=2)
+            for row in batch
+        ]
+        
+        assert rows == load_csv(seven_row_csv)
+    
+    def test_invalid_batch_size(self, seven_row_csv):
+        """Test ValueError for non-positive batch_size."""
+        with pytest.raises(ValueError):
+            load_csv_batches(seven_row_csv, batch_size=0)
+    
+    def test_file_not_found(self):
+        """Test CSVFileNotFoundError for non-existent file."""
+        with pytest.raises(CSVFileNotFoundError):
+            load_csv_batches('/non/existent/file.csv')
+
+
+class TestLoadCSVParallel:
+    """Test cases for parallel byte-range CSV loading."""
+    
+    HEADER = 'transaction_id,transaction_date,customer_id,account_id,amount,currency\n'
+    
+    def _write_csv(self, lines):
+        """Write header plus given data lines to a temp CSV file."""
+        with tempfile.NamedTemporaryFile(
+            mode='w', suffix='.csv', delete=False, newline=''
+        ) as f:
+            f.write(self.HEADER)
+            f.writelines(lines)
+            return f.name
+    
+    def test_matches_load_csv_order(self):
+        """Test parallel load returns the same rows in file order."""
+        temp_path = self._write_csv([
+            f'TXN{i:07d},2024-02-21,CUST{i:05d},ACC{i:05d},{5000 + i}.50,IDR\n'
+            for i in range(1, 201)
+        ])
+        
+        try:
+            rows = load_csv_parallel(temp_path, workers=2, min_partition_bytes=256)
+            assert rows == load_csv(temp_path)
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+    
+    def test_empty_row_line_number(self):
+        """Test CSVEmptyRowError reports the absolute line number."""
+        lines = [
+            f'TXN{i:07d},2024-02-21,CUST{i:05d},ACC{i:05d},{5000 + i}.50,IDR\n'
+            for i in range(1, 101)
+        ]
+        lines[79] = ',,,,,\n'
+        temp_path = self._write_csv(lines)
+        
+        try:
+            with pytest.raises(CSVEmptyRowError, match='line 81'):
+                load_csv_parallel(temp_path, workers=2, min_partition_bytes=256)
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+    
+    def test_column_mismatch_line_number(self):
+        """Test CSVColumnMismatchError reports the absolute line number."""
+        lines = [
+            f'TXN{i:07d},2024-02-21,CUST{i:05d},ACC{i:05d},{5000 + i}.50,IDR\n'
+            for i in range(1, 101)
+        ]
+        lines[59] = lines[59].rstrip('\n') + ',EXTRA\n'
+        temp_path = self._write_csv(lines)
+        
+        try:
+            with pytest.raises(CSVColumnMismatchError, match='Row 61'):
+                load_csv_parallel(temp_path, workers=2, min_partition_bytes=256)
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+    
+    def test_projection_filter_and_types_match_iter_csv(self):
+        """Test workers apply columns, row_filter and typed like iter_csv."""
+        temp_path = self._write_csv([
+            f'TXN{i:07d},2024-02-{i % 28 + 1:02d},CUST{i:05d},ACC{i:05d},'
+            f'{i * 10}.50,{"IDR" if i % 3 else "USD"}\n'
+            for i in range(1, 201)
+        ])
+        options = {
+            'columns': ['transaction_id', 'transaction_date', 'amount'],
+            'row_filter': RowFilter(currencies={'usd'}, min_amount=500),
+            'typed': True,
+        }
+        
+        try:
+            rows = load_csv_parallel(temp_path, workers=2, min_partition_bytes=256, **options)
+            assert rows == list(iter_csv(temp_path, **options))
+            assert len(rows) == 50
+            assert isinstance(rows[0]['transaction_date'], date)
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+    
+    def test_error_line_number_with_filter(self):
+        """Test rows dropped by the filter still count toward line numbers."""
+        lines = [
+            f'TXN{i:07d},2024-02-21,CUST{i:05d},ACC{i:05d},{5000 + i}.50,IDR\n'
+            for i in range(1, 101)
+        ]
+        lines[79] = ',,,,,\n'
+        temp_path = self._write_csv(lines)
+        
+        try:
+            with pytest.raises(CSVEmptyRowError, match='line 81'):
+                load_csv_parallel(
+                    temp_path, workers=2, min_partition_bytes=256,
+                    row_filter=RowFilter(currencies={'USD'})
+                )
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+    
+    def test_unknown_column_fails_before_parsing(self):
+        """Test a projected column missing from the header raises."""
+        temp_path = self._write_csv(['TXN0000001,2024-02-21,CUST00001,ACC00001,10.50,IDR\n'])
+        
+        try:
+            with pytest.raises(CSVMissingMandatoryFieldError):
+                load_csv_parallel(temp_path, workers=2, columns=['region'])
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+    
+    def test_quoted_line_breaks_across_partitions(self):
+        """Test quoted fields with line breaks are never split between partitions."""
+        temp_path = self._write_csv([
+            f'TXN{i:07d},2024-02-21,"CUST\n{i:05d}\n""x""\n",ACC{i:05d},{5000 + i}.50,IDR\n'
+            for i in range(1, 201)
+        ])
+        
+        try:
+            for min_partition_bytes in (7, 64, 256):
+                rows = load_csv_parallel(
+                    temp_path, workers=2, min_partition_bytes=min_partition_bytes
+                )
+                assert rows == load_csv(temp_path)
+            assert rows[0]['customer_id'] == 'CUST\n00001\n"x"\n'
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+    
+    def test_header_only_file(self):
+        """Test file with header but no data rows."""
+        temp_path = self._write_csv([])
+        
+        try:
+            assert list(iter_csv_parallel(temp_path, workers=2)) == []
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+    
+    def test_missing_mandatory_columns(self):
+        """Test CSVMissingMandatoryFieldError for missing columns."""
+        with tempfile.NamedTemporaryFile(
+            mode='w', suffix='.csv', delete=False, newline=''
+        ) as f:
+            f.write('transaction_id,customer_id\nTXN0000001,CUST00001\n')
+            temp_path = f.name
+        
+        try:
+            with pytest.raises(CSVMissingMandatoryFieldError):
+                load_csv_parallel(temp_path, workers=2)
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+
+
+class TestLoadCSVColumnar:
+    """Test cases for load_csv_columnar function."""
+    
+    def test_column_types(self, temp_csv_file):
+        """Test each column gets the expected storage type."""
+        columns = load_csv_columnar(temp_csv_file)
+        
+        assert isinstance(columns['amount'], array)
+        assert columns['amount'].typecode == 'd'
+        assert isinstance(columns['risk_score'], array)
+        assert isinstance(columns['currency'], CategoricalColumn)
+        assert isinstance(columns['region'], CategoricalColumn)
+        assert isinstance(columns['channel'], CategoricalColumn)
+        assert columns['transaction_id'] == ['TXN0000001']
+    
+    def test_values(self, temp_csv_file):
+        """Test column values match the row-oriented load."""
+        columns = load_csv_columnar(temp_csv_file)
+        
+        assert columns['amount'][0] == 5000.50
+        assert columns['risk_score'][0] == 0.1
+        assert columns['currency'].decode() == ['IDR']
+    
+    def test_categorical_codes_shared(self):
+        """Test repeated categorical values share one code."""
+        with tempfile.NamedTemporaryFile(
+            mode='w', suffix='.csv', delete=False, newline=''
+        ) as f:
+            f.write('transaction_id,transaction_date,customer_id,account_id,amount,currency\n')
+            f.write('TXN0000001,2024-02-21,CUST00001,ACC00001,10,IDR\n')
+            f.write('TXN0000002,2024-02-21,CUST00002,ACC00002,,USD\n')
+            f.write('TXN0000003,2024-02-21,CUST00003,ACC00003,abc,IDR\n')
+            temp_path = f.name
+        
+        try:
+            columns = load_csv_columnar(temp_path)
+            currency = columns['currency']
+            
+            assert list(currency.codes) == [0, 1, 0]
+            assert currency.categories == ['IDR', 'USD']
+            assert len(currency) == 3
+            assert columns['amount'][0] == 10.0
+            assert math.isnan(columns['amount'][1])
+            assert math.isnan(columns['amount'][2])
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+    
+    def test_header_only_file(self):
+        """Test header-only file yields empty columns."""
+        with tempfile.NamedTemporaryFile(
+            mode='w', suffix='.csv', delete=False, newline=''
+        ) as f:
+            f.write('transaction_id,transaction_date,customer_id,account_id,amount,currency\n')
+            temp_path = f.name
+        
+        try:
+            columns = load_csv_columnar(temp_path)
+            assert len(columns['amount']) == 0
+            assert columns['transaction_id'] == []
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+
+
+class TestColumnProjection:
+    """Test cases for the columns argument of the loaders."""
+    
+    PROJECTED = ['transaction_id', 'transaction_date', 'amount', 'currency', 'customer_id']
+    
+    def test_load_csv_projection(self, temp_csv_file):
+        """Test load_csv keeps only the requested columns, in requested order."""
+        rows = load_csv(temp_csv_file, columns=self.PROJECTED)
+        
+        assert list(rows[0].keys()) == self.PROJECTED
+        assert rows[0]['amount'] == '5000.50'
+        assert 'region' not in rows[0]
+    
+    def test_projection_matches_full_load(self, temp_csv_file):
+        """Test projected values equal the values from a full load."""
+        full = load_csv(temp_csv_file)[0]
+        projected = load_csv(temp_csv_file, columns=self.PROJECTED)[0]
+        
+        assert projected == {key: full[key] for key in self.PROJECTED}
+    
+    def test_unknown_column(self, temp_csv_file):
+        """Test CSVMissingMandatoryFieldError for columns not in the header."""
+        with pytest.raises(CSVMissingMandatoryFieldError):
+            load_csv(temp_csv_file, columns=['transaction_id', 'not_a_column'])
+    
+    def test_mandatory_columns_still_checked(self):
+        """Test mandatory header check applies even with a projection."""
+        with tempfile.NamedTemporaryFile(
+            mode='w', suffix='.csv', delete=False, newline=''
+        ) as f:
+            f.write('transaction_id,customer_id\nTXN0000001,CUST00001\n')
+            temp_path = f.name
+        
+        try:
+            with pytest.raises(CSVMissingMandatoryFieldError):
+                load_csv(temp_path, columns=['transaction_id'])
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+    
+    def test_row_checks_use_all_columns(self):
+        """Test empty rows are detected even when projected columns are empty."""
+        with tempfile.NamedTemporaryFile(
+            mode='w', suffix='.csv', delete=False, newline=''
+        ) as f:
+            f.write('transaction_id,transaction_date,customer_id,account_id,amount,currency\n')
+            f.write(',,,,,\n')
+            temp_path = f.name
+        
+        try:
+            with pytest.raises(CSVEmptyRowError):
+                load_csv(temp_path, columns=['transaction_id'])
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+    
+    def test_batches_and_columnar_projection(self, temp_csv_file):
+        """Test projection is supported by batch and columnar loaders."""
+        _, batch = next(load_csv_batches(temp_csv_file, columns=['amount']))
+        columns = load_csv_columnar(temp_csv_file, columns=['amount', 'currency'])
+        
+        assert batch == [{'amount': '5000.50'}]
+        assert set(columns) == {'amount', 'currency'}
+
+
+class TestRowFilter:
+    """Test cases for predicate pushdown during CSV load."""
+    
+    @pytest.fixture
+    def mixed_csv(self):
+        """Create a CSV file with varied dates, currencies, regions and amounts."""
+        with tempfile.NamedTemporaryFile(
+            mode='w', suffix='.csv', delete=False, newline=''
+        ) as f:
+            f.write('transaction_id,transaction_date,customer_id,account_id,amount,currency,region\n')
+            f.write('TXN0000001,2024-02-21,CUST00001,ACC00001,100.00,IDR,JKT\n')
+            f.write('TXN0000002,22/02/2024,CUST00002,ACC00002,5000.00,USD,BDG\n')
+            f.write('TXN0000003,2024-02-23,CUST00003,ACC00003,250.00,sgd,JKT\n')
+            f.write('TXN0000004,invalid,CUST00004,ACC00004,abc,IDR,MDN\n')
+            temp_path = f.name
+        
+        yield temp_path
+        
+        Path(temp_path).unlink(missing_ok=True)
+    
+    def _ids(self, rows):
+        return [row['transaction_id'] for row in rows]
+    
+    def test_date_range_both_formats(self, mixed_csv):
+        """Test inclusive date range over ISO and DD/MM/YYYY dates."""
+        rows = load_csv(mixed_csv, row_filter=RowFilter(
+            date_from='2024-02-22', date_to=date(2024, 2, 23)
+        ))
+        
+        assert self._ids(rows) == ['TXN0000002', 'TXN0000003']
+    
+    def test_currency_set_case_insensitive(self, mixed_csv):
+        """Test currency membership ignores case."""
+        rows = load_csv(mixed_csv, row_filter=RowFilter(currencies={'SGD', 'USD'}))
+        
+        assert self._ids(rows) == ['TXN0000002', 'TXN0000003']
+    
+    def test_region_and_min_amount(self, mixed_csv):
+        """Test combined region and minimum amount conditions."""
+        rows = load_csv(mixed_csv, row_filter=RowFilter(regions={'JKT'}, min_amount=200))
+        
+        assert self._ids(rows) == ['TXN0000003']
+    
+    def test_unparseable_values_dropped(self, mixed_csv):
+        """Test rows with unparseable filtered fields are excluded."""
+        rows = load_csv(mixed_csv, row_filter=RowFilter(min_amount=0))
+        
+        assert 'TXN0000004' not in self._ids(rows)
+    
+    def test_missing_filter_column(self):
+        """Test CSVMissingMandatoryFieldError when a filtered column is absent."""
+        with tempfile.NamedTemporaryFile(
+            mode='w', suffix='.csv', delete=False, newline=''
+        ) as f:
+            f.write('transaction_id,transaction_date,customer_id,account_id,amount,currency\n')
+            f.write('TXN0000001,2024-02-21,CUST00001,ACC00001,100.00,IDR\n')
+            temp_path = f.name
+        
+        try:
+            with pytest.raises(CSVMissingMandatoryFieldError):
+                load_csv(temp_path, row_filter=RowFilter(regions={'JKT'}))
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+    
+    def test_batches_keep_line_numbers(self, mixed_csv):
+        """Test filtered batches report the file line of their first row."""
+        batches = list(load_csv_batches(
+            mixed_csv, batch_size=10, row_filter=RowFilter(currencies={'USD'})
+        ))
+        
+        assert batches[0][0] == 3
+        assert self._ids(batches[0][1]) == ['TXN0000002']
+
+
+class TestCompressedInput:
+    """Test cases for transparent decompression of CSV input."""
+    
+    CONTENT = (
+        'transaction_id,transaction_date,customer_id,account_id,amount,currency\n'
+        'TXN0000001,2024-02-21,CUST00001,ACC00001,5000.50,IDR\n'
+        'TXN0000002,2024-02-22,CUST00002,ACC00002,100.00,USD\n'
+    )
+    
+    @pytest.mark.parametrize('suffix,compress', [
+        ('.csv.gz', gzip.compress),
+        ('.csv.bz2', bz2.compress),
+        ('.csv.xz', lzma.compress),
+    ])
+    def test_load_compressed(self, suffix, compress):
+        """Test load_csv reads gzip, bz2 and xz files."""
+        with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as f:
+            f.write(compress(self.CONTENT.encode('utf-8')))
+            temp_path = f.name
+        
+        try:
+            rows = load_csv(temp_path)
+            assert [row['transaction_id'] for row in rows] == ['TXN0000001', 'TXN0000002']
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+    
+    def test_detects_by_magic_bytes(self):
+        """Test gzip input is detected without a .gz extension."""
+        with tempfile.NamedTemporaryFile(suffix='.csv', delete=False) as f:
+            f.write(gzip.compress(self.CONTENT.encode('utf-8')))
+            temp_path = f.name
+        
+        try:
+            assert len(load_csv(temp_path)) == 2
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+    
+    def test_parallel_falls_back_for_compressed(self):
+        """Test parallel loader reads compressed input sequentially."""
+        with tempfile.NamedTemporaryFile(suffix='.csv.gz', delete=False) as f:
+            f.write(gzip.compress(self.CONTENT.encode('utf-8')))
+            temp_path = f.name
+        
+        try:
+            assert load_csv_parallel(temp_path, workers=2) == load_csv(temp_path)
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+
+
+class TestIterCSVMmap:
+    """Test cases for the memory-mapped CSV reader."""
+    
+    HEADER = 'transaction_id,transaction_date,customer_id,account_id,amount,currency\n'
+    
+    def _write_csv(self, body):
+        """Write header plus raw body text to a temp CSV file."""
+        with tempfile.NamedTemporaryFile(
+            mode='w', suffix='.csv', delete=False, newline=''
+        ) as f:
+            f.write(self.HEADER + body)
+            return f.name
+    
+    def test_matches_load_csv(self, temp_csv_file):
+        """Test mmap reader yields the same rows as load_csv."""
+        assert list(iter_csv_mmap(temp_csv_file)) == load_csv(temp_csv_file)
+    
+    def test_projection(self, temp_csv_file):
+        """Test only requested fields are returned."""
+        rows = list(iter_csv_mmap(temp_csv_file, columns=['amount', 'transaction_id']))
+        
+        assert rows == [{'amount': '5000.50', 'transaction_id': 'TXN0000001'}]
+    
+    def test_quoted_fields_and_crlf(self):
+        """Test quoted commas and CRLF line endings are handled."""
+        temp_path = self._write_csv(
+            'TXN0000001,2024-02-21,"CUST,00001",ACC00001,5000.50,IDR\r\n'
+            '\r\n'
+            'TXN0000002,2024-02-22,CUST00002,ACC00002,10.00,USD'
+        )
+        
+        try:
+            rows = list(iter_csv_mmap(temp_path))
+            assert rows == load_csv(temp_path)
+            assert rows[0]['customer_id'] == 'CUST,00001'
+            assert rows[1]['currency'] == 'USD'
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+    
+    def test_short_row_padded_with_none(self):
+        """Test missing trailing fields are None, as in load_csv."""
+        temp_path = self._write_csv('TXN0000001,2024-02-21,CUST00001\n')
+        
+        try:
+            rows = list(iter_csv_mmap(temp_path))
+            assert rows == load_csv(temp_path)
+            assert rows[0]['currency'] is None
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+    
+    def test_empty_row(self):
+        """Test CSVEmptyRowError reports the line number."""
+        temp_path = self._write_csv(
+            'TXN0000001,2024-02-21,CUST00001,ACC00001,5000.50,IDR\n,,,,,\n'
+        )
+        
+        try:
+            with pytest.raises(CSVEmptyRowError, match='line 3'):
+                list(iter_csv_mmap(temp_path, columns=['amount']))
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+    
+    def test_column_mismatch(self):
+        """Test CSVColumnMismatchError for rows with extra columns."""
+        temp_path = self._write_csv(
+            'TXN0000001,2024-02-21,CUST00001,ACC00001,5000.50,IDR,EXTRA\n'
+        )
+        
+        try:
+            with pytest.raises(CSVColumnMismatchError):
+                list(iter_csv_mmap(temp_path))
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+    
+    def test_quoted_line_breaks(self):
+        """Test quoted fields with embedded newlines stay in one row."""
+        temp_path = self._write_csv(
+            'TXN0000001,2024-02-21,"CU\nST",ACC00001,5000.50,IDR\n'
+            'TXN0000002,2024-02-22,CU"ST,ACC00002,10.00,USD\n'
+        )
+        
+        try:
+            rows = list(iter_csv_mmap(temp_path))
+            assert rows == load_csv(temp_path)
+            assert len(rows) == 2
+            assert rows[0]['customer_id'] == 'CU\nST'
+            assert rows[1]['customer_id'] == 'CU"ST'
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+    
+    def test_records_across_blocks(self, monkeypatch):
+        """Test tiny blocks, including quoted records spanning blocks, match load_csv."""
+        temp_path = self._write_csv(
+            'TXN0000001,2024-02-21,CUST00001,ACC00001,1.00,IDR\r\n'
+            'TXN0000002,2024-02-21,"CUST\r\n\r\n00002",ACC00002,2.00,IDR\r\n'
+            '\r\n'
+            'TXN0000003,2024-02-21,CUST00003\r\n'
+            'TXN0000004,2024-02-21,"CUST ""4""",ACC00004,4.00,IDR\r\n'
+            'TXN0000005,2024-02-21,CUST00005,ACC00005,5.00,IDR'
+        )
+        
+        try:
+            expected = load_csv(temp_path)
+            for block_size in (1, 7, 40, 100, 10_000):
+                monkeypatch.setattr('etl.loader.MMAP_BLOCK_SIZE', block_size)
+                assert list(iter_csv_mmap(temp_path)) == expected
+                assert list(iter_csv_mmap(temp_path, columns=['customer_id'])) == [
+                    {'customer_id': row['customer_id']} for row in expected
+                ]
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+    
+    def test_matches_load_csv_on_sample_data(self):
+        """Test the block fast path on the sample data."""
+        path = 'data/banking_transactions.csv'
+        
+        assert list(iter_csv_mmap(path)) == load_csv(path)
+    
+    def test_empty_file(self):
+        """Test CSVMissingMandatoryFieldError for an empty file."""
+        with tempfile.NamedTemporaryFile(suffix='.csv', delete=False) as f:
+            temp_path = f.name
+        
+        try:
+            with pytest.raises(CSVMissingMandatoryFieldError):
+                list(iter_csv_mmap(temp_path))
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+
+
+class TestTypedLoad:
+    """Test cases for parsing typed columns at load time."""
+    
+    def test_typed_values(self, temp_csv_file):
+        """Test amount, risk_score and transaction_date are parsed."""
+        row = load_csv(temp_csv_file, typed=True)[0]
+        
+        assert row['amount'] == 5000.50
+        assert row['risk_score'] == 0.1
+        assert row['transaction_date'] == date(2024, 2, 21)
+        assert row['value_date'] == '2024-02-22'
+    
+    def test_unparseable_values_kept_raw(self):
+        """Test fields that fail to parse keep their raw string."""
+        with tempfile.NamedTemporaryFile(
+            mode='w', suffix='.csv', delete=False, newline=''
+        ) as f:
+            f.write('transaction_id,transaction_date,customer_id,account_id,amount,currency\n')
+            f.write('TXN0000001,21/02/2024,CUST00001,ACC00001,abc,IDR\n')
+            f.write('TXN0000002,2024-13-45,CUST00002,ACC00002,,IDR\n')
+            temp_path = f.name
+        
+        try:
+            rows = load_csv(temp_path, typed=True)
+            assert rows[0]['transaction_date'] == date(2024, 2, 21)
+            assert rows[0]['amount'] == 'abc'
+            assert rows[1]['transaction_date'] == '2024-13-45'
+            assert rows[1]['amount'] == ''
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+    
+    def test_pipeline_output_unchanged(self):
+        """Test typed and untyped loads give identical pipeline output."""
+        path = 'data/banking_transactions.csv'
+        
+        def run(rows):
+            results = []
+            for row in rows:
+                try:
+                    results.append(
+                        transform_transaction(clean_transaction(validate_transaction(row)))
+                    )
+                except Exception as e:
+                    results.append(type(e).__name__)
+            return results
+        
+        _, raw = next(load_csv_batches(path, batch_size=500))
+        _, typed = next(load_csv_batches(path, batch_size=500, typed=True))
+        
+        assert run(typed) == run(raw)
+
+
+class TestRecordLoad:
+    """Test cases for loading rows as Transaction records."""
+    
+    def test_records_match_dict_rows(self, temp_csv_file):
+        """Test records hold the same fields and values as dict rows."""
+        records = load_csv(temp_csv_file, as_records=True)
+        
+        assert isinstance(records[0], Transaction)
+        assert records[0] == load_csv(temp_csv_file)[0]
+        assert records[0].amount == '5000.50'
+    
+    def test_records_with_projection_and_types(self, temp_csv_file):
+        """Test records combine with column projection and typed parsing."""
+        record = load_csv(
+            temp_csv_file, columns=['transaction_id', 'amount'], typed=True, as_records=True
+        )[0]
+        
+        assert record.keys() == ['transaction_id', 'amount']
+        assert record['amount'] == 5000.50
+        assert 'currency' not in record
+    
+    def test_records_match_dict_rows_on_sample_data(self):
+        """Test positional and fallback record building give the dict rows."""
+        path = 'data/banking_transactions.csv'
+        
+        assert load_csv(path, as_records=True) == load_csv(path)
+    
+    def test_short_row_record(self, temp_csv_file):
+        """Test a short row falls back to named fields and pads with None."""
+        with open(temp_csv_file, 'a', newline='') as f:
+            f.write('TXN0000002,2024-02-22\r\n')
+        
+        record = load_csv(temp_csv_file, as_records=True)[1]
+        
+        assert record['transaction_date'] == '2024-02-22'
+        assert record['currency'] is None
+        assert record == load_csv(temp_csv_file)[1]
+    
+    def test_pipeline_on_records(self):
+        """Test the pipeline keeps Transaction records and gives the same output."""
+        path = 'data/banking_transactions.csv'
+        _, rows = next(load_csv_batches(path, batch_size=50))
+        _, records = next(load_csv_batches(path, batch_size=50, as_records=True))
+        
+        for row, record in zip(rows, records):
+            try:
+                expected = transform_transaction(clean_transaction(validate_transaction(row)))
+            except Exception as e:
+                with pytest.raises(type(e)):
+                    validate_transaction(record)
+                continue
+            
+            result = transform_transaction(clean_transaction(validate_transaction(record)))
+            assert isinstance(result, Transaction)
+            assert result.to_dict() == expected
+
+
+class TestRowCounting:
+    """Test cases for count_rows and csv_file_stats functions."""
+    
+    def _write_bytes(self, content, suffix='.csv'):
+        """Write raw bytes to a temp file."""
+        with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as f:
+            f.write(content)
+            return f.name
+    
+    def test_count_matches_load_csv(self):
+        """Test count_rows equals len(load_csv) on the sample data."""
+        path = 'data/banking_transactions.csv'
+        
+        assert count_rows(path) == len(load_csv(path))
+    
+    def test_blank_lines_and_missing_final_newline(self):
+        """Test blank lines are reported and excluded from data rows."""
+        temp_path = self._write_bytes(
+            b'transaction_id,transaction_date,customer_id,account_id,amount,currency\r\n'
+            b'TXN0000001,2024-02-21,CUST00001,ACC00001,1.00,IDR\r\n'
+            b'\r\n'
+            b'\n'
+            b'TXN0000002,2024-02-21,CUST00002,ACC00002,2.00,IDR'
+        )
+        
+        try:
+            stats = csv_file_stats(temp_path)
+            assert stats.lines == 5
+            assert stats.blank_lines == 2
+            assert stats.data_rows == 2 == len(load_csv(temp_path))
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+    
+    def test_quoted_line_breaks(self):
+        """Test line breaks inside quoted fields do not end rows."""
+        temp_path = self._write_bytes(
+            b'transaction_id,transaction_date,customer_id,account_id,amount,currency\n'
+            b'TXN0000001,2024-02-21,"CUST\n\n00001",ACC00001,1.00,IDR\n'
+            b'TXN0000002,2024-02-21,"CUST ""Q"" 2",ACC00002,2.00,IDR\n'
+        )
+        
+        try:
+            stats = csv_file_stats(temp_path)
+            assert stats.quoted_line_breaks == 2
+            assert stats.blank_lines == 0
+            assert stats.data_rows == 2 == len(load_csv(temp_path))
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+    
+    def test_compressed_file(self):
+        """Test rows are counted through decompression."""
+        temp_path = self._write_bytes(gzip.compress(
+            b'transaction_id,transaction_date,customer_id,account_id,amount,currency\n'
+            b'TXN0000001,2024-02-21,CUST00001,ACC00001,1.00,IDR\n'
+        ), suffix='.csv.gz')
+        
+        try:
+            assert count_rows(temp_path) == 1
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+    
+    def test_empty_file(self):
+        """Test an empty file has no rows."""
+        temp_path = self._write_bytes(b'')
+        
+        try:
+            assert csv_file_stats(temp_path) == (0, 0, 0, 0, 0)
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+    
+    def test_file_not_found(self):
+        """Test CSVFileNotFoundError for non-existent file."""
+        with pytest.raises(CSVFileNotFoundError):
+            count_rows('/non/existent/file.csv')
+
+
+class TestQuarantine:
+    """Test cases for lenient loading with a QuarantinePolicy."""
+    
+    HEADER = 'transaction_id,transaction_date,customer_id,account_id,amount,currency\n'
+    
+    def _write_csv(self, content):
+        """Write CSV text to a temp file."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False, newline='') as f:
+            f.write(content)
+            return f.name
+    
+    def test_bad_rows_are_skipped_and_written(self):
+        """Test empty and overlong rows go to the reject file."""
+        temp_path = self._write_csv(
+            self.HEADER
+            + 'TXN0000001,2024-02-21,CUST00001,ACC00001,1.00,IDR\n'
+            + ',,,,,\n'
+            + 'TXN0000003,2024-02-21,CUST00003,ACC00003,3.00,IDR,extra\n'
+            + 'TXN0000004,2024-02-21,CUST00004,ACC00004,4.00,IDR\n'
+        )
+        reject_path = temp_path + '.rejects.csv'
+        
+        try:
+            policy = QuarantinePolicy(reject_path=reject_path, max_error_rate=1.0)
+            rows = load_csv(temp_path, quarantine=policy)
+            
+            assert [row['transaction_id'] for row in rows] == ['TXN0000001', 'TXN0000004']
+            
+            with open(reject_path, newline='') as f:
+                rejects = list(csv.DictReader(f))
+            assert [r['line_number'] for r in rejects] == ['3', '4']
+            assert [r['error'] for r in rejects] == ['CSVEmptyRowError', 'CSVColumnMismatchError']
+            assert rejects[1]['raw_row'].endswith('IDR,extra')
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+            Path(reject_path).unlink(missing_ok=True)
+    
+    def test_invalid_utf8_row_is_quarantined(self):
+        """Test a row with bytes that are not UTF-8 is rejected, not fatal."""
+        with tempfile.NamedTemporaryFile(suffix='.csv', delete=False) as f:
+            f.write(
+                self.HEADER.encode('utf-8')
+                + b'TXN0000001,2024-02-21,CUST00001,ACC00001,1.00,IDR\n'
+                + b'TXN0000002,2024-02-21,CUST\xff0002,ACC00002,2.00,IDR\n'
+                + 'TXN0000003,2024-02-21,CÜST00003,ACC00003,3.00,IDR\n'.encode('utf-8')
+            )
+            temp_path = f.name
+        reject_path = temp_path + '.rejects.csv'
+        
+        try:
+            policy = QuarantinePolicy(reject_path=reject_path, max_error_rate=1.0)
+            for read_ahead in (False, True):
+                rows = list(iter_csv(temp_path, quarantine=policy, read_ahead=read_ahead))
+                assert [row['customer_id'] for row in rows] == ['CUST00001', 'CÜST00003']
+            
+            with open(reject_path, 'rb') as f:
+                rejects = f.read().splitlines()
+            assert rejects[1].startswith(b'3,UnicodeDecodeError,')
+            assert rejects[1].endswith(b'"TXN0000002,2024-02-21,CUST\xff0002,ACC00002,2.00,IDR"')
+            
+            with pytest.raises(UnicodeDecodeError):
+                load_csv(temp_path)
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+            Path(reject_path).unlink(missing_ok=True)
+    
+    def test_oversized_field_is_quarantined(self):
+        """Test a field over the csv field size limit is rejected, not fatal."""
+        temp_path = self._write_csv(
+            self.HEADER
+            + 'TXN0000001,2024-02-21,CUST00001,ACC00001,1.00,IDR\n'
+            + 'TXN0000002,2024-02-21,' + 'X' * 200 + ',ACC00002,2.00,IDR\n'
+            + 'TXN0000003,2024-02-21,CUST00003,ACC00003,3.00,IDR\n'
+        )
+        reject_path = temp_path + '.rejects.csv'
+        limit = csv.field_size_limit(100)
+        
+        try:
+            policy = QuarantinePolicy(reject_path=reject_path, max_error_rate=1.0)
+            rows = load_csv(temp_path, quarantine=policy)
+            assert [row['transaction_id'] for row in rows] == ['TXN0000001', 'TXN0000003']
+            
+            with open(reject_path, newline='') as f:
+                rejects = list(csv.DictReader(f))
+            assert [(r['line_number'], r['error']) for r in rejects] == [('3', 'Error')]
+            assert 'field larger than field limit' in rejects[0]['reason']
+            
+            with pytest.raises(csv.Error):
+                load_csv(temp_path)
+        finally:
+            csv.field_size_limit(limit)
+            Path(temp_path).unlink(missing_ok=True)
+            Path(reject_path).unlink(missing_ok=True)
+    
+    def test_strict_mode_still_raises(self):
+        """Test bad rows still raise without a quarantine policy."""
+        temp_path = self._write_csv(self.HEADER + ',,,,,\n')
+        
+        try:
+            with pytest.raises(CSVEmptyRowError):
+                load_csv(temp_path)
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+    
+    def test_error_rate_exceeded(self):
+        """Test the load aborts once the reject rate passes the threshold."""
+        good = 'TXN0000001,2024-02-21,CUST00001,ACC00001,1.00,IDR\n'
+        temp_path = self._write_csv(self.HEADER + (good * 8 + ',,,,,\n' * 2) * 5)
+        
+        try:
+            policy = QuarantinePolicy(max_error_rate=0.1, min_rows=10)
+            with pytest.raises(CSVErrorRateExceededError):
+                load_csv(temp_path, quarantine=policy)
+            
+            # A file shorter than min_rows is still checked at end of file
+            policy = QuarantinePolicy(max_error_rate=0.1, min_rows=100)
+            with pytest.raises(CSVErrorRateExceededError):
+                load_csv(temp_path, quarantine=policy)
+            
+            policy = QuarantinePolicy(max_error_rate=0.2, min_rows=100)
+            assert len(load_csv(temp_path, quarantine=policy)) == 40
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+    
+    def test_small_file_of_empty_rows(self):
+        """Test a file below min_rows with only bad rows is not loaded as empty."""
+        temp_path = self._write_csv(self.HEADER + ',,,,,\n' * 500)
+        
+        try:
+            with pytest.raises(CSVErrorRateExceededError):
+                load_csv(temp_path, quarantine=QuarantinePolicy())
+            
+            # Stopping early does not judge the rows that were never read
+            batches = load_csv_batches(temp_path, batch_size=10, quarantine=QuarantinePolicy())
+            batches.close()
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+    
+    def test_batches_with_filter(self):
+        """Test quarantine works with batching and row filters."""
+        temp_path = self._write_csv(
+            self.HEADER
+            + 'TXN0000001,2024-02-21,CUST00001,ACC00001,1.00,IDR\n'
+            + 'TXN0000002,2024-02-21,CUST00002,ACC00002,2.00,USD,extra\n'
+            + 'TXN0000003,2024-02-21,CUST00003,ACC00003,3.00,USD\n'
+        )
+        
+        try:
+            policy = QuarantinePolicy(max_error_rate=1.0)
+            batches = list(load_csv_batches(
+                temp_path, batch_size=10,
+                row_filter=RowFilter(currencies={'USD'}), quarantine=policy
+            ))
+            assert [[row['transaction_id'] for row in rows] for _, rows in batches] == [['TXN0000003']]
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+
+
+class TestReadAhead:
+    """Test cases for the read-ahead loader thread."""
+    
+    def test_matches_plain_reading(self):
+        """Test read-ahead yields exactly the rows of a normal load."""
+        path = 'data/banking_transactions.csv'
+        
+        assert list(iter_csv(path, read_ahead=True)) == list(iter_csv(path))
+    
+    def test_small_blocks_split_lines_and_characters(self):
+        """Test lines, CRLF endings and multi-byte characters across block boundaries."""
+        content = (
+            'a,b\r\n'
+            '1,"x\r\ny"\r\n'
+            '2,Rp \u00e9\u20ac\r\n'
+            '\r\n'
+            '3,z'
+        ).encode('utf-8')
+        
+        expected = list(io.StringIO(content.decode('utf-8'), newline=''))
+        for block_size in range(1, 8):
+            with _ReadAheadLines(io.BytesIO(content), block_size=block_size) as lines:
+                assert list(lines) == expected
+    
+    def test_compressed_input(self):
+        """Test read-ahead through decompression."""
+        content = (
+            'transaction_id,transaction_date,customer_id,account_id,amount,currency\n'
+            'TXN0000001,2024-02-21,CUST00001,ACC00001,1.00,IDR\n'
+        )
+        with tempfile.NamedTemporaryFile(suffix='.csv.gz', delete=False) as f:
+            f.write(gzip.compress(content.encode('utf-8')))
+            temp_path = f.name
+        
+        try:
+            rows = list(iter_csv(temp_path, read_ahead=True))
+            assert rows[0]['transaction_id'] == 'TXN0000001'
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+    
+    def test_batches(self):
+        """Test batching over the read-ahead source."""
+        path = 'data/banking_transactions.csv'
+        
+        batches = list(load_csv_batches(path, batch_size=1000, read_ahead=True))
+        assert [start for start, _ in batches] == [2, 1002, 2002, 3002, 4002]
+    
+    def test_early_stop_ends_thread(self):
+        """Test abandoning iteration stops the reader thread."""
+        rows = iter_csv('data/banking_transactions.csv', read_ahead=True)
+        next(rows)
+        rows.close()
+        
+        assert not any(t.name == 'csv-read-ahead' for t in threading.enumerate())
+    
+    def test_row_errors_still_raised(self, temp_csv_file):
+        """Test validation errors surface through the read-ahead source."""
+        with open(temp_csv_file, 'a', newline='') as f:
+            f.write(',,,,,,,,,,,,,,\n')
+        
+        with pytest.raises(CSVEmptyRowError):
+            list(iter_csv(temp_csv_file, read_ahead=True))
+    
+    def test_decode_error_propagates(self):
+        """Test reader thread errors are raised in the consumer."""
+        with _ReadAheadLines(io.BytesIO(b'a,b\n\xff\xfe\n')) as lines:
+            with pytest.raises(UnicodeDecodeError):
+                list(lines)
+
+
+class TestAloadCSV:
+    """Test cases for aload_csv function."""
+    
+    def test_matches_load_csv_batches(self):
+        """Test async batches equal the synchronous batches."""
+        path = 'data/banking_transactions.csv'
+        
+        async def collect():
+            return [batch async for batch in aload_csv(path, batch_size=1000)]
+        
+        assert asyncio.run(collect()) == list(load_csv_batches(path, batch_size=1000))
+    
+    def test_reads_off_event_loop(self):
+        """Test the event loop keeps running while batches are read."""
+        path = 'data/banking_transactions.csv'
+        ticks = []
+        
+        async def ticker():
+            while True:
+                ticks.append(1)
+                await asyncio.sleep(0)
+        
+        async def consume():
+            task = asyncio.create_task(ticker())
+            count = 0
+            async for _, rows in aload_csv(path, batch_size=100):
+                count += len(rows)
+            task.cancel()
+            return count
+        
+        assert asyncio.run(consume()) == 5000
+        assert len(ticks) > 1
+    
+    def test_early_exit(self):
+        """Test breaking out of the loop closes the loader cleanly."""
+        path = 'data/banking_transactions.csv'
+        
+        async def first_batch():
+            batches = aload_csv(path, batch_size=10)
+            async for start_line, rows in batches:
+                await batches.aclose()
+                return start_line, len(rows)
+        
+        assert asyncio.run(first_batch()) == (2, 10)
+    
+    def test_errors_propagate(self):
+        """Test loader errors are raised in the async consumer."""
+        async def consume(path, batch_size=10):
+            return [batch async for batch in aload_csv(path, batch_size)]
+        
+        with pytest.raises(CSVFileNotFoundError):
+            asyncio.run(consume('/non/existent/file.csv'))
+        with pytest.raises(ValueError):
+            asyncio.run(consume('data/banking_transactions.csv', batch_size=0))
+    
+    def test_cancel_during_read(self, monkeypatch):
+        """Test cancelling the consumer waits for the worker before closing."""
+        reading = threading.Event()
+        release = threading.Event()
+        closed = []
+        
+        def slow_batches(*args):
+            try:
+                reading.set()
+                release.wait(5)
+                yield 2, []
+            finally:
+                closed.append(True)
+        
+        monkeypatch.setattr('etl.loader.load_csv_batches', slow_batches)
+        
+        async def consume():
+            task = asyncio.create_task(
+                anext(aload_csv('data/banking_transactions.csv'))
+            )
+            await asyncio.to_thread(reading.wait, 5)
+            task.cancel()
+            asyncio.get_running_loop().call_later(0.05, release.set)
+            with pytest.raises(asyncio.CancelledError):
+                await task
+        
+        asyncio.run(consume())
+        assert closed == [True]
+
+
+class TestSampleCSV:
+    """Test cases for sample_csv function."""
+    
+    SAMPLE_PATH = 'data/banking_transactions.csv'
+    
+    def test_sample_size_and_membership(self):
+        """Test the sample has n distinct rows taken from the file."""
+        rows = sample_csv(self.SAMPLE_PATH, 50, seed=1)
+        all_rows = load_csv(self.SAMPLE_PATH)
+        
+        ids = [row['transaction_id'] for row in rows]
+        assert len(ids) == len(set(ids)) == 50
+        assert all(row in all_rows for row in rows)
+        assert ids == sorted(ids)  # file order
+    
+    def test_seed_is_reproducible(self):
+        """Test the same seed gives the same sample."""
+        assert sample_csv(self.SAMPLE_PATH, 20, seed=7) == sample_csv(self.SAMPLE_PATH, 20, seed=7)
+        assert sample_csv(self.SAMPLE_PATH, 20, seed=7) != sample_csv(self.SAMPLE_PATH, 20, seed=8)
+    
+    def test_small_file_returns_all_rows(self, temp_csv_file):
+        """Test n larger than the file returns every row."""
+        assert sample_csv(temp_csv_file, 10, seed=0) == load_csv(temp_csv_file)
+        assert sample_csv(temp_csv_file, 0) == []
+    
+    def test_uniformity(self):
+        """Test each row is selected with roughly equal probability."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False, newline='') as f:
+            f.write('transaction_id,transaction_date,customer_id,account_id,amount,currency\n')
+            for i in range(20):
+                f.write(f'TXN{i:07d},2024-02-21,CUST00001,ACC00001,1.00,IDR\n')
+            temp_path = f.name
+        
+        try:
+            counts = Counter()
+            for seed in range(2000):
+                counts.update(row['transaction_id'] for row in sample_csv(temp_path, 5, seed=seed))
+            
+            # Each row is expected 500 times; allow generous statistical slack
+            assert len(counts) == 20
+            assert all(400 < count < 600 for count in counts.values())
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+    
+    def test_columns_and_types(self):
+        """Test projection and typed parsing of sampled rows."""
+        rows = sample_csv(self.SAMPLE_PATH, 5, seed=3, columns=['transaction_id', 'amount'], typed=True)
+        
+        assert all(set(row) == {'transaction_id', 'amount'} for row in rows)
+        assert all(isinstance(row['amount'], float) for row in rows)
+    
+    def test_bad_rows_raise(self, temp_csv_file):
+        """Test row checks still apply while sampling."""
+        with open(temp_csv_file, 'a', newline='') as f:
+            f.write(',,,,,,,,,,,,,,\n')
+        
+        with pytest.raises(CSVEmptyRowError):
+            sample_csv(temp_csv_file, 1, seed=0)
+    
+    def test_negative_n(self):
+        """Test ValueError for negative n."""
+        with pytest.raises(ValueError):
+            sample_csv(self.SAMPLE_PATH, -1)
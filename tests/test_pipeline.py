@@ -0,0 +1,183 @@
+"""Tests for checkpointed pipeline module."""
+
+import json
+import pytest
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import etl.pipeline
+from etl.pipeline import (
+    run_pipeline,
+    run_pipeline_many,
+    load_checkpoint,
+    load_many,
+    process_file,
+    process_transaction
+)
+
+SAMPLE_CSV = 'data/banking_transactions.csv'
+
+
+class SimulatedCrash(BaseException):
+    """Raised to simulate the process dying mid-run."""
+
+
+class TestRunPipeline:
+    """Test cases for run_pipeline function."""
+    
+    @pytest.fixture
+    def workdir(self):
+        """Create a temporary working directory."""
+        with tempfile.TemporaryDirectory() as directory:
+            yield Path(directory)
+    
+    def test_full_run(self, workdir):
+        """Test a run writes one output line per successful row."""
+        output = workdir / 'out.jsonl'
+        
+        counters = run_pipeline(SAMPLE_CSV, str(output), checkpoint_every=1000)
+        
+        lines = output.read_text().splitlines()
+        assert counters['rows_read'] == 5000
+        assert counters['successful'] + counters['failed'] == 5000
+        assert len(lines) == counters['successful']
+        assert json.loads(lines[0])['transaction_id'] == 'TXN0000001'
+    
+    def test_checkpoint_contents(self, workdir):
+        """Test the final checkpoint records positions and counters."""
+        output = workdir / 'out.jsonl'
+        checkpoint_path = workdir / 'run.ckpt'
+        
+        counters = run_pipeline(
+            SAMPLE_CSV, str(output), checkpoint_path=str(checkpoint_path)
+        )
+        checkpoint = load_checkpoint(str(checkpoint_path))
+        
+        assert checkpoint['completed'] is True
+        assert checkpoint['row_num'] == 5001
+        assert checkpoint['input_offset'] == Path(SAMPLE_CSV).stat().st_size
+        assert checkpoint['output_offset'] == output.stat().st_size
+        assert checkpoint['counters'] == counters
+    
+    def test_resume_after_crash_matches_clean_run(self, workdir):
+        """Test resuming after a crash neither skips nor duplicates output."""
+        clean_output = workdir / 'clean.jsonl'
+        clean_counters = run_pipeline(SAMPLE_CSV, str(clean_output))
+        
+        output = workdir / 'out.jsonl'
+        calls = {'count': 0}
+        
+        def crashing(transaction):
+            calls['count'] += 1
+            if calls['count'] == 2750:
+                raise SimulatedCrash()
+            return process_transaction(transaction)
+        
+        with patch.object(etl.pipeline, 'process_transaction', crashing):
+            with pytest.raises(SimulatedCrash):
+                run_pipeline(SAMPLE_CSV, str(output), checkpoint_every=1000)
+        
+        counters = run_pipeline(SAMPLE_CSV, str(output), checkpoint_every=1000, resume=True)
+        
+        assert counters == clean_counters
+        assert output.read_text() == clean_output.read_text()
+    
+    def test_resume_completed_run_is_noop(self, workdir):
+        """Test resuming a completed run does not reprocess anything."""
+        output = workdir / 'out.jsonl'
+        counters = run_pipeline(SAMPLE_CSV, str(output))
+        size = output.stat().st_size
+        
+        with patch.object(etl.pipeline, 'process_transaction') as mock_process:
+            assert run_pipeline(SAMPLE_CSV, str(output), resume=True) == counters
+        
+        mock_process.assert_not_called()
+        assert output.stat().st_size == size
+    
+    def test_resume_rejects_replaced_input(self, workdir):
+        """Test ValueError when the input at the checkpointed path changed."""
+        csv_path = workdir / 'in.csv'
+        output = workdir / 'out.jsonl'
+        lines = Path(SAMPLE_CSV).read_bytes().splitlines(keepends=True)
+        csv_path.write_bytes(b''.join(lines[:2001]))
+        run_pipeline(str(csv_path), str(output))
+        
+        replacement = workdir / 'new.csv'
+        replacement.write_bytes(b''.join(lines[:1]) + b''.join(lines[2001:]))
+        replacement.replace(csv_path)
+        
+        with pytest.raises(ValueError, match='changed'):
+            run_pipeline(str(csv_path), str(output), resume=True)
+    
+    def test_resume_without_checkpoint_starts_fresh(self, workdir):
+        """Test resume=True with no checkpoint runs from the start."""
+        output = workdir / 'out.jsonl'
+        
+        counters = run_pipeline(SAMPLE_CSV, str(output), resume=True)
+        
+        assert counters['rows_read'] == 5000
+    
+    def test_invalid_checkpoint_every(self, workdir):
+        """Test ValueError for non-positive checkpoint_every."""
+        with pytest.raises(ValueError):
+            run_pipeline(SAMPLE_CSV, str(workdir / 'out.jsonl'), checkpoint_every=0)
+
+
+class TestLoadMany:
+    """Test cases for load_many and run_pipeline_many functions."""
+    
+    @pytest.fixture
+    def branch_files(self):
+        """Split the sample data into three per-branch CSV files."""
+        lines = Path(SAMPLE_CSV).read_text().splitlines(keepends=True)
+        header, rows = lines[0], lines[1:]
+        with tempfile.TemporaryDirectory() as directory:
+            paths = []
+            for i in range(3):
+                path = Path(directory) / f"branch_{i}.csv"
+                path.write_text(header + ''.join(rows[i::3]))
+                paths.append(str(path))
+            yield paths
+    
+    def test_results_match_serial_processing(self, branch_files):
+        """Test parallel results equal processing each file in-process."""
+        results = load_many(branch_files, workers=2)
+        
+        assert [result.path for result in results] == branch_files
+        for result in results:
+            expected = process_file(result.path)
+            assert result.counters == expected.counters
+            assert result.rows == expected.rows
+            assert result.error is None
+        assert sum(result.counters['rows_read'] for result in results) == 5000
+    
+    def test_summaries_only(self, branch_files):
+        """Test keep_rows=False returns counters without rows."""
+        results = load_many(branch_files, workers=2, keep_rows=False)
+        
+        assert all(result.rows is None for result in results)
+        assert sum(result.counters['successful'] for result in results) > 0
+    
+    def test_bad_file_does_not_stop_others(self, branch_files):
+        """Test an unreadable file is reported while others are processed."""
+        results = load_many(branch_files[:1] + ['/non/existent/file.csv'], workers=2)
+        
+        assert results[0].error is None
+        assert results[1].error.startswith('CSVFileNotFoundError')
+    
+    def test_run_pipeline_many(self, branch_files):
+        """Test each file gets its own output with one line per successful row."""
+        with tempfile.TemporaryDirectory() as out_dir:
+            summary = run_pipeline_many(branch_files, out_dir, workers=2)
+            
+            for path, counters in summary.items():
+                output = Path(out_dir) / f"{Path(path).name}.jsonl"
+                assert len(output.read_text().splitlines()) == counters['successful']
+            assert sum(c['rows_read'] for c in summary.values()) == 5000
+    
+    def test_run_pipeline_many_rejects_name_clash(self, branch_files):
+        """Test ValueError when two inputs would write the same output."""
+        with tempfile.TemporaryDirectory() as out_dir:
+            with pytest.raises(ValueError):
+                run_pipeline_many([branch_files[0], branch_files[0]], out_dir)
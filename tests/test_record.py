@@ -0,0 +1,86 @@
+"""Tests for Transaction record type."""
+
+import pytest
+
+from etl.record import Transaction, CSV_FIELDS, TRANSACTION_FIELDS
+
+
+class TestTransaction:
+    """Test cases for Transaction record."""
+    
+    def test_dict_like_access(self):
+        """Test item access, get and containment."""
+        record = Transaction(transaction_id='TXN0000001', amount='5000.50')
+        
+        assert record['transaction_id'] == 'TXN0000001'
+        assert record.amount == '5000.50'
+        assert record.get('currency') is None
+        assert record.get('currency', 'IDR') == 'IDR'
+        assert 'amount' in record
+        assert 'currency' not in record
+    
+    def test_missing_field_raises_key_error(self):
+        """Test unset fields behave like missing dict keys."""
+        record = Transaction()
+        
+        with pytest.raises(KeyError):
+            record['amount']
+    
+    def test_no_instance_dict(self):
+        """Test records use slots instead of a per-instance dict."""
+        record = Transaction(transaction_id='TXN0000001')
+        
+        assert not hasattr(record, '__dict__')
+    
+    def test_unknown_columns_kept(self):
+        """Test columns outside the known fields are preserved."""
+        record = Transaction(transaction_id='TXN0000001', branch_code='B01')
+        
+        assert record['branch_code'] == 'B01'
+        assert record.keys() == ['transaction_id', 'branch_code']
+    
+    def test_items_in_field_order(self):
+        """Test items follow declared field order."""
+        record = Transaction.from_items([('amount', 1.0), ('transaction_id', 'TXN0000001')])
+        
+        assert record.keys() == ['transaction_id', 'amount']
+        assert record.items() == [('transaction_id', 'TXN0000001'), ('amount', 1.0)]
+        assert set(record.keys()) <= set(TRANSACTION_FIELDS)
+    
+    def test_from_values_fills_csv_fields_in_order(self):
+        """Test the positional constructor assigns values in CSV_FIELDS order."""
+        values = [f'value_{index}' for index in range(len(CSV_FIELDS))]
+        record = Transaction.from_values(values)
+        
+        assert record.items() == list(zip(CSV_FIELDS, values))
+        assert record == Transaction.from_items(zip(CSV_FIELDS, values))
+    
+    def test_from_values_wrong_length(self):
+        """Test ValueError when values do not match the CSV columns."""
+        with pytest.raises(ValueError):
+            Transaction.from_values(['TXN0000001'])
+    
+    def test_copy_is_independent(self):
+        """Test copy returns a separate record."""
+        record = Transaction(transaction_id='TXN0000001')
+        copied = record.copy()
+        copied['transaction_id'] = 'TXN0000002'
+        
+        assert isinstance(copied, Transaction)
+        assert record['transaction_id'] == 'TXN0000001'
+    
+    def test_equality_with_dict(self):
+        """Test records compare equal to dicts with the same items."""
+        record = Transaction(transaction_id='TXN0000001', amount='1')
+        
+        assert record == {'transaction_id': 'TXN0000001', 'amount': '1'}
+        assert record.to_dict() == {'transaction_id': 'TXN0000001', 'amount': '1'}
+    
+    def test_delete_field(self):
+        """Test deleting a field unsets it."""
+        record = Transaction(transaction_id='TXN0000001', amount='1')
+        del record['amount']
+        
+        assert 'amount' not in record
+        with pytest.raises(KeyError):
+            del record['amount']
@@ -0,0 +1,117 @@
+"""Tests for compiled validation rules module."""
+
+import json
+import pytest
+import tempfile
+from pathlib import Path
+
+from etl.loader import load_csv
+from etl.rules import DEFAULT_RULES, compile_rules, load_rules
+from etl.validator import validate_batch, STATUS_FIELDS
+
+
+class TestCompileRules:
+    """Test cases for compile_rules and load_rules functions."""
+    
+    def test_default_rules_match_validate_batch(self):
+        """Test the default rule set reproduces the built-in checks."""
+        for typed in (False, True):
+            expected = validate_batch(load_csv('data/banking_transactions.csv', typed=typed))
+            result = validate_batch(
+                load_csv('data/banking_transactions.csv', typed=typed), rules=DEFAULT_RULES
+            )
+            
+            assert result.statuses == expected.statuses
+            assert result.valid == expected.valid
+        assert DEFAULT_RULES.fields == STATUS_FIELDS
+    
+    def test_single_generated_function(self):
+        """Test all rules are inlined into one function."""
+        assert DEFAULT_RULES.source.count('def ') == 1
+        assert DEFAULT_RULES.validate.__name__ == 'validate'
+    
+    def test_custom_rules(self):
+        """Test a product-specific rule set with its own codes and flags."""
+        rules = compile_rules({
+            'name': 'cards',
+            'rules': [
+                {'field': 'account_id', 'check': 'pattern', 'pattern': r'^CARD\d{4}$'},
+                {'field': 'currency', 'check': 'one_of', 'values': ['EUR'], 'case_sensitive': True},
+                {'field': 'amount', 'check': 'number', 'min': 1, 'max': 5000},
+            ],
+            'flags': [{'name': 'is_large', 'field': 'amount', 'greater_than': 1000}],
+        })
+        
+        row = {'account_id': 'CARD0001', 'currency': 'EUR', 'amount': '2000'}
+        assert rules.validate(row) == 0
+        assert row['is_large'] is True
+        
+        assert rules.validate({'account_id': 'ACC0001'}) == 1
+        assert rules.validate({'account_id': 'CARD0001', 'currency': 'eur'}) == 2
+        assert rules.validate({'account_id': 'CARD0001', 'currency': 'EUR', 'amount': 9000}) == 3
+        assert rules.fields == {1: 'account_id', 2: 'currency', 3: 'amount'}
+    
+    def test_warn_rules_do_not_reject(self, caplog):
+        """Test default direction and account type checks only warn, as validate_transaction does."""
+        row = {
+            'transaction_id': 'TXN0000001', 'transaction_date': '2024-02-21',
+            'amount': '10.00', 'currency': 'IDR', 'direction': 'SIDEWAYS', 'account_type': '',
+        }
+        
+        with caplog.at_level('WARNING', logger='etl.rules'):
+            assert DEFAULT_RULES.validate(row) == 0
+        
+        assert row['amount_anomaly'] is False
+        assert [record.getMessage() for record in caplog.records] == ['Invalid direction: SIDEWAYS']
+    
+    def test_warn_rule_flag(self):
+        """Test a warn rule with a flag records whether its check held."""
+        rules = compile_rules({
+            'rules': [
+                {'field': 'amount', 'check': 'number', 'min': 0},
+                {'field': 'channel', 'check': 'one_of', 'values': ['ATM', 'POS'],
+                 'severity': 'warn', 'flag': 'channel_valid'},
+            ],
+        })
+        
+        good, odd = {'amount': '1', 'channel': 'pos'}, {'amount': '1', 'channel': 'FAX'}
+        assert rules.validate(good) == 0 and good['channel_valid'] is True
+        assert rules.validate(odd) == 0 and odd['channel_valid'] is False
+        assert rules.validate({'amount': '-1', 'channel': 'FAX'}) == 1
+        assert rules.fields == {1: 'amount'}
+    
+    def test_load_rules_from_json(self):
+        """Test a JSON rule specification is compiled."""
+        spec = {
+            'name': 'json',
+            'rules': [{'field': 'transaction_date', 'check': 'date'}],
+        }
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump(spec, f)
+            temp_path = f.name
+        
+        try:
+            rules = load_rules(temp_path)
+            assert rules.name == 'json'
+            assert rules.validate({'transaction_date': '21/02/2024'}) == 0
+            assert rules.validate({'transaction_date': '2024-02-30'}) == 1
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+    
+    @pytest.mark.parametrize('spec', [
+        {},
+        {'rules': []},
+        {'rules': [{'field': 'amount'}]},
+        {'rules': [{'field': 'amount', 'check': 'unknown'}]},
+        {'rules': [{'field': 'currency', 'check': 'one_of'}]},
+        {
+            'rules': [{'field': 'currency', 'check': 'one_of', 'values': ['IDR']}],
+            'flags': [{'name': 'big', 'field': 'amount', 'greater_than': 1}],
+        },
+        {'rules': [{'field': 'amount', 'check': 'number', 'severity': 'fatal'}]},
+        {'rules': [{'check': 'date', 'severity': 'warn'}]},
+    ])
+    def test_invalid_specs(self, spec):
+        """Test malformed specifications raise ValueError."""
+        with pytest.raises(ValueError):
+            compile_rules(spec)
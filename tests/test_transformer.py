@@ -25,6 +25,10 @@ class TestConvertDateToDateObject:
         assert isinstance(result, date)
         assert result == date(2024, 2, 21)
     
+    def test_convert_ddmmyyyy_date(self):
+        """Test converting a DD/MM/YYYY date."""
+        assert convert_date_to_date_object('21/02/2024') == date(2024, 2, 21)
+    
     def test_convert_invalid_date(self):
         """Test converting invalid date."""
         result = convert_date_to_date_object('invalid')
@@ -34,6 +38,11 @@ class TestConvertDateToDateObject:
         """Test converting empty date."""
         result = convert_date_to_date_object('')
         assert result is None
+    
+    def test_convert_parsed_date(self):
+        """Test already parsed dates are returned as date objects."""
+        assert convert_date_to_date_object(date(2024, 2, 21)) == date(2024, 2, 21)
+        assert convert_date_to_date_object(datetime(2024, 2, 21, 10, 30)) == date(2024, 2, 21)
 
 
 class TestConvertAmountToFloat:
@@ -1,14 +1,23 @@
 """Tests for transaction validator module."""
 
 import pytest
-from datetime import datetime
+from array import array
+from datetime import date, datetime
 
+from etl.loader import load_csv
 from etl.validator import (
     validate_transaction_id,
     validate_date,
     validate_amount,
     validate_currency,
     validate_transaction,
+    validate_batch,
+    STATUS_OK,
+    STATUS_INVALID_TRANSACTION_ID,
+    STATUS_INVALID_DATE,
+    STATUS_INVALID_AMOUNT,
+    STATUS_INVALID_CURRENCY,
+    STATUS_FIELDS,
     InvalidTransactionIDError,
     InvalidDateFormatError,
     InvalidCurrencyError,
@@ -72,6 +81,10 @@ class TestValidateDate:
         """Test empty date."""
         with pytest.raises(InvalidDateFormatError):
             validate_date('')
+    
+    def test_parsed_date_object(self):
+        """Test date objects from a typed load are valid."""
+        assert validate_date(date(2024, 2, 21)) is True
 
 
 class TestValidateAmount:
@@ -105,6 +118,11 @@ class TestValidateAmount:
         """Test non-numeric amount."""
         with pytest.raises(InvalidAmountError):
             validate_amount('abc')
+    
+    def test_parsed_negative_float(self):
+        """Test negative floats from a typed load are still rejected."""
+        with pytest.raises(InvalidAmountError):
+            validate_amount(-1.5)
 
 
 class TestValidateCurrency:
@@ -174,3 +192,80 @@ class TestValidateTransaction:
         result = validate_transaction(valid_transaction)
         
         assert result['amount_anomaly'] is False
+
+
+class TestValidateBatch:
+    """Test cases for batch validation."""
+    
+    def _row(self, **overrides):
+        """Build a valid transaction with optional field overrides."""
+        row = {
+            'transaction_id': 'TXN0000001',
+            'transaction_date': '2024-02-21',
+            'amount': '5000.50',
+            'currency': 'IDR',
+        }
+        row.update(overrides)
+        return row
+    
+    def test_status_per_row(self):
+        """Test each row gets the code of its first failing check."""
+        rows = [
+            self._row(),
+            self._row(transaction_id='BAD'),
+            self._row(transaction_date='2024-13-01'),
+            self._row(amount='-1'),
+            self._row(currency='EUR'),
+            self._row(transaction_id=None, currency='EUR'),
+        ]
+        
+        result = validate_batch(rows)
+        
+        assert result.statuses == array('B', [
+            STATUS_OK,
+            STATUS_INVALID_TRANSACTION_ID,
+            STATUS_INVALID_DATE,
+            STATUS_INVALID_AMOUNT,
+            STATUS_INVALID_CURRENCY,
+            STATUS_INVALID_TRANSACTION_ID,
+        ])
+        assert result.valid == [rows[0]]
+        assert STATUS_FIELDS[result.statuses[4]] == 'currency'
+    
+    def test_anomaly_flag_on_valid_rows(self):
+        """Test valid rows get the amount_anomaly flag."""
+        rows = [self._row(amount='20000000'), self._row(amount=1.5), self._row(amount='x')]
+        
+        result = validate_batch(rows)
+        
+        assert [row['amount_anomaly'] for row in result.valid] == [True, False]
+        assert 'amount_anomaly' not in rows[2]
+    
+    def test_matches_validate_transaction(self):
+        """Test batch statuses agree with validate_transaction on the sample data."""
+        exception_status = {
+            InvalidTransactionIDError: STATUS_INVALID_TRANSACTION_ID,
+            InvalidDateFormatError: STATUS_INVALID_DATE,
+            InvalidAmountError: STATUS_INVALID_AMOUNT,
+            InvalidCurrencyError: STATUS_INVALID_CURRENCY,
+        }
+        
+        for typed in (False, True):
+            expected = []
+            for row in load_csv('data/banking_transactions.csv', typed=typed):
+                try:
+                    validate_transaction(row)
+                    expected.append(STATUS_OK)
+                except tuple(exception_status) as e:
+                    expected.append(exception_status[type(e)])
+            
+            result = validate_batch(load_csv('data/banking_transactions.csv', typed=typed))
+            assert list(result.statuses) == expected
+            assert len(result.valid) == expected.count(STATUS_OK)
+    
+    def test_empty_batch(self):
+        """Test an empty batch."""
+        result = validate_batch([])
+        
+        assert len(result.statuses) == 0
+        assert result.valid == []
@@ -0,0 +1,112 @@
+"""Tests for vectorized columnar validation module."""
+
+import pytest
+from array import array
+
+np = pytest.importorskip('numpy')
+
+from etl.loader import CategoricalColumn, load_csv, load_csv_columnar
+from etl.validator import (
+    validate_batch,
+    STATUS_OK,
+    STATUS_INVALID_TRANSACTION_ID,
+    STATUS_INVALID_DATE,
+    STATUS_INVALID_AMOUNT,
+    STATUS_INVALID_CURRENCY
+)
+from etl.vectorized import (
+    validate_columns,
+    transaction_id_mask,
+    date_mask,
+    membership_mask
+)
+
+
+class TestMasks:
+    """Test cases for the column mask functions."""
+    
+    def test_transaction_id_mask(self):
+        """Test the TXN + 7 digits pattern over a column."""
+        ids = ['TXN0000001', ' TXN1234567 ', 'TXN123456', 'TXN12345678', 'txn0000001', '', None]
+        
+        assert transaction_id_mask(ids).tolist() == [True, True, False, False, False, False, False]
+    
+    def test_date_mask(self):
+        """Test both formats, calendar validity and unpadded dates."""
+        dates = [
+            '2024-02-21', '21/02/2024', '2024-02-29', '2023-02-29',
+            '2024-13-01', '31/04/2024', '2024/02/21', '2024-2-1', '', None,
+        ]
+        
+        assert date_mask(dates).tolist() == [
+            True, True, True, False, False, False, False, True, False, False,
+        ]
+    
+    def test_membership_mask_categorical(self):
+        """Test categories are checked case-insensitively by code."""
+        column = CategoricalColumn(array('i', [0, 1, 2, 0, 3]), ['IDR', 'usd ', 'EUR', ''])
+        
+        assert membership_mask(column, {'IDR', 'USD'}).tolist() == [True, True, False, True, False]
+        assert membership_mask(column, {'IDR', 'USD'}, allow_empty=True).tolist()[4] is True
+    
+    def test_membership_mask_list(self):
+        """Test plain string columns are accepted too."""
+        assert membership_mask(['DEBIT', 'x', None], {'DEBIT'}).tolist() == [True, False, False]
+
+
+class TestValidateColumns:
+    """Test cases for validate_columns function."""
+    
+    def test_status_codes(self):
+        """Test each row gets the code of its first failing check."""
+        columns = {
+            'transaction_id': ['TXN0000001', 'BAD', 'TXN0000003', 'TXN0000004', 'TXN0000005'],
+            'transaction_date': ['2024-02-21', 'bad', '2024-02-30', '2024-02-21', '2024-02-21'],
+            'amount': array('d', [20_000_000.0, 1.0, 1.0, -5.0, 1.0]),
+            'currency': ['IDR', 'EUR', 'IDR', 'IDR', 'EUR'],
+        }
+        
+        result = validate_columns(columns)
+        
+        assert result.statuses.tolist() == [
+            STATUS_OK,
+            STATUS_INVALID_TRANSACTION_ID,
+            STATUS_INVALID_DATE,
+            STATUS_INVALID_AMOUNT,
+            STATUS_INVALID_CURRENCY,
+        ]
+        assert result.valid.tolist() == [True, False, False, False, False]
+        assert result.amount_anomaly.tolist() == [True, False, False, False, False]
+    
+    def test_matches_validate_batch(self):
+        """Test columnar results agree with row-wise validation on the sample data."""
+        path = 'data/banking_transactions.csv'
+        
+        result = validate_columns(load_csv_columnar(path))
+        batch = validate_batch(load_csv(path))
+        
+        assert result.statuses.tolist() == list(batch.statuses)
+        assert int(result.valid.sum()) == len(batch.valid)
+        assert result.amount_anomaly[result.valid].tolist() == [
+            row['amount_anomaly'] for row in batch.valid
+        ]
+    
+    def test_optional_checks(self):
+        """Test direction and account type masks allow empty values."""
+        columns = load_csv_columnar('data/banking_transactions.csv')
+        
+        result = validate_columns(columns)
+        
+        assert len(result.direction_valid) == len(result.statuses)
+        assert result.account_type_valid.dtype == bool
+    
+    def test_empty_batch(self):
+        """Test an empty batch."""
+        columns = {
+            'transaction_id': [], 'transaction_date': [],
+            'amount': array('d'), 'currency': CategoricalColumn(array('i'), []),
+        }
+        
+        result = validate_columns(columns)
+        
+        assert len(result.statuses) == 0